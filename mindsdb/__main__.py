@@ -146,9 +146,10 @@ if __name__ == '__main__':
     if args.install_handlers is not None:
         handlers_list = [s.strip() for s in args.install_handlers.split(',')]
         # import_meta = handler_meta.get('import', {})
-        for handler_name, handler_meta in integration_controller.get_handlers_import_status().items():
+        for handler_name in integration_controller.get_handlers_metadata():
             if handler_name not in handlers_list:
                 continue
+            handler_meta = integration_controller.get_handler_meta(handler_name)
             import_meta = handler_meta.get('import', {})
             if import_meta.get('success') is True:
                 print(f"{'{0: <18}'.format(handler_name)} - already installed")
@@ -164,17 +165,9 @@ if __name__ == '__main__':
     print(f'Configuration file:\n   {config.config_path}')
     print(f"Storage path:\n   {config['paths']['root']}")
 
-    # @TODO Backwards compatibility for tests, remove later
-    for handler_name, handler_meta in integration_controller.get_handlers_import_status().items():
-        import_meta = handler_meta.get('import', {})
-        dependencies = import_meta.get('dependencies')
-        if import_meta.get('success', False) is not True:
-            print(f"Dependencies for the handler '{handler_name}' are not installed by default.\n",
-                  f'If you want to use "{handler_name}" please install "{dependencies}"')
-
     if not is_cloud:
         # region creating permanent integrations
-        for integration_name, handler in integration_controller.get_handlers_import_status().items():
+        for integration_name, handler in integration_controller.get_handlers_metadata().items():
             if handler.get('permanent'):
                 integration_meta = integration_controller.get(name=integration_name)
                 if integration_meta is None:
@@ -23,6 +23,22 @@ class FilesList(Resource):
         return ca.file_controller.get_files()
 
 
+@ns_conf.route('/<name>/progress')
+@ns_conf.param('name', "MindsDB's name for file")
+class FileProgress(Resource):
+    @ns_conf.doc('get_file_progress')
+    def get(self, name: str):
+        '''Progress of processing of the file which is being uploaded'''
+        progress = ca.file_controller.get_upload_progress(name)
+        if progress is None:
+            return http_error(
+                404,
+                "File not found",
+                f"File with name '{name}' is not being uploaded"
+            )
+        return progress
+
+
 @ns_conf.route('/<name>')
 @ns_conf.param('name', "MindsDB's name for file")
 class File(Resource):
@@ -31,7 +31,7 @@ class HandlerIcon(Resource):
     @ns_conf.param('handler_name', 'Handler name')
     def get(self, handler_name):
         try:
-            handlers_import_status = ca.integration_controller.get_handlers_import_status()
+            handlers_import_status = ca.integration_controller.get_handlers_metadata()
             icon_name = handlers_import_status[handler_name]['icon']['name']
             handler_folder = handlers_import_status[handler_name]['import']['folder']
             mindsdb_path = Path(importlib.util.find_spec('mindsdb').origin).parent
@@ -48,15 +48,13 @@ class HandlerIcon(Resource):
 class InstallDependencies(Resource):
     @ns_conf.param('handler_name', 'Handler name')
     def post(self, handler_name):
-        handler_import_status = ca.integration_controller.get_handlers_import_status()
-        if handler_name not in handler_import_status:
+        handler_meta = ca.integration_controller.get_handler_meta(handler_name)
+        if handler_meta is None:
             return f'Unkown handler: {handler_name}', 400
 
-        if handler_import_status[handler_name].get('import', {}).get('success', False) is True:
+        if handler_meta.get('import', {}).get('success', False) is True:
             return 'Installed', 200
 
-        handler_meta = handler_import_status[handler_name]
-
         dependencies = handler_meta['import']['dependencies']
         if len(dependencies) == 0:
             return 'Installed', 200
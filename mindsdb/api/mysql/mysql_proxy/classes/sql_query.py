@@ -10,13 +10,13 @@
 """
 import copy
 import re
-import hashlib
 import datetime as dt
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import dateinfer
-import duckdb
-import pandas as pd
 import numpy as np
+import pandas as pd
 
 from mindsdb_sql import parse_sql
 from mindsdb_sql.parser.ast import (
@@ -33,6 +33,7 @@ from mindsdb_sql.parser.ast import (
     Delete,
     Latest,
     BetweenOperation,
+    Tuple,
 )
 from mindsdb_sql.planner.steps import (
     ApplyTimeseriesPredictorStep,
@@ -61,11 +62,14 @@ from mindsdb_sql.planner import query_planner
 from mindsdb_sql.planner.utils import query_traversal
 from mindsdb_sql.parser.ast.base import ASTNode
 
-from mindsdb.api.mysql.mysql_proxy.utilities.sql import query_df
-from mindsdb.interfaces.model.functions import (
-    get_model_records,
-    get_predictor_project
+from mindsdb.api.mysql.mysql_proxy.utilities.sql import query_df, execute_duckdb
+from mindsdb.api.mysql.mysql_proxy.utilities.query_cache import (
+    plan_cache,
+    step_cache,
+    get_integration_ttl,
+    invalidate_query_cache
 )
+from mindsdb.interfaces.database.metadata_catalog import metadata_catalog
 from mindsdb.api.mysql.mysql_proxy.utilities import (
     SqlApiException,
     ErKeyColumnDoesNotExist,
@@ -75,10 +79,22 @@ from mindsdb.api.mysql.mysql_proxy.utilities import (
     ErSqlWrongArguments
 )
 from mindsdb.utilities.cache import get_cache, json_checksum
+from mindsdb.utilities.config import Config
+from mindsdb.utilities.context import context as ctx
+from mindsdb.interfaces.storage import db
 
 
 superset_subquery = re.compile(r'from[\s\n]*(\(.*\))[\s\n]*as[\s\n]*virtual_table', flags=re.IGNORECASE | re.MULTILINE | re.S)
 
+# max count of rows of input data combined in one UPDATE query
+UPDATE_BATCH_SIZE = 500
+
+# result of query can be cached only if it consists of these steps
+CACHEABLE_STEPS = (
+    FetchDataframeStep, UnionStep, MapReduceStep, MultipleSteps, JoinStep, FilterStep,
+    LimitOffsetStep, ProjectStep, GroupByStep, SubSelectStep
+)
+
 
 def get_preditor_alias(step, mindsdb_database):
     predictor_name = '.'.join(step.predictor.parts)
@@ -171,14 +187,235 @@ def replaceQueryVar(where, var_value, var_name):
             where.value = var_value
 
 
+def get_var_name(node):
+    # name of variable if node is $var[...] constant
+    if isinstance(node, Constant) and isinstance(node.value, str):
+        if node.value.startswith('$var[') and node.value.endswith(']'):
+            return node.value[5:-1]
+    return None
+
+
+# alias of column which is added to batch query to split its result by values of variable
+BATCH_KEY_COLUMN = '__mindsdb_batch_key'
+
+
+def _get_conjuncts(node):
+    if isinstance(node, BinaryOperation) and node.op.lower() == 'and':
+        return _get_conjuncts(node.args[0]) + _get_conjuncts(node.args[1])
+    return [node]
+
+
+def get_batch_query(query, var_groups):
+    """ Rewrite query with $var[...] placeholder to one query which fetches rows for all var_groups.
+        Variable has to be used once, as 'col = $var[x]' condition joined to the rest of 'where' by 'and':
+        it is replaced with 'col in (value1, value2, ...)' and the column is added to the targets
+        with BATCH_KEY_COLUMN alias, to split result by values with split_batch_result.
+
+        Returns:
+            (query, var name) or None if the query can't be batched
+                (result differs from concatenated results of queries for every var group)
+    """
+    if (
+        query.limit is not None
+        or query.offset is not None
+        or query.group_by is not None
+        or query.having is not None
+        or query.distinct
+        or query.order_by is not None
+        or query.where is None
+    ):
+        return None
+    for target in query.targets:
+        if not isinstance(target, (Star, Identifier)):
+            return None
+
+    var_names = []
+
+    def find_vars(node, **kwargs):
+        var_name = get_var_name(node)
+        if var_name is not None:
+            var_names.append(var_name)
+
+    query_traversal(query.where, find_vars)
+    if len(var_names) != 1:
+        return None
+    var_name = var_names[0]
+
+    query = copy.deepcopy(query)
+
+    # condition with the variable has to be one of conditions joined by 'and'
+    equality = None
+    for node in _get_conjuncts(query.where):
+        if (
+            isinstance(node, BinaryOperation) and node.op == '='
+            and isinstance(node.args[0], Identifier) and get_var_name(node.args[1]) == var_name
+        ):
+            equality = node
+    if equality is None:
+        return None
+
+    values = []
+    for var_group in var_groups:
+        value = var_group[var_name]
+        if value not in values:
+            values.append(value)
+
+    key_column = copy.deepcopy(equality.args[0])
+    key_column.alias = Identifier(BATCH_KEY_COLUMN)
+
+    equality.op = 'in'
+    equality.args = [equality.args[0], Tuple([Constant(value) for value in values])]
+
+    query.targets.append(key_column)
+    return query, var_name
+
+
+def split_batch_result(data, var_name, var_groups):
+    """ Splits result of the query from get_batch_query to results for every var group:
+        rows are ordered as in concatenated results of queries for every var group,
+        rows are repeated for repeated values of variable. BATCH_KEY_COLUMN is removed.
+
+        Returns:
+            ResultSet or None if not all rows can be matched to values of variable
+    """
+    key_columns = data.find_columns(alias=BATCH_KEY_COLUMN)
+    if len(key_columns) != 1:
+        return None
+    keys = data.get_raw_df()[data._locate_column(key_columns[0])]
+    data.del_column(key_columns[0])
+    df = data.get_raw_df()
+
+    masks = []
+    try:
+        for var_group in var_groups:
+            masks.append((keys == var_group[var_name]).fillna(False).values.astype(bool))
+    except (TypeError, ValueError):
+        return None
+
+    matched = np.zeros(len(df), dtype=bool)
+    for mask in masks:
+        matched |= mask
+    if not matched.all():
+        return None
+
+    result = ResultSet()
+    for col in data.columns:
+        result.add_column(col)
+    if len(masks) > 0:
+        result.add_raw_df(pd.concat([df[mask] for mask in masks], ignore_index=True))
+    return result
+
+
+def get_map_reduce_config(integration_name):
+    """ Settings of MapReduceStep execution. Default values can be overridden in config,
+        also for specific integration:
+
+            "map_reduce": {
+                "batch_size": 100,
+                "max_workers": 1,
+                "integrations": {
+                    "my_db": {"batch_size": 1000, "max_workers": 4}
+                }
+            }
+
+        batch_size - count of variables values in one query to integration, 1 to disable batching
+        max_workers - count of parallel queries to integration if batching is not possible,
+            1 (default) to run them serially. Every worker gets its own handler of integration
+    """
+    config = Config().get('map_reduce', {})
+    map_reduce_config = {
+        'batch_size': config.get('batch_size', 100),
+        'max_workers': config.get('max_workers', 1)
+    }
+    integrations_config = config.get('integrations', {})
+    map_reduce_config.update(integrations_config.get(integration_name, {}))
+    return map_reduce_config
+
+
+def run_parallel(fnc, args_list, max_workers):
+    """ Call fnc for every item of args_list in a thread pool.
+        Context of the current thread is passed to workers.
+
+        Returns:
+            list of results in order of args_list
+    """
+    if max_workers <= 1 or len(args_list) <= 1:
+        return [fnc(args) for args in args_list]
+
+    ctx_dump = ctx.dump()
+
+    def worker(args):
+        ctx.load(ctx_dump)
+        try:
+            return fnc(args)
+        finally:
+            db.session.remove()
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(args_list))) as executor:
+        return list(executor.map(worker, args_list))
+
+
+def concat_query_data(results):
+    data = ResultSet()
+    results = [x for x in results if len(x.columns) > 0]
+    if len(results) == 0:
+        return data
+    data = results[0]
+    if len(results) > 1:
+        data.add_raw_df(pd.concat(
+            [x.get_raw_df() for x in results[1:]],
+            ignore_index=True
+        ))
+    return data
+
+
 def join_query_data(target, source):
     if len(target.columns) == 0:
         target = source
     else:
-        target.add_records(source.get_records())
+        target.add_raw_df(source.get_raw_df())
     return target
 
 
+def _hashable_df(df):
+    # cells with lists or dicts can't be hashed, they are compared by string representation
+    columns = {}
+    for col, dtype in df.dtypes.items():
+        if dtype == object:
+            try:
+                pd.util.hash_pandas_object(df[col], index=False)
+            except TypeError:
+                columns[col] = df[col].map(_hashable)
+    if len(columns) == 0:
+        return df
+    df = df.copy(deep=False)
+    for col, values in columns.items():
+        df[col] = values
+    return df
+
+
+def union_df(left_df, right_df, unique=True):
+    """ Union of two dataframes with the same count of columns.
+        Columns are matched by position, names are taken from the left dataframe.
+        Duplicated rows are found by hashing, the order of the first occurrence of rows is kept
+
+        Args:
+            left_df (pandas.DataFrame)
+            right_df (pandas.DataFrame)
+            unique (bool): remove duplicated rows from result (no 'ALL' modifier)
+
+        Returns:
+            pandas.DataFrame
+    """
+    right_df = right_df.copy(deep=False)
+    right_df.columns = left_df.columns
+
+    df = pd.concat([left_df, right_df], ignore_index=True)
+    if unique:
+        df = df[~_hashable_df(df).duplicated().values]
+    return df
+
+
 def is_empty_prediction_row(predictor_value):
     "Define empty rows in predictor after JOIN"
     for key in predictor_value:
@@ -187,6 +424,131 @@ def is_empty_prediction_row(predictor_value):
     return True
 
 
+def _hashable(value):
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return str(value)
+
+
+def _join_conditions(op, conditions):
+    # balanced tree of operations: depth is log(n), recursive rendering doesn't hit the limit
+    while len(conditions) > 1:
+        joined = [
+            BinaryOperation(op=op, args=[conditions[i], conditions[i + 1]])
+            for i in range(0, len(conditions) - 1, 2)
+        ]
+        if len(conditions) % 2 == 1:
+            joined.append(conditions[-1])
+        conditions = joined
+    return conditions[0]
+
+
+def _get_node_ids(node):
+    ids = set()
+
+    def collect(node, **kwargs):
+        ids.add(id(node))
+
+    if node is not None:
+        query_traversal(node, collect)
+    return ids
+
+
+def make_update_batches(update_query, params_map_index, records, batch_size=UPDATE_BATCH_SIZE):
+    """ Combines updates from rows of input data into few UPDATE queries.
+
+        Rows which set the same values are applied by one query, its condition is conditions
+        of the rows joined with OR (or IN, if condition is equality of one column):
+
+            UPDATE t SET a=1 WHERE (x = 1 AND y = 2) OR (x = 3 AND y = 4)
+
+        If several rows have the same values of WHERE condition, only the last of them is applied,
+        as it would be if rows were updated one by one. Rows with different values of condition
+        are expected to match different records of the table.
+
+        Args:
+            update_query (Update): query with Constant nodes in place of fields of input data
+            params_map_index (list): [field name, Constant node] for every field of input data
+            records (list): rows of input data
+            batch_size (int): max count of rows in one query
+
+        Yields:
+            Update
+    """
+
+    def fill_params(params, row):
+        for param_name, param in params:
+            param.value = row[param_name]
+
+    if update_query.where is None:
+        # every row updates all records of the table, rows can't be combined
+        for row in records:
+            fill_params(params_map_index, row)
+            yield copy.deepcopy(update_query)
+        return
+
+    set_ids = set()
+    for value in update_query.update_columns.values():
+        set_ids |= _get_node_ids(value)
+    where_ids = _get_node_ids(update_query.where)
+    set_params = [x for x in params_map_index if id(x[1]) in set_ids]
+    where_params = [x for x in params_map_index if id(x[1]) in where_ids]
+
+    # condition is 'column = field': rows are combined with IN
+    in_column, in_param_name = None, None
+    where = update_query.where
+    if isinstance(where, BinaryOperation) and where.op == '=' and len(where_params) == 1:
+        param_name, param = where_params[0]
+        args = where.args
+        if args[1] is param and isinstance(args[0], Identifier):
+            in_column, in_param_name = args[0], param_name
+        elif args[0] is param and isinstance(args[1], Identifier):
+            in_column, in_param_name = args[1], param_name
+
+    # the last row for every value of condition
+    last_rows = OrderedDict()
+    for row in records:
+        where_key = tuple(_hashable(row[name]) for name, _ in where_params)
+        last_rows[where_key] = row
+
+    # set values -> {'row': first row, 'conditions': where values -> row}
+    groups = OrderedDict()
+    for where_key, row in last_rows.items():
+        set_key = tuple(_hashable(row[name]) for name, _ in set_params)
+        group = groups.get(set_key)
+        if group is None:
+            group = {'row': row, 'conditions': OrderedDict()}
+            groups[set_key] = group
+        group['conditions'][where_key] = row
+
+    for group in groups.values():
+        fill_params(set_params, group['row'])
+        update_columns = copy.deepcopy(update_query.update_columns)
+
+        rows = list(group['conditions'].values())
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            if in_column is not None and len(batch) > 1:
+                where = BinaryOperation(op='in', args=[
+                    copy.deepcopy(in_column),
+                    Tuple([Constant(row[in_param_name]) for row in batch])
+                ])
+            else:
+                conditions = []
+                for row in batch:
+                    fill_params(where_params, row)
+                    conditions.append(copy.deepcopy(update_query.where))
+                where = _join_conditions('or', conditions)
+
+            yield Update(
+                table=copy.deepcopy(update_query.table),
+                update_columns=update_columns,
+                where=where
+            )
+
+
 class Column:
     def __init__(self, name=None, alias=None,
                  table_name=None, table_alias=None,
@@ -216,34 +578,95 @@ class Column:
         return f'{self.__class__.__name__}({self.__dict__})'
 
 
+def _set_df_columns(df, columns):
+    # shallow copy: data blocks are shared, only the labels are replaced
+    df = df.copy(deep=False)
+    df.columns = columns
+    df.index = pd.RangeIndex(len(df))
+    return df
+
+
+def _column_values(values: list) -> np.ndarray:
+    # integers with nulls are kept as objects: in float64 they are sent to client as floats
+    #   and big values lose precision
+    if len(values) == 0:
+        return np.array([], dtype=object)
+    series = pd.Series(values)
+    if series.dtype.kind == 'f' and pd.api.types.infer_dtype(values, skipna=True) == 'integer':
+        series = pd.Series(values, dtype=object)
+    return series.values
+
+
+def _values_to_df(values: list, columns_count: int) -> pd.DataFrame:
+    # rows to dataframe with positional column labels
+    columns = list(zip(*values)) if columns_count > 0 else []
+    return pd.DataFrame(
+        {i: _column_values(list(col)) for i, col in enumerate(columns)},
+        index=pd.RangeIndex(len(values))
+    )
+
+
+def _df_to_rows(df):
+    # the only place where columnar data is converted to python rows.
+    # NaN/NaT are replaced with None here, steps don't need to do it
+    if len(df.columns) == 0:
+        return [[] for _ in range(len(df))]
+    df = df.astype(object)
+    df = df.where(pd.notna(df), None)
+    return df.values.tolist()
+
+
 class ResultSet:
     def __init__(self, length=0):
         self._columns = []
-        # records is list of lists with the same length as columns
-        self._records = []
-        for i in range(length):
-            self._records.append([])
+        # data is stored in dataframe with positional column labels: 0..len(columns)-1
+        #   names are kept in Column objects, so renaming columns doesn't touch the data
+        self._df = pd.DataFrame(index=pd.RangeIndex(length))
+        # rows added by add_record_raw, they are appended to dataframe on first access to it
+        self._raw_rows = []
 
         self.is_prediction = False
 
+    @property
+    def _df(self):
+        if len(self._raw_rows) > 0:
+            rows, self._raw_rows = self._raw_rows, []
+            # rows were checked on adding, columns could be changed after that
+            df = _values_to_df(rows, len(rows[0]))
+            if len(self._data) == 0:
+                self._data = df
+            else:
+                self._data = pd.concat([self._data, df], ignore_index=True)
+        return self._data
+
+    @_df.setter
+    def _df(self, df):
+        self._raw_rows = []
+        self._data = df
+
     def __repr__(self):
         col_names = ', '.join([col.name for col in self._columns])
-        data = '\n'.join([str(rec) for rec in self._records[:20]])
+        data = '\n'.join([str(rec) for rec in _df_to_rows(self._df.head(20))])
 
-        if len(self._records) > 20:
+        if self.length() > 20:
             data += '\n...'
 
         return f'{self.__class__.__name__}({self.length()} rows, cols: {col_names})\n {data}'
 
+    def copy(self):
+        result = ResultSet()
+        result._columns = copy.deepcopy(self._columns)
+        result._df = self._df.copy()
+        result.is_prediction = self.is_prediction
+        return result
+
     # --- converters ---
 
     def from_df(self, df, database, table_name, table_alias=None):
 
-        resp_dict = df.to_dict(orient='split')
-
-        self._records = resp_dict['data']
+        self._df = _set_df_columns(df, pd.RangeIndex(len(df.columns)))
 
-        for col in resp_dict['columns']:
+        for col in df.columns:
             self._columns.append(Column(
                 name=col,
                 table_name=table_name,
@@ -255,17 +678,15 @@ class ResultSet:
 
     def from_df_cols(self, df, col_names):
 
-        resp_dict = df.to_dict(orient='split')
-
-        self._records = resp_dict['data']
+        self._df = _set_df_columns(df, pd.RangeIndex(len(df.columns)))
 
-        for col in resp_dict['columns']:
+        for col in df.columns:
             self._columns.append(col_names[col])
         return self
 
     def to_df(self):
         columns = self.get_column_names()
-        return pd.DataFrame(self._records, columns=columns)
+        return _set_df_columns(self._df, columns)
 
     def to_df_cols(self, prefix=''):
         # returns dataframe and dict of columns
@@ -278,7 +699,7 @@ class ResultSet:
             columns.append(name)
             col_names[name] = col
 
-        return pd.DataFrame(self._records, columns=columns), col_names
+        return _set_df_columns(self._df, columns), col_names
 
     # --- tables ---
 
@@ -308,22 +729,30 @@ class ResultSet:
     def add_column(self, col, values=None):
         self._columns.append(col)
 
+        length = self.length()
         if values is None:
             values = []
-        # update records
-        if len(self._records) > 0:
-            for rec in self._records:
-                if len(values) > 0:
-                    value = values.pop(0)
-                else:
-                    value = None
-                rec.append(value)
+        if isinstance(values, pd.Series):
+            values = values.values
+        else:
+            values = list(values[:length])
+            if len(values) < length:
+                # fill the rest with nulls, keep values as is
+                values += [None] * (length - len(values))
+                values = pd.Series(values, dtype=object).values
+            else:
+                values = _column_values(values)
+
+        df = self._df.copy(deep=False)
+        df[len(self._columns) - 1] = values
+        self._df = df
 
     def del_column(self, col):
         idx = self._locate_column(col)
         self._columns.pop(idx)
-        for row in self._records:
-            row.pop(idx)
+        df = self._df.copy(deep=False)
+        del df[idx]
+        self._df = _set_df_columns(df, pd.RangeIndex(len(self._columns)))
 
     @property
     def columns(self):
@@ -351,7 +780,7 @@ class ResultSet:
         # copy with values
         idx = self._locate_column(col)
 
-        values = [row[idx] for row in self._records]
+        values = self._df[idx]
 
         col2 = copy.deepcopy(col)
 
@@ -361,24 +790,45 @@ class ResultSet:
     # --- records ---
 
     def add_records(self, data):
+        if len(data) == 0:
+            return
         names = self.get_column_names()
-        for rec in data:
-            # if len(rec) != len(self._columns):
-            #     raise ErSqlWrongArguments(f'Record length mismatch columns length: {len(rec)} != {len(self._columns)}')
+        df = pd.DataFrame(
+            {i: _column_values([rec[name] for rec in data]) for i, name in enumerate(names)},
+            index=pd.RangeIndex(len(data))
+        )
+        self.add_raw_df(df)
 
-            record = [
-                rec[name]
-                for name in names
-            ]
-            self._records.append(record)
+    def add_raw_df(self, df):
+        if len(df.columns) != len(self._columns):
+            raise ErSqlWrongArguments(f'Record length mismatch columns length: {len(df.columns)} != {len(self.columns)}')
+
+        df = _set_df_columns(df, pd.RangeIndex(len(self._columns)))
+        if self.length() == 0:
+            self._df = df
+        else:
+            self._df = pd.concat([self._df, df], ignore_index=True)
+
+    def add_raw_values(self, values):
+        # values is list of lists
+        if len(values) == 0:
+            return
+        for rec in values:
+            if len(rec) != len(self._columns):
+                raise ErSqlWrongArguments(f'Record length mismatch columns length: {len(rec)} != {len(self.columns)}')
+        self.add_raw_df(_values_to_df(values, len(self._columns)))
+
+    def get_raw_df(self):
+        # data with positional column labels
+        return self._df
 
     def get_records_raw(self):
-        return self._records
+        return _df_to_rows(self._df)
 
     def add_record_raw(self, rec):
         if len(rec) != len(self._columns):
             raise ErSqlWrongArguments(f'Record length mismatch columns length: {len(rec)} != {len(self.columns)}')
-        self._records.append(rec)
+        self._raw_rows.append(rec)
 
     @property
     def records(self):
@@ -388,7 +838,7 @@ class ResultSet:
         # in dicts
         names = self.get_column_names()
         records = []
-        for row in self._records:
+        for row in _df_to_rows(self._df):
             records.append(dict(zip(names, row)))
         return records
 
@@ -396,7 +846,7 @@ class ResultSet:
     #     self._records = []
 
     def length(self):
-        return len(self._records)
+        return len(self._df)
 
 
 class SQLQuery():
@@ -433,6 +883,10 @@ class SQLQuery():
         self.planner = None
         self.parameters = []
         self.fetched_data = None
+
+        # integrations used by query and possibility to cache its result
+        self.cache_integrations = set()
+        self.is_cacheable = True
         # self._process_query(sql)
         self.create_planner()
         if execute:
@@ -444,7 +898,7 @@ class SQLQuery():
         databases_names = [x['name'] for x in databases_names]
 
         predictor_metadata = []
-        predictors_records = get_model_records()
+        catalog = metadata_catalog.get()
 
         query_tables = []
 
@@ -458,43 +912,39 @@ class SQLQuery():
 
         query_traversal(self.query, get_all_query_tables)
 
-        for predictor_record in predictors_records:
-            model_name = predictor_record.name
-
-            if model_name not in query_tables:
-                continue
-
-            project_record = get_predictor_project(predictor_record)
-            if project_record is None:
-                continue
-            project_name = project_record.name
-
-            if isinstance(predictor_record.data, dict) and 'error' not in predictor_record.data:
-                ts_settings = predictor_record.learn_args.get('timeseries_settings', {})
-                predictor = {
-                    'name': model_name,
-                    'integration_name': project_name,   # integration_name,
-                    'timeseries': False,
-                    'id': predictor_record.id
-                }
-                if ts_settings.get('is_timeseries') is True:
-                    window = ts_settings.get('window')
-                    order_by = ts_settings.get('order_by')
-                    if isinstance(order_by, list):
-                        order_by = order_by[0]
-                    group_by = ts_settings.get('group_by')
-                    if isinstance(group_by, list) is False and group_by is not None:
-                        group_by = [group_by]
-                    predictor.update({
-                        'timeseries': True,
-                        'window': window,
-                        'horizon': ts_settings.get('horizon'),
-                        'order_by_column': order_by,
-                        'group_by_columns': group_by
-                    })
-                predictor_metadata.append(predictor)
-
-                self.model_types.update(predictor_record.data.get('dtypes', {}))
+        for model_name in dict.fromkeys(query_tables):
+            for model in catalog.models_by_name.get(model_name, []):
+                project = catalog.projects.get(model['project_id'])
+                if project is None:
+                    continue
+                project_name = project['name']
+
+                if isinstance(model['data'], dict) and 'error' not in model['data']:
+                    ts_settings = model['learn_args'].get('timeseries_settings', {})
+                    predictor = {
+                        'name': model_name,
+                        'integration_name': project_name,   # integration_name,
+                        'timeseries': False,
+                        'id': model['id']
+                    }
+                    if ts_settings.get('is_timeseries') is True:
+                        window = ts_settings.get('window')
+                        order_by = ts_settings.get('order_by')
+                        if isinstance(order_by, list):
+                            order_by = order_by[0]
+                        group_by = ts_settings.get('group_by')
+                        if isinstance(group_by, list) is False and group_by is not None:
+                            group_by = [group_by]
+                        predictor.update({
+                            'timeseries': True,
+                            'window': window,
+                            'horizon': ts_settings.get('horizon'),
+                            'order_by_column': order_by,
+                            'group_by_columns': group_by
+                        })
+                    predictor_metadata.append(predictor)
+
+                    self.model_types.update(model['data'].get('dtypes', {}))
 
         database = None if self.session.database == '' else self.session.database.lower()
 
@@ -521,12 +971,35 @@ class SQLQuery():
 
     def _fetch_dataframe_step(self, step):
         dn = self.datahub.get(step.integration)
-        query = step.query
 
         if dn is None:
             raise SqlApiUnknownError(f'Unknown integration name: {step.integration}')
 
+        try:
+            return self._fetch_from_datanode(dn, step)
+        finally:
+            dn.close()
+
+    def _fetch_from_datanode(self, dn, step):
+        query = step.query
+
+        cache_key = None
+        if query is not None and dn.type == 'integration':
+            ttl = get_integration_ttl(step.integration)
+            if ttl > 0:
+                cache_key = (ctx.company_id, self.database, step.integration.lower(), str(query))
+                cached = step_cache.get(cache_key)
+                if cached is not None:
+                    self.cache_integrations.add(step.integration)
+                    return cached.copy()
+        if cache_key is None:
+            self.is_cacheable = False
+        else:
+            self.cache_integrations.add(step.integration)
+
         if query is None:
+            # native query can change data
+            invalidate_query_cache(step.integration)
             table_alias = (self.database, 'result', 'result')
 
             # fetch raw_query
@@ -559,6 +1032,9 @@ class SQLQuery():
             ))
         result.add_records(data)
 
+        if cache_key is not None:
+            step_cache.set(cache_key, result.copy(), [step.integration], ttl)
+
         return result
 
     def _multiple_steps(self, steps):
@@ -572,8 +1048,6 @@ class SQLQuery():
         if step.reduce != 'union':
             raise ErLogicError(f'Unknown MultipleSteps type: {step.reduce}')
 
-        data = ResultSet()
-
         # mark vars
         steps = []
         for substep in step.steps:
@@ -583,15 +1057,63 @@ class SQLQuery():
             markQueryVar(substep.query.where)
             steps.append(substep)
 
+        steps_list = []
         for var_group in vars:
             steps2 = copy.deepcopy(steps)
             for name, value in var_group.items():
                 for substep in steps2:
                     replaceQueryVar(substep.query.where, value, name)
-            sub_data = self._multiple_steps(steps2)
-            data = join_query_data(data, sub_data)
+            steps_list.append(steps2)
 
-        return data
+        config = get_map_reduce_config(steps[0].integration)
+        results = run_parallel(self._multiple_steps, steps_list, config['max_workers'])
+
+        return concat_query_data(results)
+
+    def _map_reduce_fetch(self, substep, vars):
+        # query to integration for every group of variables
+        config = get_map_reduce_config(substep.integration)
+        batch_size = config['batch_size']
+
+        if batch_size > 1:
+            results = self._map_reduce_fetch_batches(substep, vars, batch_size, config['max_workers'])
+            if results is not None:
+                return concat_query_data(results)
+
+        steps = []
+        for var_group in vars:
+            step2 = copy.copy(substep)
+            step2.query = copy.deepcopy(substep.query)
+            markQueryVar(step2.query.where)
+            for name, value in var_group.items():
+                replaceQueryVar(step2.query.where, value, name)
+            steps.append(step2)
+
+        results = run_parallel(self._fetch_dataframe_step, steps, config['max_workers'])
+
+        return concat_query_data(results)
+
+    def _map_reduce_fetch_batches(self, substep, vars, batch_size, max_workers):
+        # returns None if query can't be batched
+        steps, batches = [], []
+        for i in range(0, len(vars), batch_size):
+            var_groups = vars[i: i + batch_size]
+            batch = get_batch_query(substep.query, var_groups)
+            if batch is None:
+                return None
+            batch_step = copy.copy(substep)
+            batch_step.query = batch[0]
+            steps.append(batch_step)
+            batches.append((batch[1], var_groups))
+
+        results = []
+        batch_results = run_parallel(self._fetch_dataframe_step, steps, max_workers)
+        for (var_name, var_groups), data in zip(batches, batch_results):
+            data = split_batch_result(data, var_name, var_groups)
+            if data is None:
+                return None
+            results.append(data)
+        return results
 
     def prepare_query(self, prepare=True):
         if prepare:
@@ -629,11 +1151,25 @@ class SQLQuery():
                 for col in statement_info['parameters']
             ]
 
+    def _get_plan_cache_key(self, params):
+        if params is not None or not isinstance(self.query, (Select, Union)):
+            return None
+        return ctx.company_id, self.database, str(self.query), self.outer_query
+
     def execute_query(self, params=None):
         if self.fetched_data is not None:
             # no need to execute
             return
 
+        cache_key = self._get_plan_cache_key(params)
+        if cache_key is not None:
+            cached = plan_cache.get(cache_key)
+            if cached is not None:
+                self.fetched_data = cached.copy()
+                if self.columns_list is None:
+                    self.columns_list = self.fetched_data.columns
+                return
+
         steps_data = []
         try:
             for step in self.planner.execute_steps(params):
@@ -659,7 +1195,7 @@ class SQLQuery():
                 result = steps_data[-1]
                 df = result.to_df()
 
-                df2 = query_df(df, self.outer_query)
+                df2 = query_df(df, self.outer_query, replace_nan=False)
 
                 result2 = ResultSet().from_df(df2, database='', table_name='')
 
@@ -686,7 +1222,14 @@ class SQLQuery():
         except Exception as e:
             raise SqlApiUnknownError("error in column list step") from e
 
+        if cache_key is not None and self.is_cacheable and len(self.cache_integrations) > 0:
+            ttl = min(get_integration_ttl(name) for name in self.cache_integrations)
+            plan_cache.set(cache_key, self.fetched_data.copy(), list(self.cache_integrations), ttl)
+
     def execute_step(self, step, steps_data):
+        if not isinstance(step, CACHEABLE_STEPS):
+            self.is_cacheable = False
+
         if type(step) == GetPredictorColumns:
             predictor_name = step.predictor.parts[-1]
             dn = self.datahub.get(self.mindsdb_database_name)
@@ -705,7 +1248,10 @@ class SQLQuery():
             dn = self.datahub.get(step.namespace)
             ds_query = Select(from_table=Identifier(table), targets=[Star()], limit=Constant(0))
 
-            data, columns_info = dn.query(ds_query, session=self.session)
+            try:
+                data, columns_info = dn.query(ds_query, session=self.session)
+            finally:
+                dn.close()
 
             data = ResultSet()
             for column in columns_info:
@@ -740,14 +1286,12 @@ class SQLQuery():
             for col in left_result.columns:
                 result.add_column(col)
 
-            records_hashes = []
-            for row in left_result.get_records_raw() + right_result.get_records_raw():
-                if step.unique:
-                    checksum = hashlib.sha256(str(row).encode()).hexdigest()
-                    if checksum in records_hashes:
-                        continue
-                    records_hashes.append(checksum)
-                result.add_record_raw(row)
+            df = union_df(
+                left_result.get_raw_df(),
+                right_result.get_raw_df(),
+                unique=step.unique
+            )
+            result.add_raw_df(df)
 
             data = result
 
@@ -765,22 +1309,9 @@ class SQLQuery():
                         if name != '__mindsdb_row_id':
                             var_group[name] = value
 
-                data = ResultSet()
-
                 substep = step.step
                 if type(substep) == FetchDataframeStep:
-                    query = substep.query
-                    for var_group in vars:
-                        markQueryVar(query.where)
-                        for name, value in var_group.items():
-                            replaceQueryVar(query.where, value, name)
-                        sub_data = self._fetch_dataframe_step(substep)
-                        if len(data.columns) == 0:
-                            data = sub_data
-                        else:
-                            data.add_records(sub_data.get_records())
-
-                        unmarkQueryVar(query.where)
+                    data = self._map_reduce_fetch(substep, vars)
                 elif type(substep) == MultipleSteps:
                     data = self._multiple_steps_reduce(substep, vars)
                 else:
@@ -797,7 +1328,7 @@ class SQLQuery():
                 if data is None:
                     data = subdata
                 else:
-                    data.add_records(subdata.get_records())
+                    data.add_raw_df(subdata.get_raw_df())
         elif type(step) == ApplyPredictorRowStep:
             try:
                 project_name = step.namespace
@@ -997,19 +1528,13 @@ class SQLQuery():
                     join_condition = SqlalchemyRender('postgres').get_string(condition)
                     join_type = step.query.join_type
 
-                con = duckdb.connect(database=':memory:')
-                con.register('table_a', df_a)
-                con.register('table_b', df_b)
-
-                resp_df = con.execute(f"""
-                    SELECT * FROM table_a {join_type} table_b
-                    ON {join_condition}
-                """).fetchdf()
-                con.unregister('table_a')
-                con.unregister('table_b')
-                con.close()
-
-                resp_df = resp_df.replace({np.nan: None})
+                resp_df = execute_duckdb(
+                    f"""
+                        SELECT * FROM table_a {join_type} table_b
+                        ON {join_condition}
+                    """,
+                    {'table_a': df_a, 'table_b': df_b}
+                )
 
                 names_a.update(names_b)
                 data = ResultSet().from_df_cols(resp_df, col_names=names_a)
@@ -1052,7 +1577,7 @@ class SQLQuery():
 
             query = Select(targets=[Star()], from_table=Identifier('df'), where=where_query)
 
-            res = query_df(df, query)
+            res = query_df(df, query, replace_nan=False)
 
             result_set2 = ResultSet().from_df_cols(res, col_names)
 
@@ -1066,14 +1591,14 @@ class SQLQuery():
                 for col in step_data.columns:
                     step_data2.add_column(col)
 
-                records = step_data.get_records()
+                df = step_data.get_raw_df()
 
                 if isinstance(step.offset, Constant) and isinstance(step.offset.value, int):
-                    records = records[step.offset.value:]
+                    df = df[step.offset.value:]
                 if isinstance(step.limit, Constant) and isinstance(step.limit.value, int):
-                    records = records[:step.limit.value]
+                    df = df[:step.limit.value]
 
-                step_data2.add_records(records)
+                step_data2.add_raw_df(df)
 
                 data = step_data2
 
@@ -1145,7 +1670,7 @@ class SQLQuery():
             df = step_data.to_df()
 
             query = Select(targets=step.targets, from_table='df', group_by=step.columns).to_string()
-            res = query_df(df, query)
+            res = query_df(df, query, replace_nan=False)
 
             # stick all columns to first table
             appropriate_table = step_data.get_tables()[0]
@@ -1170,7 +1695,7 @@ class SQLQuery():
             query.from_table = Identifier('df_table')
 
             df = result.to_df()
-            res = query_df(df, query)
+            res = query_df(df, query, replace_nan=False)
 
             result2 = ResultSet()
             # get database from first column
@@ -1223,12 +1748,16 @@ class SQLQuery():
                 else:
                     col_names.add(col.alias)
 
-            dn.create_table(
-                table_name=table_name,
-                result_set=data,
-                is_replace=is_replace,
-                is_create=is_create
-            )
+            try:
+                dn.create_table(
+                    table_name=table_name,
+                    result_set=data,
+                    is_replace=is_replace,
+                    is_create=is_create
+                )
+            finally:
+                dn.close()
+            invalidate_query_cache(integration_name)
             data = ResultSet()
         elif type(step) == UpdateToTable:
 
@@ -1272,16 +1801,14 @@ class SQLQuery():
                 if param_name not in data_header:
                     raise ErSqlWrongArguments(f'Field {param_name} not found in input data. Input fields: {data_header}')
 
-            # perform update
-            for row in result.get_records():
-                # run update from every row from input data
-
-                # fill params:
-                for param_name, param in params_map_index:
-                    param.value = row[param_name]
-
-                dn.query(query=update_query, session=self.session)
+            # perform update: rows of input data are combined in batches
+            try:
+                for batch_query in make_update_batches(update_query, params_map_index, result.get_records()):
+                    dn.query(query=batch_query, session=self.session)
+            finally:
+                dn.close()
 
+            invalidate_query_cache(integration_name)
             data = ResultSet()
         else:
             raise ErLogicError(F'Unknown planner step: {step}')
@@ -9,9 +9,66 @@
  *******************************************************
 """
 
-from mindsdb.api.mysql.mysql_proxy.data_types.mysql_datum import Datum
+import struct
+
 from mindsdb.api.mysql.mysql_proxy.data_types.mysql_packet import Packet
-from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import NULL_VALUE
+from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import (
+    NULL_VALUE,
+    TWO_BYTE_ENC,
+    THREE_BYTE_ENC,
+    EIGHT_BYTE_ENC
+)
+
+
+def lenenc_prefix(length):
+    """ length-encoded integer which precedes length-encoded string
+        https://dev.mysql.com/doc/internals/en/integer.html#length-encoded-integer
+    """
+    if length < NULL_VALUE[0]:
+        return bytes((length,))
+    if length < 1 << 16:
+        return TWO_BYTE_ENC + struct.pack('<H', length)
+    if length < 1 << 24:
+        return THREE_BYTE_ENC + struct.pack('<I', length)[:3]
+    return EIGHT_BYTE_ENC + struct.pack('<Q', length)
+
+
+def encode_text_column(values):
+    """ Encode values of one column to length-encoded strings of text protocol
+
+        Args:
+            values (list): values of column, None is sent as NULL
+
+        Returns:
+            list of bytes
+    """
+    encoded = []
+    for val in values:
+        if val is None:
+            encoded.append(NULL_VALUE)
+            continue
+        val = str(val).encode('utf-8')
+        encoded.append(lenenc_prefix(len(val)) + val)
+    return encoded
+
+
+def encode_text_rows(rows):
+    """ Encode batch of rows to bodies of ResultsetRowPacket.
+        Encoding is done by columns and then joined into rows.
+
+        Args:
+            rows (list): list of rows (lists of values)
+
+        Returns:
+            list of bytes: body of packet for every row
+    """
+    if len(rows) == 0:
+        return []
+    columns = zip(*rows)
+    encoded_columns = [encode_text_column(values) for values in columns]
+    if len(encoded_columns) == 0:
+        return [b''] * len(rows)
+    return [b''.join(row) for row in zip(*encoded_columns)]
 
 
 class ResultsetRowPacket(Packet):
@@ -19,27 +76,20 @@ class ResultsetRowPacket(Packet):
     Implementation based on:
     https://dev.mysql.com/doc/internals/en/com-query-response.html#packet-ProtocolText::ResultsetRow
     https://mariadb.com/kb/en/resultset-row/
+
+    Row can be passed as values (data) or as body encoded by encode_text_rows (encoded_body)
     '''
 
     def setup(self):
-        data = self._kwargs.get('data', {})
-        self.value = []
-        for val in data:
-            if val is None:
-                self.value.append(NULL_VALUE)
-            else:
-                self.value.append(Datum('string<lenenc>', str(val)))
+        encoded_body = self._kwargs.get('encoded_body')
+        if encoded_body is None:
+            data = self._kwargs.get('data', [])
+            encoded_body = b''.join(encode_text_column(data))
+        self.value = encoded_body
 
     @property
     def body(self):
-        string = b''
-        for x in self.value:
-            if x is NULL_VALUE:
-                string += x
-            else:
-                string += x.toStringPacket()
-
-        self.setBody(string)
+        self.setBody(self.value)
         return self._body
 
     @staticmethod
@@ -18,3 +18,7 @@ class DataNode:
 
     def query(self, query=None, native_query=None, session=None):
         return []
+
+    def close(self):
+        """ release resources held by datanode between queries """
+        pass
@@ -1,4 +1,6 @@
+import time
 from functools import partial
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 import pandas as pd
 
@@ -6,6 +8,7 @@ from mindsdb_sql.parser.ast.base import ASTNode
 from mindsdb_sql.parser.ast import BinaryOperation, Select, Identifier, Constant
 
 from mindsdb.api.mysql.mysql_proxy.utilities.sql import query_df
+from mindsdb.api.mysql.mysql_proxy.utilities.query_cache import get_query_cache_stats, schema_cache
 from mindsdb.api.mysql.mysql_proxy.classes.sql_query import get_all_tables
 from mindsdb.api.mysql.mysql_proxy.datahub.datanodes.datanode import DataNode
 from mindsdb.api.mysql.mysql_proxy.datahub.datanodes.integration_datanode import IntegrationDataNode
@@ -13,6 +16,87 @@ from mindsdb.api.mysql.mysql_proxy.datahub.datanodes.project_datanode import Pro
 from mindsdb.api.mysql.mysql_proxy.datahub.classes.tables_row import TablesRow, TABLES_ROW_TYPE
 from mindsdb.api.mysql.mysql_proxy.utilities import exceptions as exc
 from mindsdb.interfaces.database.projects import ProjectController
+from mindsdb.interfaces.database.views import ViewController
+from mindsdb.interfaces.storage import db
+from mindsdb.utilities.config import Config
+from mindsdb.utilities.context import context as ctx
+from mindsdb.utilities import log
+
+
+def get_schema_config(integration_name: str) -> dict:
+    """ config of fetching of tables and columns of integration:
+        "information_schema": {
+            "max_workers": 8,   # count of integrations queried in parallel
+            "timeout": 10,      # seconds to wait response of integration
+            "ttl": 0,           # seconds to keep response in cache, 0 (default) - not cached
+            "integrations": {
+                "my_db": {"timeout": 30, "ttl": 0}
+            }
+        }
+    """
+    config = Config().get('information_schema', {})
+    schema_config = {
+        'max_workers': config.get('max_workers', 8),
+        'timeout': config.get('timeout', 10),
+        'ttl': config.get('ttl', 0)
+    }
+    integrations = {k.lower(): v for k, v in config.get('integrations', {}).items()}
+    schema_config.update(integrations.get(integration_name.lower(), {}))
+    return schema_config
+
+
+def fetch_parallel(fnc, names: list, timeouts: dict, max_workers: int) -> dict:
+    """ Call fnc for every name in a thread pool. Result of name is waited not more than
+        timeouts[name] seconds since the call was submitted. Calls which are not finished in
+        time are not interrupted, fnc has to release its resources itself.
+
+        Returns:
+            dict: name -> result. Names which raised an error or were not responded in time are missed
+    """
+    results = {}
+    if len(names) == 0:
+        return results
+
+    ctx_dump = ctx.dump()
+
+    def worker(name):
+        ctx.load(ctx_dump)
+        try:
+            return fnc(name)
+        finally:
+            db.session.remove()
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(names))))
+    started_at = time.monotonic()
+    futures = {executor.submit(worker, name): name for name in names}
+    deadlines = {future: started_at + timeouts[name] for future, name in futures.items()}
+    pending = set(futures)
+    try:
+        while len(pending) > 0:
+            now = time.monotonic()
+            expired = [future for future in pending if deadlines[future] <= now]
+            for future in expired:
+                pending.discard(future)
+                future.cancel()
+                log.logger.warning(f"Integration '{futures[future]}' did not respond in {timeouts[futures[future]]} seconds")
+            if len(pending) == 0:
+                break
+
+            timeout = min(deadlines[future] for future in pending) - now
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.discard(future)
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    log.logger.warning(f"Can't get schema of '{name}': {e}")
+    finally:
+        # don't wait for integrations which are not responded
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+    return results
 
 
 class InformationSchemaDataNode(DataNode):
@@ -36,7 +120,9 @@ class InformationSchemaDataNode(DataNode):
         'MODELS_VERSIONS': ['NAME', 'ENGINE', 'PROJECT', 'ACTIVE', 'VERSION', 'STATUS', 'ACCURACY', 'PREDICT', 'UPDATE_STATUS', 'MINDSDB_VERSION', 'ERROR', 'SELECT_DATA_QUERY', 'TRAINING_OPTIONS', 'TAG'],
         'DATABASES': ['NAME', 'TYPE', 'ENGINE'],
         'ML_ENGINES': ['NAME', 'HANDLER', 'CONNECTION_DATA'],
-        'HANDLERS': ['NAME', 'TITLE', 'DESCRIPTION', 'VERSION', 'CONNECTION_ARGS', 'IMPORT_SUCCESS', 'IMPORT_ERROR']
+        'HANDLERS': ['NAME', 'TITLE', 'DESCRIPTION', 'VERSION', 'CONNECTION_ARGS', 'IMPORT_SUCCESS', 'IMPORT_ERROR'],
+        'QUERY_CACHE': ['NAME', 'ENTRIES', 'HITS', 'MISSES', 'INVALIDATIONS'],
+        'MATERIALIZED_VIEWS': ['TABLE_SCHEMA', 'TABLE_NAME', 'STATUS', 'ROWS', 'REFRESHED_AT', 'REFRESH_INTERVAL', 'KEY_COLUMN', 'KEY_VALUE', 'ERROR']
     }
 
     def __init__(self, session):
@@ -66,7 +152,9 @@ class InformationSchemaDataNode(DataNode):
             'MODELS_VERSIONS': self._get_models_versions,
             'DATABASES': self._get_databases,
             'ML_ENGINES': self._get_ml_engines,
-            'HANDLERS': self._get_handlers
+            'HANDLERS': self._get_handlers,
+            'QUERY_CACHE': self._get_query_cache,
+            'MATERIALIZED_VIEWS': self._get_materialized_views
         }
         for table_name in self.information_schema:
             if table_name not in self.get_dataframe_funcs:
@@ -214,7 +302,10 @@ class InformationSchemaDataNode(DataNode):
         for ds_name, ds in self.persis_datanodes.items():
             if target_table is not None and target_table != ds_name:
                 continue
-            ds_tables = ds.get_tables()
+            try:
+                ds_tables = ds.get_tables()
+            finally:
+                ds.close()
             if len(ds_tables) == 0:
                 continue
             elif isinstance(ds_tables[0], dict):
@@ -225,17 +316,12 @@ class InformationSchemaDataNode(DataNode):
                 row.TABLE_SCHEMA = ds_name
                 data.append(row.to_list())
 
-        for ds_name in self.get_integrations_names():
-            if target_table is not None and target_table != ds_name:
-                continue
-            try:
-                ds = self.get(ds_name)
-                ds_tables = ds.get_tables()
-                for row in ds_tables:
-                    row.TABLE_SCHEMA = ds_name
-                    data.append(row.to_list())
-            except Exception:
-                print(f"Can't get tables from '{ds_name}'")
+        integrations_names = [
+            ds_name for ds_name in self.get_integrations_names()
+            if target_table is None or target_table == ds_name
+        ]
+        for ds_name, rows in self._get_integrations_tables(integrations_names).items():
+            data.extend(rows)
 
         for project_name in self.get_projects_names():
             if target_table is not None and target_table != project_name:
@@ -249,6 +335,49 @@ class InformationSchemaDataNode(DataNode):
         df = pd.DataFrame(data, columns=columns)
         return df
 
+    def _get_integration_tables(self, ds_name: str) -> list:
+        ds = self.get(ds_name)
+        if ds is None:
+            return []
+        try:
+            rows = []
+            for row in ds.get_tables():
+                row.TABLE_SCHEMA = ds_name
+                rows.append(row.to_list())
+            return rows
+        finally:
+            # release handler in the worker thread, also if response came after timeout
+            ds.close()
+
+    def _get_integrations_tables(self, integrations_names: list) -> dict:
+        """ rows of information_schema.tables for every integration, integrations
+            which failed or not responded in time are missed in the result
+        """
+        configs = {name: get_schema_config(name) for name in integrations_names}
+
+        result = {}
+        to_fetch = []
+        for name in integrations_names:
+            rows = schema_cache.get((ctx.company_id, 'tables', name))
+            if rows is None:
+                to_fetch.append(name)
+            else:
+                result[name] = rows
+
+        max_workers = Config().get('information_schema', {}).get('max_workers', 8)
+        fetched = fetch_parallel(
+            self._get_integration_tables,
+            to_fetch,
+            timeouts={name: configs[name]['timeout'] for name in to_fetch},
+            max_workers=max_workers
+        )
+        for name, rows in fetched.items():
+            schema_cache.set((ctx.company_id, 'tables', name), rows, [name], configs[name]['ttl'])
+            result[name] = rows
+
+        # keep order of integrations
+        return {name: result[name] for name in integrations_names if name in result}
+
     def _get_models(self, query: ASTNode = None):
         columns = self.information_schema['MODELS']
         data = []
@@ -337,15 +466,18 @@ class InformationSchemaDataNode(DataNode):
                 result.append(result_row)
 
         files_dn = self.get('FILES')
-        for table_name in files_dn.get_tables():
-            table_columns = files_dn.get_table_columns(table_name)
-            for i, column_name in enumerate(table_columns):
-                result_row = row_templates['text'].copy()
-                result_row[1] = 'files'
-                result_row[2] = table_name
-                result_row[3] = column_name
-                result_row[4] = i
-                result.append(result_row)
+        try:
+            for table_name in files_dn.get_tables():
+                table_columns = files_dn.get_table_columns(table_name)
+                for i, column_name in enumerate(table_columns):
+                    result_row = row_templates['text'].copy()
+                    result_row[1] = 'files'
+                    result_row[2] = table_name
+                    result_row[3] = column_name
+                    result_row[4] = i
+                    result.append(result_row)
+        finally:
+            files_dn.close()
 
         df = pd.DataFrame(result, columns=columns)
         return df
@@ -390,6 +522,30 @@ class InformationSchemaDataNode(DataNode):
         df = pd.DataFrame(data, columns=columns)
         return df
 
+    def _get_query_cache(self, query: ASTNode = None):
+        columns = self.information_schema['QUERY_CACHE']
+        data = [
+            [stats['name'], stats['entries'], stats['hits'], stats['misses'], stats['invalidations']]
+            for stats in get_query_cache_stats()
+        ]
+
+        df = pd.DataFrame(data, columns=columns)
+        return df
+
+    def _get_materialized_views(self, query: ASTNode = None):
+        columns = self.information_schema['MATERIALIZED_VIEWS']
+        data = []
+        for view in ViewController().get_materialized_list():
+            state = view['materialized']
+            data.append([
+                view['project_name'], view['name'], state.get('status'), state.get('rows'),
+                state.get('refreshed_at'), state.get('refresh_interval'), state.get('key_column'),
+                state.get('key_value'), state.get('error')
+            ])
+
+        df = pd.DataFrame(data, columns=columns)
+        return df
+
     def _get_empty_table(self, table_name, query: ASTNode = None):
         columns = self.information_schema[table_name]
         data = []
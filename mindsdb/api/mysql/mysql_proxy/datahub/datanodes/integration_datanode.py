@@ -1,15 +1,18 @@
 import numpy as np
+import pandas as pd
 from numpy import dtype as np_dtype
 from pandas.api import types as pd_types
 
 from sqlalchemy.types import (
     Integer, Float, Text
 )
-from mindsdb_sql.parser.ast import Insert, Identifier, CreateTable, TableColumn, DropTables
+from mindsdb_sql.parser.ast import Identifier, CreateTable, TableColumn, DropTables
 
 from mindsdb.api.mysql.mysql_proxy.datahub.datanodes.datanode import DataNode
 from mindsdb.api.mysql.mysql_proxy.libs.constants.response_type import RESPONSE_TYPE
 from mindsdb.api.mysql.mysql_proxy.datahub.classes.tables_row import TablesRow
+from mindsdb.integrations.libs.base import BULK_INSERT_BATCH_SIZE
+from mindsdb.utilities.config import Config
 
 
 class IntegrationDataNode(DataNode):
@@ -19,7 +22,24 @@ class IntegrationDataNode(DataNode):
         self.integration_name = integration_name
         self.ds_type = ds_type
         self.integration_controller = integration_controller
-        self.integration_handler = self.integration_controller.get_handler(self.integration_name)
+        self._integration_handler = None
+
+    @property
+    def integration_handler(self):
+        """ handler borrowed from the pool on first use """
+        if self._integration_handler is None:
+            self._integration_handler = self.integration_controller.get_handler(self.integration_name, reuse=True)
+        return self._integration_handler
+
+    def close(self):
+        """ returns handler to the pool, it is borrowed again on the next use of datanode """
+        handler = self.__dict__.get('_integration_handler')
+        self._integration_handler = None
+        if handler is not None:
+            self.integration_controller.release_handler(handler)
+
+    def __del__(self):
+        self.close()
 
     def get_type(self):
         return self.type
@@ -87,37 +107,41 @@ class IntegrationDataNode(DataNode):
             if result.type == RESPONSE_TYPE.ERROR:
                 raise Exception(result.error_message)
 
-        insert_columns = [Identifier(parts=[x.alias]) for x in result_set.columns]
-        formatted_data = []
-
-        for rec in result_set.get_records():
-            new_row = []
-            for col in result_set.columns:
-                value = rec[col.alias]
-                column_type = table_columns_meta[col.alias]
-
-                python_type = str
-                if column_type == Integer:
-                    python_type = int
-                elif column_type == Float:
-                    python_type = float
-
+        # values are converted to types of table columns
+        df = result_set.to_df()
+        columns = {}
+        for i, col in enumerate(result_set.columns):
+            values = df.iloc[:, i]
+            column_type = table_columns_meta[col.alias]
+            if column_type == Text:
+                values = values.map(str, na_action='ignore')
+            else:
                 try:
-                    value = python_type(value) if value is not None else value
-                except Exception:
+                    if column_type == Integer:
+                        values = values.astype('Int64')
+                    elif column_type == Float:
+                        values = values.astype(float)
+                except (TypeError, ValueError):
+                    # values which can't be converted are inserted as is
                     pass
-                new_row.append(value)
-            formatted_data.append(new_row)
+            columns[i] = values
+        df = pd.DataFrame(columns, index=df.index)
+        df.columns = [col.alias for col in result_set.columns]
 
-        insert_ast = Insert(
-            table=table_name,
-            columns=insert_columns,
-            values=formatted_data
-        )
-
-        result = self.integration_handler.query(insert_ast)
-        if result.type == RESPONSE_TYPE.ERROR:
-            raise Exception(result.error_message)
+        batch_size = Config().get('bulk_insert', {}).get('batch_size', BULK_INSERT_BATCH_SIZE)
+        try:
+            result = self.integration_handler.bulk_insert(table_name, df, batch_size=batch_size)
+            if result.type == RESPONSE_TYPE.ERROR:
+                raise Exception(result.error_message)
+        except Exception:
+            if is_create:
+                # insert can be not atomic: don't leave partially filled table which was created here
+                drop_ast = DropTables(
+                    tables=[table_name],
+                    if_exists=True
+                )
+                self.integration_handler.query(drop_ast)
+            raise
 
     def query(self, query=None, native_query=None, session=None):
 
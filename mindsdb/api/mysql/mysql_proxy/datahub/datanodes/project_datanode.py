@@ -1,17 +1,220 @@
+import datetime
 from copy import deepcopy
 
+import numpy as np
+import pandas as pd
+
 from mindsdb_sql import parse_sql
 from mindsdb_sql.render.sqlalchemy_render import SqlalchemyRender
+from mindsdb_sql.planner.utils import query_traversal
+from mindsdb_sql.parser.ast.base import ASTNode
 from mindsdb_sql.parser.ast import (
     BinaryOperation,
     Identifier,
-    Constant
+    Constant,
+    Select,
+    Star
 )
 
 from mindsdb.api.mysql.mysql_proxy.datahub.datanodes.datanode import DataNode
 from mindsdb.api.mysql.mysql_proxy.datahub.classes.tables_row import TablesRow
 from mindsdb.api.mysql.mysql_proxy.classes.sql_query import SQLQuery
 from mindsdb.api.mysql.mysql_proxy.utilities.sql import query_df
+from mindsdb.interfaces.database.views import ViewController, MaterializedViewStorage
+from mindsdb.utilities import log
+
+
+def _is_star(node) -> bool:
+    return isinstance(node, Star) or (
+        isinstance(node, Identifier) and isinstance(node.parts[-1], Star)
+    )
+
+
+def _count_identifiers(node) -> int:
+    if isinstance(node, Identifier):
+        return 1
+    if isinstance(node, (list, tuple)):
+        return sum(_count_identifiers(item) for item in node)
+    if isinstance(node, ASTNode):
+        return sum(
+            _count_identifiers(value)
+            for key, value in vars(node).items()
+            if key != 'alias'
+        )
+    return 0
+
+
+def _get_view_columns(view_query: Select):
+    """ returns map of view's output columns: name -> expression, or None if view selects '*' """
+    if len(view_query.targets) == 1 and _is_star(view_query.targets[0]):
+        return None
+    columns = {}
+    for target in view_query.targets:
+        if _is_star(target):
+            raise ValueError('Mix of star and columns')
+        if target.alias is not None:
+            name = target.alias.parts[-1]
+        elif isinstance(target, Identifier):
+            name = target.parts[-1]
+        else:
+            raise ValueError('Column without alias')
+        expression = deepcopy(target)
+        expression.alias = None
+        columns[name.lower()] = (name, expression)
+    return columns
+
+
+def inline_view(query: Select, view_query: Select):
+    """ Substitutes view into the query: query to view is converted into query to the view's table.
+        Filters, columns and limits of the query are moved to the integration.
+
+        Args:
+            query (Select): query to the view
+            view_query (Select): query of the view
+
+        Returns:
+            Select or None if view can't be inlined safely
+    """
+    if (
+        not isinstance(query, Select)
+        or not isinstance(view_query, Select)
+        or not isinstance(view_query.from_table, Identifier)
+        or view_query.distinct
+        or view_query.group_by is not None
+        or view_query.having is not None
+        or view_query.order_by is not None
+        or view_query.limit is not None
+        or view_query.offset is not None
+        or view_query.cte is not None
+        or view_query.mode is not None
+        or view_query.using is not None
+        or query.cte is not None
+        or query.mode is not None
+        or query.using is not None
+    ):
+        return None
+
+    try:
+        view_columns = _get_view_columns(view_query)
+    except ValueError:
+        return None
+
+    query = deepcopy(query)
+
+    # queries in where, order, etc can't be changed
+    has_subselect = False
+
+    def find_subselect(node, is_table, **kwargs):
+        nonlocal has_subselect
+        if isinstance(node, Select) and node is not query:
+            has_subselect = True
+
+    query_traversal(query, find_subselect)
+    if has_subselect:
+        return None
+
+    targets_aliases = set(
+        target.alias.parts[-1].lower()
+        for target in query.targets
+        if target.alias is not None
+    )
+
+    def replace_column(node):
+        # returns expression of the view's column or None if column is unknown
+        if isinstance(node.parts[-1], Star):
+            return None
+        name = node.parts[-1]
+        if view_columns is None:
+            return Identifier(parts=[name])
+        if name.lower() not in view_columns:
+            return None
+        return deepcopy(view_columns[name.lower()][1])
+
+    unknown_columns = False
+    replaced_count = 0
+
+    def replace_identifiers(node, is_table, **kwargs):
+        nonlocal unknown_columns, replaced_count
+        if is_table or not isinstance(node, Identifier):
+            return
+        replaced_count += 1
+        expression = replace_column(node)
+        if expression is None:
+            if len(node.parts) == 1 and node.parts[0].lower() in targets_aliases:
+                # reference to alias of the query's column
+                return
+            unknown_columns = True
+            return
+        return expression
+
+    query.from_table = None
+    identifiers_count = _count_identifiers(query)
+
+    targets = []
+    for target in query.targets:
+        if _is_star(target):
+            if isinstance(target, Identifier):
+                replaced_count += 1
+            if view_columns is None:
+                targets.append(Star())
+            else:
+                for name, expression in view_columns.values():
+                    expression = deepcopy(expression)
+                    if not isinstance(expression, Identifier) or expression.parts[-1] != name:
+                        expression.alias = Identifier(name)
+                    targets.append(expression)
+        elif isinstance(target, Identifier):
+            replaced_count += 1
+            expression = replace_column(target)
+            if expression is None:
+                return None
+            if target.alias is not None:
+                expression.alias = target.alias
+            elif not isinstance(expression, Identifier) or expression.parts[-1] != target.parts[-1]:
+                expression.alias = Identifier(target.parts[-1])
+            targets.append(expression)
+        else:
+            targets.append(query_traversal(target, replace_identifiers) or target)
+    query.targets = targets
+
+    for attr in ('where', 'having'):
+        node = getattr(query, attr)
+        if node is not None:
+            setattr(query, attr, query_traversal(node, replace_identifiers) or node)
+    for attr in ('group_by', 'order_by'):
+        nodes = getattr(query, attr)
+        if nodes is not None:
+            setattr(query, attr, [query_traversal(node, replace_identifiers) or node for node in nodes])
+
+    # all columns must be replaced
+    if unknown_columns or replaced_count != identifiers_count:
+        return None
+
+    query.from_table = deepcopy(view_query.from_table)
+    if view_query.where is not None:
+        if query.where is None:
+            query.where = deepcopy(view_query.where)
+        else:
+            query.where = BinaryOperation('and', args=[deepcopy(view_query.where), query.where])
+    return query
+
+
+def _is_refresh_required(state: dict) -> bool:
+    if state.get('refreshed_at') is None:
+        return True
+    refresh_interval = state.get('refresh_interval')
+    if not refresh_interval:
+        return False
+    refreshed_at = datetime.datetime.fromisoformat(state['refreshed_at'])
+    return (datetime.datetime.now() - refreshed_at).total_seconds() > refresh_interval
+
+
+def _to_json_value(value):
+    if isinstance(value, (pd.Timestamp, datetime.date)):
+        return str(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
 
 
 class ProjectDataNode(DataNode):
@@ -85,7 +288,30 @@ class ProjectDataNode(DataNode):
         # endregion
 
         # region query to views
-        view_query_ast = self.project.query_view(query)
+        view_meta = self.project.get_view(query.from_table.parts[-1])
+        if view_meta['materialized'] is not None:
+            df = self._query_materialized_view(query, view_meta, session)
+        else:
+            df = self._query_view(query, view_meta, session)
+
+        columns_info = [
+            {
+                'name': k,
+                'type': v
+            }
+            for k, v in df.dtypes.items()
+        ]
+
+        return df.to_dict(orient='records'), columns_info
+        # endregion
+
+    def _query_view(self, query, view_meta, session):
+        view_query_ast = parse_sql(view_meta['query'], dialect='mindsdb')
+
+        # if it is possible, query is executed on the view's table
+        inlined_query = inline_view(query, view_query_ast)
+        if inlined_query is not None:
+            view_query_ast = inlined_query
 
         renderer = SqlalchemyRender('mysql')
         query_str = renderer.get_string(view_query_ast, with_failback=True)
@@ -100,15 +326,74 @@ class ProjectDataNode(DataNode):
             raise Exception(f'Cant execute view query: {query_str}')
         df = result['result']
 
-        df = query_df(df, query)
+        if inlined_query is None:
+            df = query_df(df, query)
+        return df
 
-        columns_info = [
-            {
-                'name': k,
-                'type': v
-            }
-            for k, v in df.dtypes.items()
-        ]
+    def _query_materialized_view(self, query, view_meta, session):
+        state = view_meta['materialized']
+        if _is_refresh_required(state):
+            try:
+                is_refreshed = self.refresh_view(view_meta['name'], session=session)
+            except Exception as e:
+                if state.get('refreshed_at') is None:
+                    raise
+                # previous data is still available
+                log.logger.warning(f"Can't refresh materialized view '{view_meta['name']}': {e}")
+            else:
+                # view is refreshed by another query: previous data is used
+                if is_refreshed is False and state.get('refreshed_at') is None:
+                    raise Exception(f"Materialized view '{view_meta['name']}' is being filled by another query")
 
-        return df.to_dict(orient='records'), columns_info
-        # endregion
+        dataset = MaterializedViewStorage(view_meta['id']).get_dataset()
+        return query_df(dataset, query)
+
+    def refresh_view(self, view_name: str, session=None, full: bool = False) -> bool:
+        """ Reload data of materialized view. If view has key column and refresh is not full,
+            only rows with value of key column greater than the last loaded one are added
+
+            Returns:
+                bool: False if view is refreshing by another query and refresh is skipped
+        """
+        view_meta = self.project.get_view(view_name)
+        if view_meta['materialized'] is None:
+            raise Exception(f"View '{view_name}' is not materialized")
+
+        view_controller = ViewController()
+        # state is taken at the moment of the mark, it can be changed since view_meta was read
+        state = view_controller.start_materialized_refresh(view_meta['id'])
+        if state is None:
+            return False
+
+        key_column = state.get('key_column')
+        incremental = full is False and key_column is not None and state.get('key_value') is not None
+
+        try:
+            query = Select(targets=[Star()], from_table=Identifier(parts=[view_name]))
+            if incremental:
+                query.where = BinaryOperation('>', args=[
+                    Identifier(parts=[key_column]),
+                    Constant(state['key_value'])
+                ])
+            df = self._query_view(query, view_meta, session)
+
+            MaterializedViewStorage(view_meta['id']).write(df, append=incremental)
+
+            new_state = {
+                'status': 'complete',
+                'rows': len(df),
+                'refreshed_at': datetime.datetime.now().isoformat(),
+            }
+            if incremental:
+                new_state['rows'] += state.get('rows') or 0
+            if key_column is not None:
+                key_value = None if incremental is False else state['key_value']
+                key_columns = [col for col in df.columns if str(col).lower() == key_column.lower()]
+                if len(df) > 0 and len(key_columns) > 0:
+                    key_value = _to_json_value(df[key_columns[0]].max())
+                new_state['key_value'] = key_value
+            view_controller.update_materialized_state(view_meta['id'], **new_state)
+        except Exception as e:
+            view_controller.update_materialized_state(view_meta['id'], status='error', error=str(e))
+            raise
+        return True
@@ -11,6 +11,7 @@ from mindsdb.api.mysql.mysql_proxy.utilities import (
     SqlApiException,
     logger
 )
+from mindsdb.api.mysql.mysql_proxy.utilities.materialized_views import parse_materialized_view_statement
 
 
 from mindsdb.api.mysql.mysql_proxy.executor.executor_commands import ExecuteCommands
@@ -137,7 +138,10 @@ class Executor:
             except mindsdb_sql.exceptions.ParsingException:
                 pass
 
-            result, column_info = datanode.query(sql)
+            try:
+                result, column_info = datanode.query(sql)
+            finally:
+                datanode.close()
             columns = [
                 Column(name=col['name'], type=col['type'])
                 for col in column_info
@@ -161,6 +165,10 @@ class Executor:
         sql_lower = sql.lower()
         self.sql_lower = sql_lower.replace('`', '')
 
+        self.query = parse_materialized_view_statement(sql)
+        if self.query is not None:
+            return
+
         try:
             self.query = parse_sql(sql, dialect='mindsdb')
         except Exception as mdb_error:
@@ -49,6 +49,8 @@ from mindsdb_sql.parser.ast import (
 from mindsdb_sql.render.sqlalchemy_render import SqlalchemyRender
 
 from mindsdb.api.mysql.mysql_proxy.utilities.sql import query_df
+from mindsdb.api.mysql.mysql_proxy.utilities.query_cache import invalidate_query_cache
+from mindsdb.api.mysql.mysql_proxy.utilities.materialized_views import RefreshMaterializedView
 from mindsdb.api.mysql.mysql_proxy.utilities import log
 from mindsdb.api.mysql.mysql_proxy.utilities import (
     SqlApiException,
@@ -492,6 +494,8 @@ class ExecuteCommands:
             return self.answer_create_view(statement)
         elif type(statement) == DropView:
             return self.answer_drop_view(statement)
+        elif type(statement) == RefreshMaterializedView:
+            return self.answer_refresh_materialized_view(statement)
         elif type(statement) == Delete:
             if statement.table.parts[-1].lower() == 'models_versions':
                 return self.answer_delete_model_version(statement)
@@ -671,9 +675,8 @@ class ExecuteCommands:
         status = HandlerStatusResponse(success=False)
 
         try:
-            handlers_meta = self.session.integration_controller.get_handlers_import_status()
-            handler_meta = handlers_meta[engine]
-            if handler_meta.get('import', {}).get('success') is not True:
+            handler_meta = self.session.integration_controller.get_handler_meta(engine)
+            if handler_meta is None or handler_meta.get('import', {}).get('success') is not True:
                 raise SqlApiException(f"Handler '{engine}' can not be used")
 
             accept_connection_args = handler_meta.get('connection_args')
@@ -726,7 +729,7 @@ class ExecuteCommands:
         if name in integrations:
             raise SqlApiException(f"Integration '{name}' already exists")
 
-        handler_module_meta = self.session.integration_controller.get_handlers_import_status().get(statement.handler)
+        handler_module_meta = self.session.integration_controller.get_handler_meta(statement.handler)
         if handler_module_meta is None:
             raise SqlApiException(f"There is no engine '{statement.handler}'")
         if handler_module_meta.get('import', {}).get('success') is not True:
@@ -773,6 +776,7 @@ class ExecuteCommands:
             raise Exception('Database name should contain only 1 part.')
         db_name = statement.name.parts[0]
         self.session.database_controller.delete(db_name)
+        invalidate_query_cache(db_name)
         return ExecuteAnswer(ANSWER_TYPE.OK)
 
     def answer_drop_tables(self, statement):
@@ -810,10 +814,14 @@ class ExecuteCommands:
 
             if db_name == 'files':
                 dn = self.session.datahub[db_name]
-                if dn.has_table(table_name):
-                    self.session.datahub['files'].query(
-                        DropTables(tables=[Identifier(table_name)])
-                    )
+                try:
+                    if dn.has_table(table_name):
+                        dn.query(
+                            DropTables(tables=[Identifier(table_name)])
+                        )
+                        invalidate_query_cache(db_name)
+                finally:
+                    dn.close()
             else:
                 projects_dict = self.session.database_controller.get_dict(filter_type='project')
                 if db_name not in projects_dict:
@@ -855,11 +863,44 @@ class ExecuteCommands:
             if sqlquery.fetch()['success'] is not True:
                 raise SqlApiException('Wrong view query')
 
+        materialized = getattr(statement, 'materialized', None)
+        if materialized is not None:
+            materialized = dict(
+                materialized,
+                status='created',
+                rows=0,
+                refreshed_at=None,
+                key_value=None,
+                error=None
+            )
+
         project = self.session.database_controller.get_project(project_name)
         project.create_view(
             view_name,
-            query=query_str
+            query=query_str,
+            materialized=materialized
         )
+
+        if materialized is not None:
+            # fill view with data
+            try:
+                self.session.datahub.get(project_name).refresh_view(view_name, session=self.session)
+            except Exception as e:
+                project.drop_table(view_name)
+                raise SqlApiException(f"Can't fill materialized view: {e}") from e
+        return ExecuteAnswer(answer_type=ANSWER_TYPE.OK)
+
+    def answer_refresh_materialized_view(self, statement):
+        project_name = self.session.database
+        if len(statement.name.parts) > 1:
+            project_name = statement.name.parts[0]
+        view_name = statement.name.parts[-1]
+
+        datanode = self.session.datahub.get(project_name)
+        if datanode is None or datanode.type != 'project':
+            raise SqlApiException(f"Project not found: {project_name}")
+        if datanode.refresh_view(view_name, session=self.session, full=statement.full) is False:
+            raise SqlApiException(f"Materialized view '{view_name}' is being refreshed by another query")
         return ExecuteAnswer(answer_type=ANSWER_TYPE.OK)
 
     def answer_drop_view(self, statement):
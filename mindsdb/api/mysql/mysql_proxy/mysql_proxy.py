@@ -19,6 +19,7 @@ import tempfile
 import socket
 import struct
 from functools import partial
+from itertools import islice
 import select
 import base64
 from typing import List, Dict
@@ -73,11 +74,39 @@ from mindsdb.api.mysql.mysql_proxy.data_types.mysql_packets import (
     BinaryResultsetRowPacket
 )
 
+from mindsdb.api.mysql.mysql_proxy.data_types.mysql_packets.resultset_row_package import encode_text_rows
 from mindsdb.api.mysql.mysql_proxy.executor.executor import Executor
 from mindsdb.utilities.context import context as ctx
 import mindsdb.utilities.hooks as hooks
 
 
+# size of buffer to accumulate packets before sending to socket
+SEND_BUFFER_SIZE = 64 * 1024
+
+# count of rows encoded at once
+ENCODE_BATCH_SIZE = 1000
+
+# count of rows to calculate max length of column values
+COLUMN_LENGTH_SAMPLE_SIZE = 1000
+
+# max length of text representation of values by column type.
+# is used if result is bigger than sample
+COLUMN_TYPE_LENGTH = {
+    TYPES.MYSQL_TYPE_TINY: 4,
+    TYPES.MYSQL_TYPE_SHORT: 6,
+    TYPES.MYSQL_TYPE_LONG: 20,
+    TYPES.MYSQL_TYPE_LONGLONG: 20,
+    TYPES.MYSQL_TYPE_INT24: 9,
+    TYPES.MYSQL_TYPE_FLOAT: 24,
+    TYPES.MYSQL_TYPE_DOUBLE: 24,
+    TYPES.MYSQL_TYPE_YEAR: 4,
+    TYPES.MYSQL_TYPE_DATE: 10,
+    TYPES.MYSQL_TYPE_TIME: 17,
+    TYPES.MYSQL_TYPE_DATETIME: 26,
+    TYPES.MYSQL_TYPE_TIMESTAMP: 26,
+}
+
+
 def empty_fn():
     pass
 
@@ -300,21 +329,35 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
         string = b''.join([x.accum() for x in packages])
         self.socket.sendall(string)
 
+    def send_package_stream(self, packages):
+        """ Send packets from iterable. Packets are encoded one by one and flushed
+            to socket when buffer exceeds SEND_BUFFER_SIZE, so memory usage
+            doesn't depend on count of packets
+        """
+        buffer = bytearray()
+        for package in packages:
+            buffer += package.accum()
+            if len(buffer) >= SEND_BUFFER_SIZE:
+                self.socket.sendall(buffer)
+                buffer = bytearray()
+        if len(buffer) > 0:
+            self.socket.sendall(buffer)
+
     def answer_stmt_close(self, stmt_id):
         self.session.unregister_stmt(stmt_id)
 
     def send_query_answer(self, answer: SQLAnswer):
         if answer.type == RESPONSE_TYPE.TABLE:
-            packages = []
-            packages += self.get_tabel_packets(
-                columns=answer.columns,
-                data=answer.data
-            )
-            if answer.status is not None:
-                packages.append(self.last_packet(status=answer.status))
-            else:
-                packages.append(self.last_packet())
-            self.send_package_group(packages)
+            def answer_packets():
+                yield from self.get_tabel_packets(
+                    columns=answer.columns,
+                    data=answer.data
+                )
+                if answer.status is not None:
+                    yield self.last_packet(status=answer.status)
+                else:
+                    yield self.last_packet()
+            self.send_package_stream(answer_packets())
         elif answer.type == RESPONSE_TYPE.OK:
             self.packet(OkPacket, state_track=answer.state_track).send()
         elif answer.type == RESPONSE_TYPE.ERROR:
@@ -324,6 +367,27 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
                 msg=answer.error_message
             ).send()
 
+    @staticmethod
+    def _get_column_length(column, i, data):
+        """ Max length of column values. Only sample of rows is checked,
+            if data is bigger than sample: length by column type is used as a lower bound
+        """
+        if not isinstance(data, list) or len(data) == 0:
+            # can't scan iterator without consuming it
+            return 0xffff
+
+        column_alias = column.get('alias', column.get('name', 'column_name'))
+        length = 1
+        for row in data[:COLUMN_LENGTH_SAMPLE_SIZE]:
+            if isinstance(row, dict):
+                length = max(len(str(row[column_alias])), length)
+            else:
+                length = max(len(str(row[i])), length)
+
+        if len(data) > COLUMN_LENGTH_SAMPLE_SIZE:
+            length = max(length, COLUMN_TYPE_LENGTH.get(column['type'], 0xffff))
+        return length
+
     def _get_column_defenition_packets(self, columns, data=None):
         if data is None:
             data = []
@@ -333,15 +397,7 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
             column_name = column.get('name', 'column_name')
             column_alias = column.get('alias', column_name)
             flags = column.get('flags', 0)
-            if len(data) == 0:
-                length = 0xffff
-            else:
-                length = 1
-                for row in data:
-                    if isinstance(row, dict):
-                        length = max(len(str(row[column_alias])), length)
-                    else:
-                        length = max(len(str(row[i])), length)
+            length = self._get_column_length(column, i, data)
 
             packets.append(
                 self.packet(
@@ -360,15 +416,23 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
         return packets
 
     def get_tabel_packets(self, columns, data, status=0):
+        # generator: packets must be created in order of sending (sequence number),
+        #   rows packets are created only when they are consumed
         # TODO remove columns order
-        packets = [self.packet(ColumnCountPacket, count=len(columns))]
-        packets.extend(self._get_column_defenition_packets(columns, data))
+        yield self.packet(ColumnCountPacket, count=len(columns))
+        yield from self._get_column_defenition_packets(columns, data)
 
         if self.client_capabilities.DEPRECATE_EOF is False:
-            packets.append(self.packet(EofPacket, status=status))
+            yield self.packet(EofPacket, status=status)
 
-        packets += [self.packet(ResultsetRowPacket, data=x) for x in data]
-        return packets
+        # rows are encoded by batches
+        data = iter(data)
+        while True:
+            rows = list(islice(data, ENCODE_BATCH_SIZE))
+            if len(rows) == 0:
+                break
+            for body in encode_text_rows(rows):
+                yield self.packet(ResultsetRowPacket, encoded_body=body)
 
     def decode_utf(self, text):
         try:
@@ -0,0 +1,83 @@
+"""
+Statements of materialized views. They are not supported by mindsdb_sql parser yet, so they are
+recognized here and converted into AST:
+
+    CREATE MATERIALIZED VIEW [project.]name (select ...)
+        [USING refresh_interval = 3600, key_column = 'id']
+
+    REFRESH MATERIALIZED VIEW [project.]name [FULL]
+
+refresh_interval - data older than this count of seconds is refreshed on read
+key_column - monotonic column of the view: refresh loads only rows with value greater
+    than the last loaded one. 'FULL' forces reload of all rows
+"""
+
+import re
+from typing import Optional
+
+from mindsdb_sql import parse_sql
+from mindsdb_sql.parser.ast import Identifier
+from mindsdb_sql.parser.ast.base import ASTNode
+from mindsdb_sql.parser.dialects.mindsdb import CreateView
+
+from mindsdb.api.mysql.mysql_proxy.utilities import SqlApiException
+
+MATERIALIZED_VIEW_OPTIONS = ('refresh_interval', 'key_column')
+
+_create_re = re.compile(r'^\s*create\s+materialized\s+view\s+', re.IGNORECASE)
+_refresh_re = re.compile(r'^\s*refresh\s+materialized\s+view\s+([\w.`]+)(\s+full)?\s*;?\s*$', re.IGNORECASE)
+_using_re = re.compile(r'\)\s*using\s+([^()]*?)\s*;?\s*$', re.IGNORECASE | re.DOTALL)
+_option_re = re.compile(r'''(\w+)\s*=\s*('[^']*'|"[^"]*"|[\w.]+)''')
+
+
+class RefreshMaterializedView(ASTNode):
+    def __init__(self, name: Identifier, full: bool = False, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.name = name
+        self.full = full
+
+    def get_string(self, *args, **kwargs):
+        full_str = ' FULL' if self.full else ''
+        return f'REFRESH MATERIALIZED VIEW {self.name.to_string()}{full_str}'
+
+
+def _parse_options(options_str: str) -> dict:
+    options = {}
+    for key, value in _option_re.findall(options_str):
+        key = key.lower()
+        if key not in MATERIALIZED_VIEW_OPTIONS:
+            raise SqlApiException(f'Unknown option of materialized view: {key}')
+        if value[0] in ('"', "'"):
+            value = value[1:-1]
+        elif value.isdigit():
+            value = int(value)
+        options[key] = value
+    return options
+
+
+def parse_materialized_view_statement(sql: str) -> Optional[ASTNode]:
+    """ returns AST of statement of materialized view, or None if it is not such statement """
+    match = _refresh_re.match(sql)
+    if match is not None:
+        parts = [part.strip('`') for part in match.group(1).split('.')]
+        return RefreshMaterializedView(Identifier(parts=parts), full=match.group(2) is not None)
+
+    if _create_re.match(sql) is None:
+        return None
+
+    sql = _create_re.sub('create view ', sql, count=1)
+    options = {}
+    match = _using_re.search(sql)
+    if match is not None:
+        options = _parse_options(match.group(1))
+        sql = sql[:match.start()] + ')'
+
+    statement = parse_sql(sql, dialect='mindsdb')
+    if not isinstance(statement, CreateView):
+        raise SqlApiException(f'Wrong statement of materialized view: {sql}')
+
+    statement.materialized = {
+        'refresh_interval': options.get('refresh_interval'),
+        'key_column': options.get('key_column')
+    }
+    return statement
@@ -0,0 +1,127 @@
+"""
+Opt-in in-process cache of query results.
+
+Two levels are cached:
+    - 'plan': final result of whole SELECT, key is normalized query + current database
+    - 'step': result of FetchDataframeStep, key is integration + normalized query to it
+
+Lists of tables and columns of integrations for information_schema are kept in the 'schema'
+cache. It is not controlled by 'query_cache' config, see InformationSchemaDataNode.
+
+Every entry is tagged with integrations it was read from. Entries are dropped when
+TTL expires or when data of the integration is changed through mindsdb
+(INSERT, UPDATE, CREATE TABLE, DROP TABLE, DROP DATABASE, native query)
+
+Configuration:
+    "query_cache": {
+        "enabled": true,
+        "ttl": 60,
+        "max_entries": 1000,
+        "integrations": {
+            "my_postgres": {"ttl": 10},
+            "my_mysql": {"ttl": 0}  # not cached
+        }
+    }
+
+Counters are available in information_schema.query_cache
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from mindsdb.utilities.config import Config
+from mindsdb.utilities.context import context as ctx
+
+
+def get_query_cache_config() -> dict:
+    return Config().get('query_cache', {})
+
+
+def get_integration_ttl(integration_name: str) -> int:
+    """ TTL for results of integration in seconds, 0 if results are not cached """
+    config = get_query_cache_config()
+    if config.get('enabled', False) is not True:
+        return 0
+    integrations = {k.lower(): v for k, v in config.get('integrations', {}).items()}
+    integration_config = integrations.get(integration_name.lower(), {})
+    return integration_config.get('ttl', config.get('ttl', 60))
+
+
+class QueryCache:
+    def __init__(self, name: str):
+        self.name = name
+        # key -> (expire_at, sources, value)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _source(integration_name):
+        return ctx.company_id, integration_name.lower()
+
+    def get(self, key) -> Optional[object]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def set(self, key, value, integrations: list, ttl: int):
+        if ttl <= 0:
+            return
+        max_entries = get_query_cache_config().get('max_entries', 1000)
+        sources = set(self._source(name) for name in integrations)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, sources, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, integration_name: str):
+        source = self._source(integration_name)
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if source in entry[1]]
+            for key in keys:
+                del self._entries[key]
+            self.invalidations += len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'name': self.name,
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations
+            }
+
+
+plan_cache = QueryCache('plan')
+step_cache = QueryCache('step')
+schema_cache = QueryCache('schema')
+
+
+def invalidate_query_cache(integration_name: str):
+    """ drop cached results which were read from integration """
+    plan_cache.invalidate(integration_name)
+    step_cache.invalidate(integration_name)
+    schema_cache.invalidate(integration_name)
+
+
+def get_query_cache_stats() -> list:
+    return [plan_cache.stats(), step_cache.stats(), schema_cache.stats()]
@@ -1,4 +1,5 @@
 import copy
+import threading
 
 import duckdb
 import numpy as np
@@ -14,12 +15,62 @@ from mindsdb_sql.parser.ast import (
 from mindsdb.utilities import log
 
 
-def query_df(df, query, session=None):
+_duckdb_local = threading.local()
+
+
+def get_duckdb_connection():
+    """ Returns in-memory duckdb connection of the current thread.
+        It is created once and reused by all queries executed in the thread,
+        connections can't be shared between threads.
+    """
+    con = getattr(_duckdb_local, 'connection', None)
+    if con is None:
+        con = duckdb.connect(database=':memory:')
+        _duckdb_local.connection = con
+    return con
+
+
+def execute_duckdb(query_str, tables):
+    """ Execute query in duckdb of the current thread
+
+        Args:
+            query_str (str): query in duckdb dialect
+            tables (dict): name -> pandas.DataFrame, registered for the time of the query.
+                registration doesn't copy the data
+
+        Returns:
+            pandas.DataFrame
+    """
+    con = get_duckdb_connection()
+    for name, df in tables.items():
+        con.register(name, df)
+    try:
+        result_df = con.execute(query_str).fetchdf()
+        description = con.description
+    finally:
+        for name in tables.keys():
+            con.unregister(name)
+
+    # duckdb can change names of columns (duplicates), restore them
+    new_column_names = {}
+    real_column_names = [x[0] for x in description]
+    for i, duck_column_name in enumerate(result_df.columns):
+        new_column_names[duck_column_name] = real_column_names[i]
+    result_df = result_df.rename(
+        new_column_names,
+        axis='columns'
+    )
+    return result_df
+
+
+def query_df(df, query, session=None, replace_nan=True):
     """ Perform simple query ('select' from one table, without subqueries and joins) on DataFrame.
 
         Args:
             df (pandas.DataFrame): data
             query (mindsdb_sql.parser.ast.Select | str): select query
+            replace_nan (bool): replace NaN with None in result. Not needed if result is
+                put into ResultSet, it does it on converting to records
 
         Returns:
             pandas.DataFrame
@@ -69,20 +120,7 @@ def query_df(df, query, session=None):
         )
         query_str = render.get_string(query_ast, with_failback=True)
 
-    con = duckdb.connect(database=':memory:')
-    con.register('df_table', df)
-    result_df = con.execute(query_str).fetchdf()
-    result_df = result_df.replace({np.nan: None})
-    description = con.description
-    con.unregister('df_table')
-    con.close()
-
-    new_column_names = {}
-    real_column_names = [x[0] for x in description]
-    for i, duck_column_name in enumerate(result_df.columns):
-        new_column_names[duck_column_name] = real_column_names[i]
-    result_df = result_df.rename(
-        new_column_names,
-        axis='columns'
-    )
+    result_df = execute_duckdb(query_str, {'df_table': df})
+    if replace_nan:
+        result_df = result_df.replace({np.nan: None})
     return result_df
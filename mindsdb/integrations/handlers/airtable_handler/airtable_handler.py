@@ -26,6 +26,9 @@ class AirtableHandler(DatabaseHandler):
 
     name = 'airtable'
 
+    # connection can be used only in the thread where it was created
+    poolable = False
+
     def __init__(self, name: str, connection_data: Optional[dict], **kwargs):
         """
         Initialize the handler.
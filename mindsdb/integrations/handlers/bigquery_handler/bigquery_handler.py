@@ -84,8 +84,9 @@ class BigQueryHandler(DatabaseHandler):
         client = self.connect()
         try:
             query = client.query(query)
-            result = query.to_dataframe()
-            if not result.empty:
+            # columnar result, it is converted to pandas only when it is needed
+            result = query.to_arrow()
+            if result.num_rows > 0:
                 response = Response(
                     RESPONSE_TYPE.TABLE,
                     result
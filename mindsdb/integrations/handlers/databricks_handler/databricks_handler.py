@@ -128,14 +128,20 @@ class DatabricksHandler(DatabaseHandler):
         with connection.cursor() as cursor:
             try:
                 cursor.execute(query)
-                result = cursor.fetchall()
-                if result:
-                    response = Response(
-                        RESPONSE_TYPE.TABLE,
-                        data_frame=pd.DataFrame(
+                if hasattr(cursor, 'fetchall_arrow'):
+                    # result is fetched in arrow format, without conversion to rows
+                    result = cursor.fetchall_arrow()
+                else:
+                    result = cursor.fetchall()
+                    if result:
+                        result = pd.DataFrame(
                             result,
                             columns=[x[0] for x in cursor.description]
                         )
+                if result is not None and len(result) > 0:
+                    response = Response(
+                        RESPONSE_TYPE.TABLE,
+                        data_frame=result
                     )
 
                 else:
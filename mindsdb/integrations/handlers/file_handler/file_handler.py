@@ -9,6 +9,8 @@ from urllib.parse import urlparse
 
 import requests
 import pandas as pd
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from charset_normalizer import from_bytes
 
 from mindsdb_sql import parse_sql
@@ -24,15 +26,31 @@ from mindsdb.integrations.libs.response import (
 )
 
 
-def clean_row(row):
-    n_row = []
-    for cell in row:
-        if str(cell) in ['', ' ', '  ', 'NaN', 'nan', 'NA']:
-            n_row.append(None)
-        else:
-            n_row.append(cell)
-
-    return n_row
+NULL_VALUES = ['', ' ', '  ', 'NaN', 'nan', 'NA']
+# count of rows parsed at once on file upload
+CHUNK_SIZE = 100000
+# size of the beginning of the file used to detect its encoding and dialect
+SAMPLE_SIZE = 32 * 1024
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def clean_df(df: pd.DataFrame) -> pd.DataFrame:
+    """ replace null values of text columns with None and infer types of cleaned columns """
+    columns = {}
+    changed = False
+    for i, dtype in enumerate(df.dtypes):
+        column = df.iloc[:, i]
+        if dtype == object:
+            is_null = column.isna() | column.isin(NULL_VALUES)
+            if is_null.any():
+                column = column.where(~is_null, None)
+                changed = True
+        columns[i] = column
+    if not changed:
+        return df
+    cleaned_df = pd.DataFrame(columns, index=df.index)
+    cleaned_df.columns = df.columns
+    return cleaned_df.infer_objects()
 
 
 class FileHandler(DatabaseHandler):
@@ -77,9 +95,17 @@ class FileHandler(DatabaseHandler):
             return Response(RESPONSE_TYPE.OK)
         elif type(query) == Select:
             table_name = query.from_table.parts[-1]
-            file_path = self.file_controller.get_file_path(table_name)
-            df, _columns = self._handle_source(file_path, self.clean_rows, self.custom_parser)
-            result_df = query_df(df, query)
+            data_path = None
+            if self.custom_parser is None and self.clean_rows:
+                # data parsed on upload with default options
+                data_path = self.file_controller.get_file_data_path(table_name)
+            if data_path is not None:
+                # duckdb pushes filters and projection to the scan of dataset
+                data = ds.dataset(data_path, format='parquet')
+            else:
+                file_path = self.file_controller.get_file_path(table_name)
+                data, _columns = self._handle_source(file_path, self.clean_rows, self.custom_parser)
+            result_df = query_df(data, query)
             return Response(
                 RESPONSE_TYPE.TABLE,
                 data_frame=result_df
@@ -100,167 +126,189 @@ class FileHandler(DatabaseHandler):
         data, fmt, dialect = FileHandler._get_data_io(file_path)
         data.seek(0)  # make sure we are at 0 in file pointer
 
+        # null tokens are recognized by parser where it is possible
+        na_values = NULL_VALUES if clean_rows else None
+
         if custom_parser:
             header, file_data = custom_parser(data, fmt)
+            df = pd.DataFrame(file_data, columns=header)
 
         elif fmt == 'parquet':
             df = pd.read_parquet(data)
-            header = df.columns.values.tolist()
-            file_data = df.values.tolist()
 
         elif fmt == 'csv':
-            df = pd.read_csv(data, sep=dialect.delimiter)
-            header = df.columns.values.tolist()
-            file_data = df.values.tolist()
+            df = pd.read_csv(data, sep=dialect.delimiter, na_values=na_values)
 
         elif fmt in ['xlsx', 'xls']:
             data.seek(0)
-            df = pd.read_excel(data)
-            header = df.columns.values.tolist()
-            file_data = df.values.tolist()
+            df = pd.read_excel(data, na_values=na_values)
 
         elif fmt == 'json':
             data.seek(0)
             json_doc = json.loads(data.read())
             df = pd.json_normalize(json_doc, max_level=0)
-            header = df.columns.values.tolist()
-            file_data = df.values.tolist()
 
         else:
             raise ValueError('Could not load file into any format, supported formats are csv, json, xls, xlsx')
 
         if clean_rows:
-            file_list_data = [clean_row(row) for row in file_data]
-        else:
-            file_list_data = file_data
+            df = clean_df(df)
 
-        header = [x.strip() for x in header]
+        header = [x.strip() for x in df.columns]
+        df.columns = header
         col_map = dict((col, col) for col in header)
-        return pd.DataFrame(file_list_data, columns=header), col_map
+        return df, col_map
 
     @staticmethod
-    def _get_data_io(file_path):
+    def _iter_source(file_path, clean_rows=True, chunk_size=CHUNK_SIZE, progress_callback=None):
+        """ Parse the file by chunks of rows, only one chunk is in memory at a time.
+            Formats which can't be read partially (json, xls, xlsx) are returned as one chunk.
+
+            Args:
+                file_path (str): path to the file
+                clean_rows (bool): replace null values with None
+                chunk_size (int): count of rows in chunk
+                progress_callback (callable): is called with count of read bytes and size of file
+                    after every chunk
+
+            Yields:
+                pandas.DataFrame
         """
-        This gets a file either url or local file and defines what the format is as well as dialect
-        :param file: file path or url
-        :return: data_io, format, dialect
-        """
-
-        ############
-        # get file as io object
-        ############
-
-        # file_path = self._get_file_path()
+        fmt, dialect, encoding = FileHandler._get_file_format(file_path)
+        file_size = os.path.getsize(file_path)
+        na_values = NULL_VALUES if clean_rows else None
+
+        with open(file_path, 'rb') as fp:
+            if fmt == 'csv':
+                chunks = pd.read_csv(
+                    fp,
+                    sep=dialect.delimiter,
+                    encoding=encoding,
+                    encoding_errors='replace',
+                    na_values=na_values,
+                    chunksize=chunk_size
+                )
+            elif fmt == 'parquet':
+                parquet_file = pq.ParquetFile(fp)
+                chunks = (batch.to_pandas() for batch in parquet_file.iter_batches(batch_size=chunk_size))
+            elif fmt in ['xlsx', 'xls']:
+                chunks = [pd.read_excel(fp, na_values=na_values)]
+            elif fmt == 'json':
+                json_doc = json.loads(fp.read().decode(encoding, 'replace'))
+                chunks = [pd.json_normalize(json_doc, max_level=0)]
+            else:
+                raise ValueError('Could not load file into any format, supported formats are csv, json, xls, xlsx')
 
-        data = BytesIO()
+            for df in chunks:
+                if clean_rows:
+                    df = clean_df(df)
+                df.columns = [x.strip() for x in df.columns]
+                if progress_callback is not None:
+                    progress_callback(fp.tell(), file_size)
+                yield df
 
+    @staticmethod
+    def _get_file_format(file_path):
+        """
+        Defines format of the file by its signature and a sample from its beginning,
+        the file is not read entirely
+        :param file_path: path to the file
+        :return: format, dialect, encoding
+        """
         try:
-            with open(file_path, 'rb') as fp:
-                data = BytesIO(fp.read())
+            fp = open(file_path, 'rb')
         except Exception as e:
             error = 'Could not load file, possible exception : {exception}'.format(exception=e)
             print(error)
             raise ValueError(error)
 
-        dialect = None
-
-        ############
-        # check for file type
-        ############
-
-        # Check first and last 4 bytes equal to PAR1.
-        # Refer: https://parquet.apache.org/docs/file-format/
-        parquet_sig = b'PAR1'
-        data.seek(0, 0)
-        start_meta = data.read(4)
-        data.seek(-4, 2)
-        end_meta = data.read()
-        data.seek(0)
-        if start_meta == parquet_sig and end_meta == parquet_sig:
-            return data, 'parquet', None
+        with fp:
+            file_size = os.fstat(fp.fileno()).st_size
+
+            # Check first and last 4 bytes equal to PAR1.
+            # Refer: https://parquet.apache.org/docs/file-format/
+            parquet_sig = b'PAR1'
+            start_meta = fp.read(4)
+            end_meta = None
+            if file_size >= 8:
+                fp.seek(-4, 2)
+                end_meta = fp.read(4)
+            if start_meta == parquet_sig and end_meta == parquet_sig:
+                return 'parquet', None, None
+
+            # try to guess if its an excel file
+            xlsx_sig = b'\x50\x4B\x05\06'
+            xls_sig = b'\x09\x08\x10\x00\x00\x06\x05\x00'
+
+            if file_size >= 512 + 8:
+                fp.seek(512)
+                if fp.read(8) == xls_sig:
+                    return 'xls', None, None
+            if file_size >= 22:
+                fp.seek(-22, 2)
+                if fp.read(4) == xlsx_sig:
+                    return 'xlsx', None, None
+
+            # if not excel it can be a json file or a CSV
+            fp.seek(0)
+            sample = fp.read(SAMPLE_SIZE)
+
+        # Handle Microsoft's BOM "special" UTF-8 encoding
+        if sample.startswith(codecs.BOM_UTF8):
+            encoding = 'utf-8-sig'
         else:
-            print("It's not parquet file. Checking for other formats")
-
-        # try to guess if its an excel file
-        xlsx_sig = b'\x50\x4B\x05\06'
-        # xlsx_sig2 = b'\x50\x4B\x03\x04'
-        xls_sig = b'\x09\x08\x10\x00\x00\x06\x05\x00'
-
-        # different whence, offset, size for different types
-        excel_meta = [('xls', 0, 512, 8), ('xlsx', 2, -22, 4)]
-
-        for filename, whence, offset, size in excel_meta:
-
-            try:
-                data.seek(offset, whence)  # Seek to the offset.
-                bytes = data.read(size)  # Capture the specified number of bytes.
-                data.seek(0)
-                codecs.getencoder('hex')(bytes)
-
-                if bytes == xls_sig:
-                    return data, 'xls', dialect
-                elif bytes == xlsx_sig:
-                    return data, 'xlsx', dialect
-
-            except Exception:
-                data.seek(0)
-
-        # if not excel it can be a json file or a CSV, convert from binary to stringio
-
-        byte_str = data.read()
-        # Move it to StringIO
-        try:
-            # Handle Microsoft's BOM "special" UTF-8 encoding
-            if byte_str.startswith(codecs.BOM_UTF8):
-                data = StringIO(byte_str.decode('utf-8-sig'))
+            file_encoding_meta = from_bytes(
+                sample,
+                steps=32,           # Number of steps/block to extract from my_byte_str
+                chunk_size=1024,    # Set block size of each extraction)
+                explain=False
+            )
+            best_meta = file_encoding_meta.best()
+            if best_meta is not None:
+                encoding = best_meta.encoding
             else:
-                file_encoding_meta = from_bytes(
-                    byte_str[:32 * 1024],
-                    steps=32,           # Number of steps/block to extract from my_byte_str
-                    chunk_size=1024,    # Set block size of each extraction)
-                    explain=False
-                )
-                best_meta = file_encoding_meta.best()
-                errors = 'strict'
-                if best_meta is not None:
-                    encoding = file_encoding_meta.best().encoding
-                else:
-                    encoding = 'utf-8'
-                    errors = 'replace'
-                data = StringIO(byte_str.decode(encoding, errors))
-        except Exception:
-            print(traceback.format_exc())
-            print('Could not load into string')
+                encoding = 'utf-8'
+        # sample can end in the middle of a character
+        text = sample.decode(encoding, 'ignore')
 
         # see if its JSON
-        buffer = data.read(100)
-        data.seek(0)
-        text = buffer.strip()
-        # analyze first n characters
-        if len(text) > 0:
-            text = text.strip()
-            # it it looks like a json, then try to parse it
-            if text.startswith('{') or text.startswith('['):
-                try:
-                    json.loads(data.read())
-                    data.seek(0)
-                    return data, 'json', dialect
-                except Exception:
-                    data.seek(0)
-                    return data, None, dialect
+        if text.strip().startswith(('{', '[')):
+            return 'json', None, encoding
 
         # lets try to figure out if its a csv
         try:
-            dialect = FileHandler._get_csv_dialect(data)
-            if dialect:
-                return data, 'csv', dialect
-            return data, None, dialect
+            dialect = FileHandler._get_csv_dialect(StringIO(text))
         except Exception:
-            data.seek(0)
             print('Could not detect format for this file')
             print(traceback.format_exc())
-            # No file type identified
-            return data, None, dialect
+            dialect = None
+        if dialect is None:
+            return None, None, encoding
+        return 'csv', dialect, encoding
+
+    @staticmethod
+    def _get_data_io(file_path):
+        """
+        This gets a file either url or local file and defines what the format is as well as dialect
+        :param file: file path or url
+        :return: data_io, format, dialect
+        """
+        fmt, dialect, encoding = FileHandler._get_file_format(file_path)
+
+        with open(file_path, 'rb') as fp:
+            byte_str = fp.read()
+
+        if fmt in ('parquet', 'xls', 'xlsx'):
+            return BytesIO(byte_str), fmt, dialect
+
+        data = StringIO(byte_str.decode(encoding, 'replace'))
+        if fmt == 'json':
+            try:
+                json.loads(data.read())
+            except Exception:
+                fmt = None
+            data.seek(0)
+        return data, fmt, dialect
 
     @staticmethod
     def _get_file_path(path) -> str:
@@ -293,7 +341,7 @@ class FileHandler(DatabaseHandler):
             r = requests.get(url, stream=True)
             if r.status_code == 200:
                 with open(os.path.join(temp_dir, 'file'), 'wb') as f:
-                    for chunk in r:
+                    for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                         f.write(chunk)
             else:
                 raise Exception(f'Responce status code is {r.status_code}')
@@ -320,12 +368,15 @@ class FileHandler(DatabaseHandler):
 
     def get_columns(self, table_name) -> Response:
         file_meta = self.file_controller.get_file_meta(table_name)
+        types = {}
+        if file_meta.get('metadata') is not None:
+            types = {x['name']: x['type'] for x in file_meta['metadata']['schema']}
         result = Response(
             RESPONSE_TYPE.TABLE,
             data_frame=pd.DataFrame([
                 {
                     'Field': x.strip(),
-                    'Type': 'str'
+                    'Type': types.get(x, 'str')
                 } for x in file_meta['columns']
             ])
         )
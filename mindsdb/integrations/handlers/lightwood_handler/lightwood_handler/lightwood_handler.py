@@ -3,6 +3,7 @@ import json
 import copy
 from typing import Optional, Dict
 from datetime import datetime
+from contextlib import nullcontext
 
 import pandas as pd
 from type_infer.dtype import dtype
@@ -14,6 +15,7 @@ import mindsdb.interfaces.storage.db as db
 from mindsdb.utilities.functions import cast_row_types
 # from mindsdb.utilities.hooks import after_predict as after_predict_hook
 from mindsdb.interfaces.model.functions import get_model_record
+from mindsdb.interfaces.model.model_cache import get_model_cache, get_path_size
 from mindsdb.interfaces.storage.json import get_json_storage
 from mindsdb.integrations.libs.base import BaseMLEngine
 
@@ -82,15 +84,25 @@ class LightwoodHandler(BaseMLEngine):
         predictor_code = args['code']
         learn_args = args['learn_args']
         pred_args = args.get('predict_params', {})
-        self.model_storage.fileStorage.pull()
 
-        predictor = lightwood.predictor_from_state(
-            self.model_storage.fileStorage.folder_path / self.model_storage.fileStorage.folder_name,
-            predictor_code
-        )
+        model_cache = get_model_cache()
+        cache_key = args.get('model_cache_key')
+        predictor, lock = None, None
+        if cache_key is not None:
+            predictor, lock = model_cache.get_with_lock(cache_key)
+
+        if predictor is None:
+            self.model_storage.fileStorage.pull()
+
+            predictor_path = self.model_storage.fileStorage.folder_path / self.model_storage.fileStorage.folder_name
+            predictor = lightwood.predictor_from_state(predictor_path, predictor_code)
+            if cache_key is not None:
+                lock = model_cache.set(cache_key, predictor, size=get_path_size(predictor_path))
         dtype_dict = predictor.dtype_dict
 
-        predictions = predictor.predict(df, args=pred_args)
+        # cached predictor is shared between threads, predict() keeps its arguments in the predictor
+        with lock or nullcontext():
+            predictions = predictor.predict(df, args=pred_args)
         predictions = predictions.to_dict(orient='records')
 
         # TODO!!!
@@ -7,9 +7,12 @@ from sqlalchemy import create_engine
 from mindsdb_sql import parse_sql
 from mindsdb_sql.render.sqlalchemy_render import SqlalchemyRender
 from mindsdb_sql.parser.ast.base import ASTNode
+from mindsdb_sql.parser.ast import Identifier
 
 from mindsdb.utilities import log
-from mindsdb.integrations.libs.base import DatabaseHandler
+from mindsdb.integrations.libs.base import (
+    DatabaseHandler, STREAM_BATCH_SIZE, BULK_INSERT_BATCH_SIZE, iter_cursor_batches, iter_df_batches, df_to_rows
+)
 from mindsdb.integrations.libs.response import (
     HandlerStatusResponse as StatusResponse,
     HandlerResponse as Response,
@@ -138,6 +141,78 @@ class MySQLHandler(DatabaseHandler):
 
         return response
 
+    def native_query_stream(self, query: str, batch_size: int = STREAM_BATCH_SIZE):
+        """
+        Runs SQL query in unbuffered cursor and yields its result by batches of rows
+        :param query: The SQL query to run in MySQL
+        :param batch_size: max count of rows in batch
+        """
+        need_to_close = self.is_connected is False
+
+        connection = self.connect()
+        cur = connection.cursor(buffered=False)
+        committed = False
+        try:
+            cur.execute(query)
+            if cur.with_rows:
+                yield from iter_cursor_batches(cur, batch_size)
+            connection.commit()
+            committed = True
+        except Exception:
+            log.logger.error(f'Error running query: {query} on {self.connection_data["database"]}!')
+            raise
+        finally:
+            # rows which were not read block the connection
+            if connection.unread_result:
+                connection.consume_results()
+            cur.close()
+            # error or the stream was not read to the end: don't leave transaction open
+            if not committed:
+                connection.rollback()
+            if need_to_close is True:
+                self.disconnect()
+
+    def bulk_insert(self, table_name: Identifier, df: pd.DataFrame,
+                    batch_size: int = BULK_INSERT_BATCH_SIZE) -> Response:
+        """
+        Writes rows of dataframe into the table in one transaction. executemany sends every
+        batch as one multi-row INSERT
+        :param table_name: name of existing table
+        :param df: rows to insert, names of columns are names of table's columns
+        :param batch_size: count of rows in one INSERT
+        """
+        def quote(name):
+            name = str(name).replace('`', '``')
+            return f'`{name}`'
+
+        insert_query = 'INSERT INTO {} ({}) VALUES ({})'.format(
+            '.'.join(quote(part) for part in table_name.parts),
+            ', '.join(quote(col) for col in df.columns),
+            ', '.join(['%s'] * len(df.columns))
+        )
+
+        need_to_close = self.is_connected is False
+
+        connection = self.connect()
+        with connection.cursor() as cur:
+            try:
+                for batch in iter_df_batches(df, batch_size):
+                    cur.executemany(insert_query, df_to_rows(batch))
+                connection.commit()
+                response = Response(RESPONSE_TYPE.OK)
+            except Exception as e:
+                log.logger.error(f'Error loading data into {table_name} on {self.connection_data["database"]}!')
+                response = Response(
+                    RESPONSE_TYPE.ERROR,
+                    error_message=str(e)
+                )
+                connection.rollback()
+
+        if need_to_close is True:
+            self.disconnect()
+
+        return response
+
     def query(self, query: ASTNode) -> Response:
         """
         Retrieve the data from the SQL statement.
@@ -146,6 +221,11 @@ class MySQLHandler(DatabaseHandler):
         query_str = renderer.get_string(query, with_failback=True)
         return self.native_query(query_str)
 
+    def query_stream(self, query: ASTNode, batch_size: int = STREAM_BATCH_SIZE):
+        renderer = SqlalchemyRender('mysql')
+        query_str = renderer.get_string(query, with_failback=True)
+        return self.native_query_stream(query_str, batch_size)
+
     def get_tables(self) -> Response:
         """
         Get a list with all of the tabels in MySQL
@@ -1,12 +1,19 @@
+import uuid
+
 import psycopg
+from psycopg import sql
 from psycopg.pq import ExecStatus
 from pandas import DataFrame
+from pandas.api import types as pd_types
 
 from mindsdb_sql import parse_sql
 from mindsdb_sql.render.sqlalchemy_render import SqlalchemyRender
 from mindsdb_sql.parser.ast.base import ASTNode
+from mindsdb_sql.parser.ast import Identifier
 
-from mindsdb.integrations.libs.base import DatabaseHandler
+from mindsdb.integrations.libs.base import (
+    DatabaseHandler, STREAM_BATCH_SIZE, BULK_INSERT_BATCH_SIZE, iter_cursor_batches, iter_df_batches
+)
 from mindsdb.utilities import log
 from mindsdb.integrations.libs.response import (
     HandlerStatusResponse as StatusResponse,
@@ -125,6 +132,80 @@ class PostgresHandler(DatabaseHandler):
 
         return response
 
+    def native_query_stream(self, query: str, batch_size: int = STREAM_BATCH_SIZE):
+        """
+        Runs SELECT query in server-side cursor and yields its result by batches of rows
+        :param query: The SQL query to run in PostgreSQL
+        :param batch_size: max count of rows in batch
+        """
+        need_to_close = self.is_connected is False
+
+        connection = self.connect()
+        committed = False
+        try:
+            with connection.cursor(name=f'mindsdb_{uuid.uuid4().hex}') as cur:
+                cur.execute(query)
+                yield from iter_cursor_batches(cur, batch_size)
+            connection.commit()
+            committed = True
+        except Exception:
+            log.logger.error(f'Error running query: {query} on {self.database}!')
+            raise
+        finally:
+            # error or the stream was not read to the end: don't leave transaction open
+            if not committed and not connection.closed:
+                connection.rollback()
+            if need_to_close is True:
+                self.disconnect()
+
+    def bulk_insert(self, table_name: Identifier, df: DataFrame,
+                    batch_size: int = BULK_INSERT_BATCH_SIZE) -> Response:
+        """
+        Loads rows of dataframe into the table with COPY FROM STDIN, in one transaction
+        :param table_name: name of existing table
+        :param df: rows to insert, names of columns are names of table's columns
+        :param batch_size: count of rows serialized at once
+        """
+        need_to_close = self.is_connected is False
+
+        copy_query = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv, NULL '\\N')").format(
+            sql.Identifier(*table_name.parts),
+            sql.SQL(', ').join(sql.Identifier(str(col)) for col in df.columns)
+        )
+
+        connection = self.connect()
+        try:
+            with connection.cursor() as cur:
+                with cur.copy(copy_query) as copy:
+                    for batch in iter_df_batches(df, batch_size):
+                        copy.write(self._to_copy_csv(batch))
+            connection.commit()
+            response = Response(RESPONSE_TYPE.OK)
+        except Exception as e:
+            log.logger.error(f'Error loading data into {table_name} on {self.database}!')
+            response = Response(
+                RESPONSE_TYPE.ERROR,
+                error_code=0,
+                error_message=str(e)
+            )
+            connection.rollback()
+
+        if need_to_close is True:
+            self.disconnect()
+
+        return response
+
+    @staticmethod
+    def _to_copy_csv(df: DataFrame) -> str:
+        df = df.copy(deep=False)
+        for col, dtype in df.dtypes.items():
+            # integers with nulls are float in pandas, COPY doesn't accept '1.0' for integer column
+            if pd_types.is_float_dtype(dtype):
+                not_null = df[col].dropna()
+                if len(not_null) > 0 and (not_null % 1 == 0).all():
+                    df[col] = df[col].astype('Int64')
+        return df.to_csv(header=False, index=False, na_rep='\\N')
+
     def query(self, query: ASTNode) -> Response:
         """
         Retrieve the data from the SQL statement with eliminated rows that dont satisfy the WHERE condition
@@ -132,6 +213,10 @@ class PostgresHandler(DatabaseHandler):
         query_str = self.renderer.get_string(query, with_failback=True)
         return self.native_query(query_str)
 
+    def query_stream(self, query: ASTNode, batch_size: int = STREAM_BATCH_SIZE):
+        query_str = self.renderer.get_string(query, with_failback=True)
+        return self.native_query_stream(query_str, batch_size)
+
     def get_tables(self) -> Response:
         """
         List all tabels in PostgreSQL without the system tables information_schema and pg_catalog
@@ -28,6 +28,9 @@ class SheetsHandler(DatabaseHandler):
 
     name = 'sheets'
 
+    # connection can be used only in the thread where it was created
+    poolable = False
+
     def __init__(self, name: str, connection_data: Optional[dict], **kwargs):
         """
         Initialize the handler.
@@ -1,5 +1,6 @@
 from pandas import DataFrame
 from snowflake import connector
+from snowflake.connector.errors import NotSupportedError
 from snowflake.sqlalchemy import snowdialect
 
 from mindsdb_sql.render.sqlalchemy_render import SqlalchemyRender
@@ -84,18 +85,24 @@ class SnowflakeHandler(DatabaseHandler):
         """
         need_to_close = self.is_connected is False
         connection = self.connect()
-        from snowflake.connector import DictCursor
-        with connection.cursor(DictCursor) as cur:
+        with connection.cursor() as cur:
             try:
                 cur.execute(query)
-                result = cur.fetchall()
-                if result:
-                    response = Response(
-                        RESPONSE_TYPE.TABLE,
-                        DataFrame(
+                try:
+                    # result is fetched in arrow batches, without conversion to rows
+                    result = cur.fetch_arrow_all()
+                except NotSupportedError:
+                    # result of the query is not in arrow format
+                    result = cur.fetchall()
+                    if result:
+                        result = DataFrame(
                             result,
                             columns=[x[0] for x in cur.description]
                         )
+                if result is not None and len(result) > 0:
+                    response = Response(
+                        RESPONSE_TYPE.TABLE,
+                        result
                     )
                 else:
                     response = Response(RESPONSE_TYPE.OK)
@@ -6,9 +6,12 @@ import sqlite3
 
 from mindsdb_sql import parse_sql
 from mindsdb_sql.render.sqlalchemy_render import SqlalchemyRender
-from mindsdb.integrations.libs.base import DatabaseHandler
+from mindsdb.integrations.libs.base import (
+    DatabaseHandler, STREAM_BATCH_SIZE, BULK_INSERT_BATCH_SIZE, iter_cursor_batches, iter_df_batches, df_to_rows
+)
 
 from mindsdb_sql.parser.ast.base import ASTNode
+from mindsdb_sql.parser.ast import Identifier
 
 from mindsdb.utilities import log
 from mindsdb.integrations.libs.response import (
@@ -26,6 +29,9 @@ class SQLiteHandler(DatabaseHandler):
 
     name = 'sqlite'
 
+    # connection can be used only in the thread where it was created
+    poolable = False
+
     def __init__(self, name: str, connection_data: Optional[dict], **kwargs):
         """
         Initialize the handler.
@@ -139,6 +145,81 @@ class SQLiteHandler(DatabaseHandler):
 
         return response
 
+    def native_query_stream(self, query: str, batch_size: int = STREAM_BATCH_SIZE):
+        """
+        Receive raw query and yield its result by batches of rows.
+        Args:
+            query (str): query in native format
+            batch_size (int): max count of rows in batch
+        Yields:
+            pd.DataFrame
+        """
+
+        need_to_close = self.is_connected is False
+
+        connection = self.connect()
+        cursor = connection.cursor()
+
+        try:
+            cursor.execute(query)
+            if cursor.description is not None:
+                yield from iter_cursor_batches(cursor, batch_size)
+            else:
+                connection.commit()
+        except Exception:
+            log.logger.error(f'Error running query: {query} on {self.connection_data["db_file"]}!')
+            raise
+        finally:
+            cursor.close()
+            if need_to_close is True:
+                self.disconnect()
+
+    def bulk_insert(self, table_name: Identifier, df: pd.DataFrame,
+                    batch_size: int = BULK_INSERT_BATCH_SIZE) -> StatusResponse:
+        """
+        Write rows of dataframe into existing table with executemany, in one transaction.
+        Args:
+            table_name (Identifier): name of the table
+            df (pd.DataFrame): rows to insert
+            batch_size (int): count of rows converted at once
+        Returns:
+            HandlerResponse
+        """
+
+        def quote(name):
+            name = str(name).replace('"', '""')
+            return f'"{name}"'
+
+        insert_query = 'INSERT INTO {} ({}) VALUES ({})'.format(
+            '.'.join(quote(part) for part in table_name.parts),
+            ', '.join(quote(col) for col in df.columns),
+            ', '.join(['?'] * len(df.columns))
+        )
+
+        need_to_close = self.is_connected is False
+
+        connection = self.connect()
+        cursor = connection.cursor()
+
+        try:
+            for batch in iter_df_batches(df, batch_size):
+                cursor.executemany(insert_query, df_to_rows(batch))
+            connection.commit()
+            response = Response(RESPONSE_TYPE.OK)
+        except Exception as e:
+            log.logger.error(f'Error loading data into {table_name} on {self.connection_data["db_file"]}!')
+            response = Response(
+                RESPONSE_TYPE.ERROR,
+                error_message=str(e)
+            )
+            connection.rollback()
+
+        cursor.close()
+        if need_to_close is True:
+            self.disconnect()
+
+        return response
+
     def query(self, query: ASTNode) -> StatusResponse:
         """
         Receive query as AST (abstract syntax tree) and act upon it somehow.
@@ -152,6 +233,11 @@ class SQLiteHandler(DatabaseHandler):
         query_str = renderer.get_string(query, with_failback=True)
         return self.native_query(query_str)
 
+    def query_stream(self, query: ASTNode, batch_size: int = STREAM_BATCH_SIZE):
+        renderer = SqlalchemyRender('sqlite')
+        query_str = renderer.get_string(query, with_failback=True)
+        return self.native_query_stream(query_str, batch_size)
+
     def get_tables(self) -> StatusResponse:
         """
         Return list of entities that will be accessible as tables.
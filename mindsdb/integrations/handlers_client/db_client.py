@@ -24,7 +24,9 @@ from mindsdb.integrations.libs.response import (
     RESPONSE_TYPE
 )
 from mindsdb_sql.parser.ast.base import ASTNode
+from mindsdb_sql.parser.ast import Identifier
 from mindsdb.integrations.handlers_client.base_client import BaseClient
+from mindsdb.integrations.libs.base import BaseHandler, STREAM_BATCH_SIZE, BULK_INSERT_BATCH_SIZE
 from mindsdb.integrations.libs.handler_helpers import define_handler as define_db_handler
 from mindsdb.utilities import log
 
@@ -168,6 +170,18 @@ class DBServiceClient(BaseClient):
 
         return response
 
+    def native_query_stream(self, query: str, batch_size: int = STREAM_BATCH_SIZE):
+        """Result of 'native_query' of DBHandler service by batches of rows"""
+        return BaseHandler.native_query_stream(self, query, batch_size)
+
+    def query_stream(self, query: ASTNode, batch_size: int = STREAM_BATCH_SIZE):
+        """Result of 'query' of DBHandler service by batches of rows"""
+        return BaseHandler.query_stream(self, query, batch_size)
+
+    def bulk_insert(self, table_name: Identifier, df, batch_size: int = BULK_INSERT_BATCH_SIZE) -> Response:
+        """Writes rows of dataframe to the table by batches using 'query' of DBHandler service"""
+        return BaseHandler.bulk_insert(self, table_name, df, batch_size)
+
     def get_tables(self) -> Response:
         """List all tabels in the database without the system data.
 
@@ -1,8 +1,72 @@
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, Iterator
 
+import numpy as np
 import pandas as pd
+from pandas.api import types as pd_types
 from mindsdb_sql.parser.ast.base import ASTNode
-from mindsdb.integrations.libs.response import HandlerResponse, HandlerStatusResponse
+from mindsdb_sql.parser.ast import Identifier, Insert
+from mindsdb.integrations.libs.response import HandlerResponse, HandlerStatusResponse, RESPONSE_TYPE
+
+# default max count of rows in batch of streamed query result
+STREAM_BATCH_SIZE = 10000
+# default count of rows written by one statement of bulk insert
+BULK_INSERT_BATCH_SIZE = 10000
+
+
+def iter_response_batches(response: HandlerResponse, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[pd.DataFrame]:
+    """ split data of response into batches of rows
+
+        Raises:
+            Exception: if response is error
+    """
+    if response.type == RESPONSE_TYPE.ERROR:
+        raise Exception(response.error_message)
+    if response.type != RESPONSE_TYPE.TABLE:
+        return
+    df = response.data_frame
+    if len(df) == 0:
+        # columns of empty result
+        yield df
+        return
+    for start in range(0, len(df), batch_size):
+        yield df.iloc[start:start + batch_size]
+
+
+def iter_cursor_batches(cursor, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[pd.DataFrame]:
+    """ fetch result of executed DB-API cursor by batches of rows using 'fetchmany'.
+        First batch is yielded even if result is empty
+    """
+    columns = [x[0] for x in cursor.description]
+    is_first = True
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if len(rows) == 0 and not is_first:
+            break
+        is_first = False
+        yield pd.DataFrame(rows, columns=columns)
+        if len(rows) < batch_size:
+            break
+
+
+def df_to_rows(df: pd.DataFrame) -> list:
+    """ rows of dataframe as tuples of python values (int, float, str, datetime, ...).
+        Nulls are replaced with None
+    """
+    columns = []
+    for i in range(len(df.columns)):
+        column = df.iloc[:, i]
+        if pd_types.is_datetime64_any_dtype(column.dtype):
+            values = np.array(column.dt.to_pydatetime(), dtype=object)
+        else:
+            values = column.astype(object).values.copy()
+        values[pd.isna(values)] = None
+        columns.append(values)
+    return list(zip(*columns))
+
+
+def iter_df_batches(df: pd.DataFrame, batch_size: int) -> Iterator[pd.DataFrame]:
+    for start in range(0, len(df), batch_size):
+        yield df.iloc[start:start + batch_size]
 
 
 class BaseHandler:
@@ -12,6 +76,10 @@ class BaseHandler:
     broader MindsDB ecosystem via SQL commands.
     """
 
+    # connected handler can be reused by queries from other threads. Handlers which
+    # connection is bound to the thread where it was created (sqlite3, duckdb) are not pooled
+    poolable: bool = True
+
     def __init__(self, name: str):
         """ constructor
         Args:
@@ -71,6 +139,68 @@ class BaseHandler:
         """
         raise NotImplementedError()
 
+    def native_query_stream(self, query: Any, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[pd.DataFrame]:
+        """Receive raw query and yield its result by batches of rows.
+
+        Default implementation executes native_query and splits its result. Handlers able to
+        fetch result partially (server-side cursors, fetchmany) should override it, then only
+        one batch of rows is in memory at a time.
+
+        Args:
+            query (Any): query in native format
+            batch_size (int): max count of rows in batch
+
+        Yields:
+            pd.DataFrame: batch of rows. First batch is yielded even if result is empty,
+                nothing is yielded if query doesn't return data
+
+        Raises:
+            Exception: if query is failed
+        """
+        yield from iter_response_batches(self.native_query(query), batch_size)
+
+    def query_stream(self, query: ASTNode, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[pd.DataFrame]:
+        """Receive query as AST and yield its result by batches of rows.
+
+        Same as native_query_stream, default implementation splits result of query.
+
+        Args:
+            query (ASTNode): sql query represented as AST
+            batch_size (int): max count of rows in batch
+
+        Yields:
+            pd.DataFrame: batch of rows
+        """
+        yield from iter_response_batches(self.query(query), batch_size)
+
+    def bulk_insert(self, table_name: Identifier, df: pd.DataFrame,
+                    batch_size: int = BULK_INSERT_BATCH_SIZE) -> HandlerResponse:
+        """Write rows of dataframe into existing table.
+
+        Default implementation sends INSERT query with multiple rows for every batch. Batches are
+        not written in one transaction: on error the rows of previous batches stay in the table.
+        Handlers which have faster way to load data (COPY, executemany, etc) should override it.
+
+        Args:
+            table_name (Identifier): name of the table
+            df (pd.DataFrame): rows to insert, names of columns are names of table's columns
+            batch_size (int): count of rows written at once
+
+        Returns:
+            HandlerResponse
+        """
+        columns = [Identifier(parts=[str(col)]) for col in df.columns]
+        for batch in iter_df_batches(df, batch_size):
+            insert_ast = Insert(
+                table=table_name,
+                columns=columns,
+                values=[list(row) for row in df_to_rows(batch)]
+            )
+            response = self.query(insert_ast)
+            if response.type == RESPONSE_TYPE.ERROR:
+                return response
+        return HandlerResponse(RESPONSE_TYPE.OK)
+
     def get_tables(self) -> HandlerResponse:
         """ Return list of entities
 
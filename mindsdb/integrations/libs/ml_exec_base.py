@@ -181,8 +181,9 @@ class BaseMLEngineExec:
 
         self.handler_class = kwargs['handler_class']
 
-    def get_ml_handler(self, predictor_id=None):
+    def get_ml_handler(self, predictor_id=None, cache_key=None):
         # returns instance or wrapper over it
+        #   cache_key - version of model, worker process of 'subprocess_keep' reuses handler for it
 
         integration_id = self.integration_id
 
@@ -197,7 +198,7 @@ class BaseMLEngineExec:
         elif self.execution_method == 'subprocess_keep':
             handler = MLHandlerPersistWrapper()
 
-            handler.init_handler(class_path, integration_id, predictor_id, ctx.dump())
+            handler.init_handler(class_path, integration_id, predictor_id, ctx.dump(), cache_key=cache_key)
             return handler
 
         elif self.execution_method == 'remote':
@@ -355,11 +356,17 @@ class BaseMLEngineExec:
                 model_name = f'{model_name}.{version}'
             raise Exception(f"Error: model '{model_name}' does not exists!")
 
-        ml_handler = self.get_ml_handler(predictor_record.id)
+        model_cache_key = (
+            predictor_record.id,
+            predictor_record.version,
+            str(predictor_record.updated_at)
+        )
+        ml_handler = self.get_ml_handler(predictor_record.id, cache_key=model_cache_key)
 
         args = {
             'pred_format': pred_format,
-            'predict_params': {} if params is None else params
+            'predict_params': {} if params is None else params,
+            'model_cache_key': model_cache_key
         }
         # FIXME
         if self.handler_class.__name__ == 'LightwoodHandler':
@@ -368,9 +375,11 @@ class BaseMLEngineExec:
             args['dtype_dict'] = predictor_record.dtype_dict
             args['learn_args'] = predictor_record.learn_args
 
-        predictions = ml_handler.predict(df, args)
-
-        ml_handler.close()
+        try:
+            predictions = ml_handler.predict(df, args)
+        finally:
+            # worker of pool has to be returned also on error
+            ml_handler.close()
 
         columns_dtypes = dict(predictions.dtypes)
         # mdb indexes
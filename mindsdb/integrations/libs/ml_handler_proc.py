@@ -15,6 +15,11 @@ Protocol over stdin/out:
 
 if 'error' in response dict, parent process trows exception
 
+Big dataframes (in args, kwargs and response) are not pickled: they are written
+as Arrow IPC file to shared memory (/dev/shm if available) and only
+{'__arrow_ipc__': <path>} is sent over the pipe. Receiver maps the file,
+reads it and removes it.
+
 """
 
 import pickle
@@ -23,9 +28,75 @@ import sys
 import struct
 import traceback
 import importlib
+import os
+import time
+import tempfile
 import threading
-import queue
 from threading import Lock
+from collections import OrderedDict
+
+import pandas as pd
+import pyarrow as pa
+
+from mindsdb.utilities.arrow import df_to_arrow_table
+
+# dataframes smaller than this (in bytes) are pickled
+ARROW_IPC_MIN_SIZE = 1024 * 1024
+ARROW_IPC_KEY = '__arrow_ipc__'
+# count of handler instances (with loaded models) kept in child process
+ML_INSTANCES_CACHE_SIZE = 5
+
+
+# =================  dataframe transport ====================
+
+def _ipc_dir():
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        return '/dev/shm'
+    return tempfile.gettempdir()
+
+
+def pack_value(value):
+    """
+        Writes dataframe to Arrow IPC file and returns reference to it.
+        Other values and dataframes which can't be converted without change of dtypes are returned as is
+    """
+    if not isinstance(value, pd.DataFrame):
+        return value
+    if value.memory_usage(index=False).sum() < ARROW_IPC_MIN_SIZE:
+        return value
+
+    table = df_to_arrow_table(value)
+    if table is None:
+        return value
+
+    fd, path = tempfile.mkstemp(prefix='mindsdb_ml_', suffix='.arrow', dir=_ipc_dir())
+    try:
+        with os.fdopen(fd, 'wb') as fo:
+            with pa.ipc.new_file(fo, table.schema) as writer:
+                writer.write_table(table)
+    except Exception:
+        remove_packed(path)
+        return value
+    return {ARROW_IPC_KEY: path}
+
+
+def unpack_value(value):
+    if not isinstance(value, dict) or ARROW_IPC_KEY not in value:
+        return value
+    path = value[ARROW_IPC_KEY]
+    try:
+        with pa.memory_map(path) as source:
+            df = pa.ipc.open_file(source).read_all().to_pandas()
+    finally:
+        remove_packed(path)
+    return df
+
+
+def remove_packed(path):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
 
 
 # =================  child process ====================
@@ -34,6 +105,8 @@ class MLHandlerProcess:
 
     def __init__(self):
         self.ml_instance = None
+        # cache_key -> instance of handler
+        self.ml_instances = OrderedDict()
 
     def mainloop(self):
         # replace print output to stderr
@@ -46,8 +119,8 @@ class MLHandlerProcess:
             params = self.read_input()
             try:
                 method = params['method']
-                args = params.get('args', [])
-                kwargs = params.get('kwargs', {})
+                args = [unpack_value(arg) for arg in params.get('args', [])]
+                kwargs = {k: unpack_value(v) for k, v in params.get('kwargs', {}).items()}
 
                 if hasattr(self, method):
                     # it is control method
@@ -63,7 +136,7 @@ class MLHandlerProcess:
                 self.send_output({'error': str(e), 'trace': error})
                 continue
 
-            self.send_output(ret)
+            self.send_output(pack_value(ret))
 
     def send_output(self, obj):
         # read stdin
@@ -85,13 +158,21 @@ class MLHandlerProcess:
 
         return obj
 
-    def init_handler(self, class_path, integration_id, predictor_id, context_dump):
+    def init_handler(self, class_path, integration_id, predictor_id, context_dump, cache_key=None):
         # mdb initialization
         import mindsdb.interfaces.storage.db as db
         from mindsdb.utilities.context import context as ctx
         ctx.load(context_dump)
         db.init()
 
+        # instance is reused by next calls for the same version of model
+        if cache_key is not None:
+            cache_key = (tuple(class_path), integration_id, predictor_id, cache_key)
+            if cache_key in self.ml_instances:
+                self.ml_instances.move_to_end(cache_key)
+                self.ml_instance = self.ml_instances[cache_key]
+                return
+
         from mindsdb.interfaces.storage.model_fs import ModelStorage, HandlerStorage
 
         module_name, class_name = class_path
@@ -107,6 +188,11 @@ class MLHandlerProcess:
         )
         self.ml_instance = ml_handler
 
+        if cache_key is not None:
+            self.ml_instances[cache_key] = ml_handler
+            while len(self.ml_instances) > ML_INSTANCES_CACHE_SIZE:
+                self.ml_instances.popitem(last=False)
+
     def exit(self):
         sys.exit(0)
 
@@ -130,12 +216,24 @@ class MLHandlerWrapper:
         if self.proc is not None:
             self.close()
 
+    def is_alive(self):
+        return self.proc is not None and self.proc.poll() is None
+
     def close(self):
+        if not self.is_alive():
+            self.proc = None
+            return
         self.send_command({'method': 'exit'})
         # self.proc.stdin.close()
         self.proc.wait()
         self.proc = None
 
+    def kill(self):
+        if self.is_alive():
+            self.proc.kill()
+            self.proc.wait()
+        self.proc = None
+
     def __getattr__(self, method_name):
         # is call of the method
         def call(*args, **kwargs):
@@ -157,83 +255,173 @@ class MLHandlerWrapper:
 
         params = {
             'method': method,
-            'args': args,
-            'kwargs': kwargs
+            'args': [pack_value(arg) for arg in args],
+            'kwargs': {k: pack_value(v) for k, v in kwargs.items()}
         }
-        self.send_command(params)
-
-        length_enc = self.proc.stdout.read(8)
-        length = struct.unpack('L', length_enc)[0]
-
-        ret_enc = self.proc.stdout.read(length)
-        ret = pickle.loads(ret_enc)
+        try:
+            self.send_command(params)
+
+            length_enc = self.proc.stdout.read(8)
+            if len(length_enc) < 8:
+                raise RuntimeError('ML handler process is terminated')
+            length = struct.unpack('L', length_enc)[0]
+
+            ret_enc = self.proc.stdout.read(length)
+            ret = unpack_value(pickle.loads(ret_enc))
+        except BaseException:
+            # exchange is interrupted: rest of response would be read by the next command.
+            # Process is stopped, pool replaces dead workers
+            self.kill()
+            raise
+        finally:
+            # files could be not removed if child didn't read them
+            for value in list(params['args']) + list(params['kwargs'].values()):
+                if isinstance(value, dict) and ARROW_IPC_KEY in value:
+                    remove_packed(value[ARROW_IPC_KEY])
 
         if ret is not None and 'error' in ret:
             raise RuntimeError(ret)
         return ret
 
 
-# ================= thread to keep wrapper opened ====================
+# ================= pool of warm worker processes ====================
+
+class MLWorkersPool:
+    """
+        Keeps several child processes opened.
+        Every worker is used by one handler at the time. Worker is chosen by predictor id:
+        the same model is routed to the worker used for it before (if it is free),
+        so loaded model stays warm in this worker.
+        If all workers are busy, caller waits until one of them is released.
+    """
+
+    def __init__(self, size=None, acquire_timeout=None):
+        from mindsdb.utilities.config import Config
+
+        config = Config().get('ml_workers_pool', {})
+        if size is None:
+            size = config.get('size', 2)
+        if acquire_timeout is None:
+            acquire_timeout = config.get('acquire_timeout', 300)
+        self.size = max(1, size)
+        self.acquire_timeout = acquire_timeout
+
+        self.workers = [None] * self.size
+        self.busy = [False] * self.size
+        # predictor_id -> index of worker
+        self.affinity = {}
+        self.condition = threading.Condition()
+
+    def _choose_worker(self, predictor_id):
+        index = self.affinity.get(predictor_id)
+        if index is not None and not self.busy[index]:
+            return index
+
+        free = [i for i in range(self.size) if not self.busy[i]]
+        if len(free) == 0:
+            return None
+
+        # prefer worker which is not assigned to other models
+        assigned = set(self.affinity.values())
+        for i in free:
+            if i not in assigned:
+                return i
+        return free[0]
+
+    def acquire(self, predictor_id):
+        with self.condition:
+            deadline = time.monotonic() + self.acquire_timeout
+            while True:
+                index = self._choose_worker(predictor_id)
+                if index is not None:
+                    break
+                timeout = deadline - time.monotonic()
+                if timeout <= 0 or not self.condition.wait(timeout):
+                    raise RuntimeError('All ML workers are busy, try again later')
+
+            # health check: dead worker will be restarted, models loaded in it are lost
+            worker = self.workers[index]
+            if worker is not None and not worker.is_alive():
+                worker.proc = None
+                self.workers[index] = None
+                self.affinity = {k: v for k, v in self.affinity.items() if v != index}
+
+            self.busy[index] = True
+            self.affinity[predictor_id] = index
 
-process_thread = None
-queue_in = queue.Queue()
-queue_out = queue.Queue()
-queue_lock = Lock()
+        try:
+            if self.workers[index] is None:
+                self.workers[index] = MLHandlerWrapper()
+        except Exception:
+            self.release(index)
+            raise
+        return index, self.workers[index]
 
+    def release(self, index):
+        with self.condition:
+            self.busy[index] = False
+            self.condition.notify()
 
-def process_keeper():
-    wrapper = MLHandlerWrapper()
+    def stats(self):
+        with self.condition:
+            return {
+                'size': self.size,
+                'busy': sum(self.busy),
+                'alive': len([w for w in self.workers if w is not None and w.is_alive()]),
+                'models': len(self.affinity)
+            }
 
-    while True:
-        method_name, args, kwargs = queue_in.get()
-        method = wrapper.__getattr__(method_name)
-        try:
-            ret = method(*args, **kwargs)
 
-        except RuntimeError as e:
-            ret = e
-        except Exception as e:
-            # TODO to something else?
-            ret = e
-        queue_in.task_done()
-        queue_out.put(ret)
+workers_pool = None
+workers_pool_lock = Lock()
+
+
+def get_workers_pool():
+    global workers_pool
+    with workers_pool_lock:
+        if workers_pool is None:
+            workers_pool = MLWorkersPool()
+    return workers_pool
 
 
 class MLHandlerPersistWrapper:
     '''
-        keeps child process opened
+        uses worker from pool of opened child processes
     '''
 
     def __init__(self):
-        global process_thread
-        if process_thread is None:
-            process_thread = threading.Thread(target=process_keeper, daemon=True)
-            process_thread.start()
+        self.pool = get_workers_pool()
+        self.worker_index = None
+        self.worker = None
 
-    def __getattr__(self, method_name):
-        global queue_in, queue_out, queue_lock
+    def init_handler(self, class_path, integration_id, predictor_id, context_dump, cache_key=None):
+        self.worker_index, self.worker = self.pool.acquire(predictor_id)
+        try:
+            return self.worker.init_handler(
+                class_path, integration_id, predictor_id, context_dump, cache_key=cache_key
+            )
+        except Exception:
+            self.close()
+            raise
 
+    def __getattr__(self, method_name):
         # is call of the method
 
         def call(*args, **kwargs):
-            # send one task at the time
-            queue_lock.acquire()
-
-            queue_in.put([method_name, args, kwargs])
-            result = queue_out.get()
-
-            queue_lock.release()
-
-            if isinstance(result, Exception):
-                raise result
-
-            return result
+            if self.worker is None:
+                raise RuntimeError('ML handler is not initialized')
+            return self.worker.exec_command(method_name, *args, **kwargs)
 
         return call
 
+    def __del__(self):
+        self.close()
+
     def close(self):
-        # not close child pricess
-        pass
+        # not close child process, return it to pool
+        if self.__dict__.get('worker') is not None:
+            self.worker = None
+            self.pool.release(self.worker_index)
 
 
 # run child process
@@ -1,3 +1,6 @@
+from typing import Optional, Union
+
+import pyarrow as pa
 from pandas import DataFrame
 
 from mindsdb.api.mysql.mysql_proxy.libs.constants.response_type import RESPONSE_TYPE
@@ -5,7 +8,7 @@ from mindsdb_sql.parser.ast import ASTNode
 
 
 class HandlerResponse:
-    def __init__(self, resp_type: RESPONSE_TYPE, data_frame: DataFrame = None,
+    def __init__(self, resp_type: RESPONSE_TYPE, data_frame: Union[DataFrame, pa.Table] = None,
                  query: ASTNode = 0, error_code: int = 0, error_message: str = None) -> None:
         self.resp_type = resp_type
         self.query = query
@@ -18,6 +21,23 @@ class HandlerResponse:
     def type(self):
         return self.resp_type
 
+    @property
+    def data_frame(self) -> Optional[DataFrame]:
+        """ data of response. Handlers may return arrow table, it is converted to pandas on first access """
+        if self._arrow_table is not None:
+            self._data_frame = self._arrow_table.to_pandas(split_blocks=True)
+            self._arrow_table = None
+        return self._data_frame
+
+    @data_frame.setter
+    def data_frame(self, value: Union[DataFrame, pa.Table, None]):
+        if isinstance(value, pa.Table):
+            self._arrow_table = value
+            self._data_frame = None
+        else:
+            self._arrow_table = None
+            self._data_frame = value
+
     def to_json(self):
         try:
             data = self.data_frame.to_json(orient="split", index=False)
@@ -3,6 +3,7 @@ from collections import OrderedDict
 
 from mindsdb.interfaces.database.integrations import IntegrationController
 from mindsdb.interfaces.database.projects import ProjectController
+from mindsdb.interfaces.database.metadata_catalog import metadata_catalog
 
 
 class DatabaseController:
@@ -26,29 +27,29 @@ class DatabaseController:
             raise Exception(f"Database with type '{db_type}' cannot be deleted")
 
     def get_list(self, filter_type: Optional[str] = None):
-        projects = self.project_controller.get_list()
-        integrations = self.integration_controller.get_all()
+        catalog = metadata_catalog.get()
+        handlers_meta = self.integration_controller.get_handlers_metadata()
         result = [{
             'name': 'information_schema',
             'type': 'system',
             'id': None,
             'engine': None
         }]
-        for x in projects:
+        for x in catalog.projects.values():
             result.append({
-                'name': x.name,
+                'name': x['name'],
                 'type': 'project',
-                'id': x.id,
+                'id': x['id'],
                 'engine': None
             })
-        for key, value in integrations.items():
-            db_type = value.get('type', 'data')
+        for x in catalog.integrations:
+            db_type = handlers_meta.get(x['engine'], {}).get('type')
             if db_type != 'ml':
                 result.append({
-                    'name': key,
-                    'type': value.get('type', 'data'),
-                    'id': value.get('id'),
-                    'engine': value.get('engine')
+                    'name': x['name'],
+                    'type': db_type,
+                    'id': x['id'],
+                    'engine': x['engine']
                 })
 
         if filter_type is not None:
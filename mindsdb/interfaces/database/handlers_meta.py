@@ -0,0 +1,131 @@
+"""
+Reading of handlers metadata without import of handlers.
+
+Import of all handlers packages (and their dependencies: drivers, ML frameworks) is slow,
+but to list handlers only attributes declared in handler's __init__.py are required:
+
+    title = 'PostgreSQL'
+    name = 'postgres'
+    type = HANDLER_TYPE.DATA
+    from .__about__ import __version__ as version
+
+These are read from the sources with 'ast'. Names imported by relative import are looked up in
+the imported module's source, so 'connection_args' can be taken from handler's file without
+import of it. Only literals, constructors of OrderedDict/dict and 'dedent' are evaluated.
+
+Success of handler's import can't be known from the sources (requirements.txt contains also
+dependencies of tests, and not all dependencies are listed), it is known only after import.
+"""
+
+import ast
+from pathlib import Path
+from textwrap import dedent
+from collections import OrderedDict
+from typing import Optional
+
+from mindsdb.integrations.libs.const import HANDLER_CONNECTION_ARG_TYPE, HANDLER_TYPE
+
+HANDLER_ATTRS = (
+    'name', 'type', 'title', 'version', 'description', 'icon_path', 'permanent',
+    'connection_args', 'connection_args_example'
+)
+
+EVAL_NAMESPACE = {
+    '__builtins__': {},
+    'OrderedDict': OrderedDict,
+    'dict': dict,
+    'list': list,
+    'ARG_TYPE': HANDLER_CONNECTION_ARG_TYPE,
+    'HANDLER_CONNECTION_ARG_TYPE': HANDLER_CONNECTION_ARG_TYPE,
+    'HANDLER_TYPE': HANDLER_TYPE,
+    'dedent': dedent
+}
+
+
+class HandlerMetaError(Exception):
+    pass
+
+
+def _module_file(package_dir: Path, level: int, module: Optional[str]) -> Path:
+    base_dir = package_dir
+    for _ in range(level - 1):
+        base_dir = base_dir.parent
+    if module is not None:
+        base_dir = base_dir.joinpath(*module.split('.'))
+    if base_dir.joinpath('__init__.py').is_file():
+        return base_dir.joinpath('__init__.py')
+    return base_dir.with_suffix('.py')
+
+
+def _read_module(path: Path) -> dict:
+    """ returns top level names of the module: name -> ('value', ast node) or ('import', path, name) """
+    if not path.is_file():
+        raise HandlerMetaError(f'File not found: {path}')
+    tree = ast.parse(path.read_text())
+
+    names = {}
+    # top level statements, including these in 'try' and 'if' blocks
+    statements = list(tree.body)
+    while len(statements) > 0:
+        statement = statements.pop(0)
+        if isinstance(statement, ast.Assign):
+            for target in statement.targets:
+                if isinstance(target, ast.Name):
+                    names[target.id] = ('value', statement.value)
+        elif isinstance(statement, ast.ImportFrom) and statement.level > 0:
+            module_file = _module_file(path.parent, statement.level, statement.module)
+            for alias in statement.names:
+                names[alias.asname or alias.name] = ('import', module_file, alias.name)
+        elif isinstance(statement, ast.Try):
+            statements.extend(statement.body)
+        elif isinstance(statement, ast.If):
+            statements.extend(statement.body)
+    return names
+
+
+def _resolve(names: dict, name: str, modules: dict, depth: int = 0):
+    if depth > 5:
+        raise HandlerMetaError(f"Can't resolve: {name}")
+    item = names[name]
+    if item[0] == 'value':
+        code = compile(ast.Expression(item[1]), '<handler meta>', 'eval')
+        return eval(code, dict(EVAL_NAMESPACE))
+
+    module_file, module_name = item[1], item[2]
+    if module_file not in modules:
+        modules[module_file] = _read_module(module_file)
+    module_names = modules[module_file]
+    if module_name not in module_names:
+        raise HandlerMetaError(f"Name '{module_name}' is not found in {module_file}")
+    return _resolve(module_names, module_name, modules, depth + 1)
+
+
+def read_handler_attrs(handler_dir: Path) -> dict:
+    """ returns attributes of handler declared in its __init__.py
+
+        Raises:
+            Exception: if any of declared attributes can't be evaluated statically
+    """
+    modules = {}
+    names = _read_module(handler_dir.joinpath('__init__.py'))
+
+    attrs = {}
+    for attr in HANDLER_ATTRS:
+        if attr in names:
+            attrs[attr] = _resolve(names, attr, modules)
+
+    for attr in ('name', 'type'):
+        if not isinstance(attrs.get(attr), str):
+            raise HandlerMetaError(f"Handler attribute '{attr}' is not defined")
+    return attrs
+
+
+def read_dependencies(handler_dir: Path) -> list:
+    dependencies = []
+    requirements_txt = Path(handler_dir).joinpath('requirements.txt')
+    if requirements_txt.is_file():
+        with open(str(requirements_txt), 'rt') as f:
+            dependencies = [x.strip(' \t\n') for x in f.readlines()]
+            dependencies = [x for x in dependencies if len(x) > 0]
+    return dependencies
+
@@ -0,0 +1,138 @@
+"""
+Process-wide pool of connected data handlers.
+
+Creating of handler and connection to database (TCP, TLS, auth) is done once, then
+handler is reused by next queries to the same integration:
+
+    handler = pool.borrow(key)
+    if handler is None:
+        handler = create_handler()
+    ...
+    pool.release(key, handler)
+
+Key contains integration id and time of its last update, so handlers of modified integration
+are not used anymore. Every handler is used only by one borrower at the time.
+
+Handlers are borrowed only by IntegrationController.get_handler(reuse=True), which is used by
+datanodes. Handlers with 'poolable = False' (connection is bound to the thread where it was
+created, like sqlite3) are not pooled.
+
+Configuration:
+    "handlers_pool": {
+        "enabled": true,
+        "min_size": 0,                # idle handlers which are kept after idle_timeout
+        "max_size": 5,                # max count of idle handlers for one integration
+        "idle_timeout": 300,          # seconds
+        "health_check_interval": 30   # check connection of handler if it was idle longer than this
+    }
+"""
+
+import time
+import threading
+
+from mindsdb.utilities import log
+from mindsdb.utilities.config import Config
+
+
+class HandlersPool:
+    def __init__(self):
+        # key -> list of [handler, time of release]
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_config():
+        config = {
+            'enabled': True,
+            'min_size': 0,
+            'max_size': 5,
+            'idle_timeout': 300,
+            'health_check_interval': 30
+        }
+        config.update(Config().get('handlers_pool', {}))
+        return config
+
+    @staticmethod
+    def _close(handler):
+        try:
+            if getattr(handler, 'is_connected', False):
+                handler.disconnect()
+        except Exception as e:
+            log.logger.debug(f'Error on handler disconnect: {e}')
+
+    def _is_healthy(self, handler):
+        try:
+            return handler.check_connection().success is True
+        except Exception:
+            return False
+
+    def _evict_expired(self, config):
+        # must be called under lock, returns handlers to close
+        expired = []
+        deadline = time.monotonic() - config['idle_timeout']
+        for key, items in self._idle.items():
+            keep = []
+            for i, item in enumerate(items):
+                # items are ordered by time of release, newest in the end
+                if item[1] < deadline and len(items) - i > config['min_size']:
+                    expired.append(item[0])
+                else:
+                    keep.append(item)
+            self._idle[key] = keep
+        return expired
+
+    def borrow(self, key):
+        """ returns idle handler for key or None """
+        config = self.get_config()
+        if config['enabled'] is not True:
+            return None
+
+        with self._lock:
+            to_close = self._evict_expired(config)
+            items = self._idle.setdefault(key, [])
+
+        for handler in to_close:
+            self._close(handler)
+
+        while True:
+            with self._lock:
+                if len(items) == 0:
+                    return None
+                handler, released_at = items.pop()
+
+            if time.monotonic() - released_at > config['health_check_interval']:
+                if not self._is_healthy(handler):
+                    self._close(handler)
+                    continue
+            return handler
+
+    def release(self, key, handler):
+        """ returns handler to the pool """
+        config = self.get_config()
+        with self._lock:
+            items = self._idle.get(key)
+            if config['enabled'] is True and items is not None and len(items) < config['max_size']:
+                items.append([handler, time.monotonic()])
+                return
+        # key was invalidated or pool is full
+        self._close(handler)
+
+    def invalidate(self, integration_id):
+        """ drop handlers of integration, handlers which are borrowed now won't be returned to the pool """
+        to_close = []
+        with self._lock:
+            for key in list(self._idle.keys()):
+                if key[1] == integration_id:
+                    to_close.extend(item[0] for item in self._idle.pop(key))
+        for handler in to_close:
+            self._close(handler)
+
+    def clear(self):
+        with self._lock:
+            to_close = [item[0] for items in self._idle.values() for item in items]
+            self._idle = {}
+        for handler in to_close:
+            self._close(handler)
+
+
+handlers_pool = HandlersPool()
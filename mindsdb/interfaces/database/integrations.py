@@ -3,6 +3,7 @@ import base64
 import shutil
 import tempfile
 import importlib
+import threading
 from time import time
 from pathlib import Path
 from copy import deepcopy
@@ -14,6 +15,11 @@ from mindsdb.interfaces.storage import db
 from mindsdb.utilities.config import Config
 from mindsdb.interfaces.storage.fs import FsStore, FileStorage, FileStorageFactory, RESOURCE_GROUP
 from mindsdb.interfaces.file.file_controller import FileController
+from mindsdb.interfaces.database.handlers_pool import handlers_pool
+from mindsdb.api.mysql.mysql_proxy.utilities.query_cache import invalidate_query_cache
+from mindsdb.interfaces.database.handlers_meta import (
+    HANDLER_ATTRS, read_handler_attrs, read_dependencies
+)
 from mindsdb.integrations.libs.const import HANDLER_CONNECTION_ARG_TYPE as ARG_TYPE, HANDLER_TYPE
 from mindsdb.utilities import log
 from mindsdb.integrations.handlers_client.db_client import DBServiceClient
@@ -49,7 +55,7 @@ class IntegrationController:
             "%s: add method calling name=%s, engine=%s, connection_args=%s, company_id=%s",
             self.__class__.__name__, name, engine, connection_args, ctx.company_id
         )
-        handlers_meta = self.get_handlers_import_status()
+        handlers_meta = self.get_handlers_metadata()
         handler_meta = handlers_meta[engine]
         accept_connection_args = handler_meta.get('connection_args')
         log.logger.debug("%s: accept_connection_args - %s", self.__class__.__name__, accept_connection_args)
@@ -90,17 +96,17 @@ class IntegrationController:
 
         integration_record.data = data
         db.session.commit()
+        handlers_pool.invalidate(integration_record.id)
+        invalidate_query_cache(name)
 
     def delete(self, name):
         if name in ('files', 'lightwood'):
             raise Exception('Unable to drop: is system database')
 
         # check permanent integration
-        if name in self.handler_modules:
-            handler = self.handler_modules[name]
-
-            if getattr(handler, 'permanent', False) is True:
-                raise Exception('Unable to drop: is permanent integration')
+        handler_meta = self.handlers_import_status.get(name)
+        if handler_meta is not None and handler_meta.get('permanent', False) is True:
+            raise Exception('Unable to drop: is permanent integration')
 
         integration_record = db.session.query(db.Integration).filter_by(company_id=ctx.company_id, name=name).first()
 
@@ -117,6 +123,8 @@ class IntegrationController:
 
         db.session.delete(integration_record)
         db.session.commit()
+        handlers_pool.invalidate(integration_record.id)
+        invalidate_query_cache(name)
 
     def _get_integration_record_data(self, integration_record, sensitive_info=True):
         if integration_record is None or integration_record.data is None:
@@ -157,10 +165,7 @@ class IntegrationController:
             ):
                 data['connection'] = None
 
-        integration_type = None
-        integration_module = self.handler_modules.get(integration_record.engine)
-        if hasattr(integration_module, 'type'):
-            integration_type = integration_module.type
+        integration_type = self.handlers_import_status.get(integration_record.engine, {}).get('type')
 
         return {
             'id': integration_record.id,
@@ -215,7 +220,7 @@ class IntegrationController:
 
         if handler_type == 'files':
             handler_ars['file_controller'] = FileController()
-        elif self.handler_modules.get(handler_type, False).type == HANDLER_TYPE.ML:
+        elif self.handlers_import_status.get(handler_type, {}).get('type') == HANDLER_TYPE.ML:
             handler_ars['handler_controller'] = IntegrationController()
             handler_ars['company_id'] = ctx.company_id
 
@@ -257,7 +262,15 @@ class IntegrationController:
             return DBServiceClient(handler_type, as_service=as_service, **handler_ars)
         return self.handler_modules[handler_type].Handler(**handler_ars)
 
-    def get_handler(self, name, case_sensitive=False):
+    def get_handler(self, name, case_sensitive=False, reuse=False):
+        """ Returns handler of the integration
+
+            Args:
+                name (str): name of integration
+                case_sensitive (bool): search integration by exact name
+                reuse (bool): borrow connected handler from the pool of handlers. Borrowed handler
+                    has to be returned by release_handler after use
+        """
         if case_sensitive:
             integration_record = db.session.query(db.Integration).filter_by(company_id=ctx.company_id, name=name).first()
         else:
@@ -277,6 +290,25 @@ class IntegrationController:
         if integration_engine not in self.handler_modules:
             raise Exception(f"Can't find handler for '{integration_name}' ({integration_engine})")
 
+        # connected handlers of data integrations are reused
+        pool_key = None
+        if (
+            reuse is True
+            and self.handler_modules[integration_engine].type == HANDLER_TYPE.DATA
+            and integration_engine != 'files'
+            and 'as_service' not in connection_data
+            and getattr(self.handler_modules[integration_engine].Handler, 'poolable', True) is True
+        ):
+            pool_key = (
+                ctx.company_id,
+                integration_record.id,
+                str(integration_record.updated_at),
+                self.handler_modules[integration_engine].Handler
+            )
+            handler = handlers_pool.borrow(pool_key)
+            if handler is not None:
+                return handler
+
         integration_meta = self.handlers_import_status[integration_engine]
         connection_args = integration_meta.get('connection_args')
         as_service = False
@@ -324,121 +356,247 @@ class IntegrationController:
         else:
             handler = HandlerClass(**handler_ars)
 
+        if pool_key is not None:
+            handler.pool_key = pool_key
+            try:
+                # handler keeps connection while it is in the pool
+                handler.connect()
+            except Exception as e:
+                log.logger.debug(f"Can't connect handler '{name}': {e}")
+
         if as_service:
             log.logger.debug("%s get_handler: create a client to db service of %s type", self.__class__.__name__, handler_type)
             return DBServiceClient(handler_type, as_service=as_service, **handler_ars)
 
         return handler
 
+    def release_handler(self, handler):
+        """ Return handler got from get_handler, to be used by next queries """
+        pool_key = getattr(handler, 'pool_key', None)
+        if pool_key is not None:
+            handlers_pool.release(pool_key, handler)
+
     def reload_handler_module(self, handler_name):
-        importlib.reload(self.handler_modules[handler_name])
-        try:
-            handler_meta = self._get_handler_meta(self.handler_modules[handler_name])
-        except Exception as e:
-            handler_meta = {
-                'import': {
-                    'success': False,
-                    'error_message': str(e),
-                    'dependencies': []
-                },
-                'name': handler_name
-            }
-
-        self.handlers_import_status[handler_meta['name']] = handler_meta
-
-    def _read_dependencies(self, path):
-        dependencies = []
-        requirements_txt = Path(path).joinpath('requirements.txt')
-        if requirements_txt.is_file():
-            with open(str(requirements_txt), 'rt') as f:
-                dependencies = [x.strip(' \t\n') for x in f.readlines()]
-                dependencies = [x for x in dependencies if len(x) > 0]
-        return dependencies
+        with _handlers_lock:
+            handler_meta = _handlers_meta.get(handler_name)
+            if handler_meta is None:
+                return
+            handler_module = _handler_modules.pop(handler_name, None)
+            if handler_module is None:
+                # previous import was unsuccessful, try again
+                _import_handler(handler_name)
+                return
+            try:
+                importlib.reload(handler_module)
+                _handler_modules[handler_name] = handler_module
+                new_meta = _get_module_meta(handler_module)
+            except Exception as e:
+                new_meta = {
+                    'import': {
+                        'success': False,
+                        'error_message': str(e),
+                        'folder': handler_meta['import'].get('folder'),
+                        'dependencies': handler_meta['import'].get('dependencies', [])
+                    },
+                    'name': handler_name
+                }
+            handler_meta.clear()
+            handler_meta.update(new_meta)
 
     def _get_handler_meta(self, module):
-        handler_dir = Path(module.__path__[0])
-        handler_folder_name = handler_dir.name
-        dependencies = self._read_dependencies(handler_dir)
-
-        self.handler_modules[module.name] = module
-        import_error = None
-        if hasattr(module, 'import_error'):
-            import_error = module.import_error
-        handler_meta = {
-            'import': {
-                'success': import_error is None,
-                'folder': handler_folder_name,
-                'dependencies': dependencies
-            },
-            'version': module.version
-        }
-        if import_error is not None:
-            handler_meta['import']['error_message'] = str(import_error)
-
-        module_attrs = [attr for attr in [
-            'connection_args_example',
-            'connection_args',
-            'description',
-            'name',
-            'type',
-            'title'
-        ] if hasattr(module, attr)]
-        for attr in module_attrs:
-            handler_meta[attr] = getattr(module, attr)
-
-        # region icon
-        if hasattr(module, 'icon_path'):
-            icon_path = handler_dir.joinpath(module.icon_path)
-            handler_meta['icon'] = {
-                'name': icon_path.name,
-                'type': icon_path.name[icon_path.name.rfind('.') + 1:].lower()
-            }
-            if handler_meta['icon']['type'] == 'svg':
-                with open(str(icon_path), 'rt') as f:
-                    handler_meta['icon']['data'] = f.read()
-            else:
-                with open(str(icon_path), 'rb') as f:
-                    handler_meta['icon']['data'] = base64.b64encode(f.read()).decode('utf-8')
-        # endregion
-        if hasattr(module, 'permanent'):
-            handler_meta['permanent'] = module.permanent
-        else:
-            if handler_meta.get('name') in ('files', 'views', 'lightwood'):
-                handler_meta['permanent'] = True
-            else:
-                handler_meta['permanent'] = False
-
+        """ metadata of imported handler, module is registered as module of handler """
+        handler_meta = _get_module_meta(module)
+        with _handlers_lock:
+            _handler_modules[handler_meta['name']] = module
         return handler_meta
 
     def _load_handler_modules(self):
+        _load_handlers_meta()
+        self.handlers_import_status = _handlers_meta
+        self.handler_modules = HandlerModules()
+
+    def get_handlers_import_status(self):
+        """ Metadata of all handlers with the actual status of import. Handlers which were not
+            imported yet are imported
+        """
+        _import_all_handlers()
+        return self.handlers_import_status
+
+    def get_handlers_metadata(self):
+        """ Metadata of all handlers without import of them.
+            'import.success' is defined only for handlers which were imported
+        """
+        return self.handlers_import_status
+
+    def get_handler_meta(self, handler_name):
+        """ Metadata of the handler. Handler is imported to get the actual status of its import """
+        _import_handler(handler_name)
+        return self.handlers_import_status.get(handler_name)
+
+
+# region handlers modules
+# Metadata of all handlers is read from their sources once per process, handler's package is
+# imported only when handler is used or when the status of import of all handlers is requested.
+
+_handlers_meta = {}
+_handler_modules = {}
+_handlers_lock = threading.RLock()
+
+
+def _get_icon_meta(handler_dir: Path, icon_path: str) -> dict:
+    icon_path = handler_dir.joinpath(icon_path)
+    icon = {
+        'name': icon_path.name,
+        'type': icon_path.name[icon_path.name.rfind('.') + 1:].lower()
+    }
+    if icon['type'] == 'svg':
+        with open(str(icon_path), 'rt') as f:
+            icon['data'] = f.read()
+    else:
+        with open(str(icon_path), 'rb') as f:
+            icon['data'] = base64.b64encode(f.read()).decode('utf-8')
+    return icon
+
+
+def _make_handler_meta(handler_dir: Path, attrs: dict) -> dict:
+    handler_meta = {
+        'import': {
+            'folder': handler_dir.name,
+            'dependencies': read_dependencies(handler_dir)
+        },
+        'version': attrs.get('version')
+    }
+
+    for attr in ('connection_args_example', 'connection_args', 'description', 'name', 'type', 'title'):
+        if attr in attrs:
+            handler_meta[attr] = attrs[attr]
+
+    if 'icon_path' in attrs:
+        handler_meta['icon'] = _get_icon_meta(handler_dir, attrs['icon_path'])
+
+    if 'permanent' in attrs:
+        handler_meta['permanent'] = attrs['permanent']
+    else:
+        handler_meta['permanent'] = handler_meta.get('name') in ('files', 'views', 'lightwood')
+
+    return handler_meta
+
+
+def _get_module_meta(module) -> dict:
+    """ metadata of imported handler """
+    attrs = {
+        attr: getattr(module, attr)
+        for attr in HANDLER_ATTRS
+        if hasattr(module, attr)
+    }
+    handler_meta = _make_handler_meta(Path(module.__path__[0]), attrs)
+    import_error = getattr(module, 'import_error', None)
+    handler_meta['import']['success'] = import_error is None
+    if import_error is not None:
+        handler_meta['import']['error_message'] = str(import_error)
+    return handler_meta
+
+
+def _get_handler_static_meta(handler_dir: Path) -> dict:
+    """ metadata of handler which is read from its sources. Status of import
+        is not defined until the handler is imported.
+    """
+    attrs = read_handler_attrs(handler_dir)
+    return _make_handler_meta(handler_dir, attrs)
+
+
+def _get_import_error_meta(handler_dir: Path, error: Exception) -> dict:
+    handler_name = handler_dir.name
+    if handler_name.endswith('_handler'):
+        handler_name = handler_name[:-8]
+    return {
+        'import': {
+            'success': False,
+            'error_message': str(error),
+            'folder': handler_dir.name,
+            'dependencies': read_dependencies(handler_dir)
+        },
+        'name': handler_name
+    }
+
+
+def _import_handler_folder(handler_dir: Path) -> dict:
+    try:
+        handler_module = importlib.import_module(f'mindsdb.integrations.handlers.{handler_dir.name}')
+        handler_meta = _get_module_meta(handler_module)
+        if 'name' not in handler_meta:
+            raise Exception("Handler attribute 'name' is not defined")
+        _handler_modules[handler_meta['name']] = handler_module
+    except Exception as e:
+        handler_meta = _get_import_error_meta(handler_dir, e)
+        _handler_modules[handler_meta['name']] = None
+    return handler_meta
+
+
+def _load_handlers_meta():
+    with _handlers_lock:
+        if len(_handlers_meta) > 0:
+            return
         mindsdb_path = Path(importlib.util.find_spec('mindsdb').origin).parent
         handlers_path = mindsdb_path.joinpath('integrations/handlers')
-        self.handler_modules = {}
-        self.handlers_import_status = {}
         for handler_dir in handlers_path.iterdir():
             if handler_dir.is_dir() is False or handler_dir.name.startswith('__'):
                 continue
-            handler_folder_name = str(handler_dir.name)
-
             try:
-                handler_module = importlib.import_module(f'mindsdb.integrations.handlers.{handler_folder_name}')
-                handler_meta = self._get_handler_meta(handler_module)
+                handler_meta = _get_handler_static_meta(handler_dir)
             except Exception as e:
-                handler_name = handler_folder_name
-                if handler_name.endswith('_handler'):
-                    handler_name = handler_name[:-8]
-                dependencies = self._read_dependencies(handler_dir)
-                handler_meta = {
-                    'import': {
-                        'success': False,
-                        'error_message': str(e),
-                        'folder': handler_folder_name,
-                        'dependencies': dependencies
-                    },
-                    'name': handler_name
-                }
+                log.logger.warning(f"Can't read metadata of handler '{handler_dir.name}', importing it: {e}")
+                handler_meta = _import_handler_folder(handler_dir)
+            _handlers_meta[handler_meta['name']] = handler_meta
+
+
+def _import_handler(handler_name: str):
+    """ returns module of handler, imports it on first call. None if handler can't be imported """
+    with _handlers_lock:
+        if handler_name in _handler_modules:
+            return _handler_modules[handler_name]
+        handler_meta = _handlers_meta.get(handler_name)
+        if handler_meta is None:
+            return None
+        handler_dir = Path(importlib.util.find_spec('mindsdb').origin).parent.joinpath(
+            'integrations/handlers', handler_meta['import']['folder']
+        )
+        new_meta = _import_handler_folder(handler_dir)
+        if new_meta['name'] != handler_name:
+            # name in sources differs from name of imported module
+            _handler_modules[handler_name] = _handler_modules.pop(new_meta['name'], None)
+            new_meta['name'] = handler_name
+        # update in place: dict is shared between controllers
+        handler_meta.clear()
+        handler_meta.update(new_meta)
+        return _handler_modules[handler_name]
 
-            self.handlers_import_status[handler_meta['name']] = handler_meta
 
-    def get_handlers_import_status(self):
-        return self.handlers_import_status
+def _import_all_handlers():
+    """ imports handlers which were not imported yet """
+    for handler_name in list(_handlers_meta.keys()):
+        _import_handler(handler_name)
+
+
+class HandlerModules:
+    """ Dict-like access to modules of handlers, module is imported on first access """
+
+    def __getitem__(self, handler_name):
+        handler_module = _import_handler(handler_name)
+        if handler_module is None:
+            raise KeyError(handler_name)
+        return handler_module
+
+    def __contains__(self, handler_name):
+        return _import_handler(handler_name) is not None
+
+    def get(self, handler_name, default=None):
+        handler_module = _import_handler(handler_name)
+        if handler_module is None:
+            return default
+        return handler_module
+
+    def keys(self):
+        return _handlers_meta.keys()
+
+# endregion
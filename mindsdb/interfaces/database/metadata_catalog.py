@@ -0,0 +1,225 @@
+"""
+In-process catalog of metadata: projects, integrations, models and views of the company.
+
+Query planning and information_schema need the whole list of databases and models for every
+query. Catalog keeps a snapshot of them as plain dicts, indexed by names, and rebuilds it
+only when metadata is changed:
+
+    - a commit of the session which touched Project, Integration, Predictor or View records
+      increments the version of the catalog in the current process
+    - changes made by other processes are detected by the fingerprint of the metadata tables
+      (count of rows and time of the last update), which is checked not more often than
+      'check_interval' seconds
+
+Snapshot is shared between threads, its content must not be modified.
+
+Configuration:
+    "metadata_catalog": {
+        "enabled": true,
+        "check_interval": 1     # seconds
+    }
+"""
+
+import time
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import sqlalchemy as sa
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from mindsdb.interfaces.storage import db
+from mindsdb.utilities.config import Config
+from mindsdb.utilities.context import context as ctx
+
+CATALOG_MODELS = (db.Project, db.Integration, db.Predictor, db.View)
+
+
+class CatalogSnapshot:
+    def __init__(self):
+        # id -> {'id', 'name'}
+        self.projects = OrderedDict()
+        # list of {'id', 'name', 'engine'}
+        self.integrations = []
+        # list of models (including not active versions)
+        self.models = []
+        # name -> list of active models
+        self.models_by_name = {}
+        # list of {'id', 'name', 'project_id'}
+        self.views = []
+
+    def get_project_models(self, project_id: int) -> list:
+        return [model for model in self.models if model['project_id'] == project_id]
+
+    def get_project_views(self, project_id: int) -> list:
+        return [view for view in self.views if view['project_id'] == project_id]
+
+
+def _model_to_dict(predictor_record, integration_record) -> dict:
+    predictor_data = predictor_record.data or {}
+    metadata = {
+        'type': 'model',
+        'id': predictor_record.id,
+        'engine': integration_record.engine,
+        'engine_name': integration_record.name,
+        'active': predictor_record.active,
+        'version': predictor_record.version,
+        'status': predictor_record.status,
+        'accuracy': None,
+        'predict': predictor_record.to_predict[0],
+        'update_status': predictor_record.update_status,
+        'mindsdb_version': predictor_record.mindsdb_version,
+        'error': predictor_data.get('error'),
+        'select_data_query': predictor_record.fetch_data_query,
+        'training_options': predictor_record.learn_args,
+        'deletable': True,
+        'label': predictor_record.label,
+    }
+    if predictor_data.get('accuracies', None) is not None:
+        if len(predictor_data['accuracies']) > 0:
+            metadata['accuracy'] = float(np.mean(list(predictor_data['accuracies'].values())))
+    return {
+        'id': predictor_record.id,
+        'name': predictor_record.name,
+        'project_id': predictor_record.project_id,
+        'active': predictor_record.active,
+        'data': predictor_record.data,
+        'learn_args': predictor_record.learn_args,
+        'metadata': metadata
+    }
+
+
+class MetadataCatalog:
+    def __init__(self):
+        self._version = 0
+        # company_id -> [version, fingerprint, checked_at, snapshot]
+        self._snapshots = {}
+        # snapshots are valid only for database they were read from
+        self._engine = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_config() -> dict:
+        config = {
+            'enabled': True,
+            'check_interval': 1
+        }
+        config.update(Config().get('metadata_catalog', {}))
+        return config
+
+    def bump_version(self):
+        with self._lock:
+            self._version += 1
+
+    def _get_fingerprint(self, company_id) -> tuple:
+        columns = []
+        for model in CATALOG_MODELS:
+            columns.append(
+                sa.select(sa.func.count(model.id)).where(model.company_id == company_id).scalar_subquery()
+            )
+            columns.append(
+                sa.select(sa.func.max(model.id)).where(model.company_id == company_id).scalar_subquery()
+            )
+            if hasattr(model, 'updated_at'):
+                columns.append(
+                    sa.select(sa.func.max(model.updated_at)).where(model.company_id == company_id).scalar_subquery()
+                )
+        return tuple(db.session.execute(sa.select(*columns)).one())
+
+    def _build_snapshot(self, company_id) -> CatalogSnapshot:
+        snapshot = CatalogSnapshot()
+
+        project_records = db.session.query(db.Project).filter(
+            (db.Project.company_id == company_id)
+            & (db.Project.deleted_at == sa.null())
+        ).order_by(db.Project.name)
+        for record in project_records:
+            snapshot.projects[record.id] = {'id': record.id, 'name': record.name}
+
+        integration_records = db.session.query(db.Integration).filter_by(company_id=company_id)
+        for record in integration_records:
+            if record.data is None:
+                continue
+            snapshot.integrations.append({'id': record.id, 'name': record.name, 'engine': record.engine})
+
+        records = (
+            db.session.query(db.Predictor, db.Integration).filter_by(
+                deleted_at=sa.null(),
+                company_id=company_id
+            )
+            .join(db.Integration, db.Integration.id == db.Predictor.integration_id)
+            .order_by(db.Predictor.name, db.Predictor.id)
+            .all()
+        )
+        for predictor_record, integration_record in records:
+            model = _model_to_dict(predictor_record, integration_record)
+            snapshot.models.append(model)
+            if model['active'] is True:
+                snapshot.models_by_name.setdefault(model['name'], []).append(model)
+
+        view_records = (
+            db.session.query(db.View).filter_by(company_id=company_id)
+            .order_by(db.View.name, db.View.id)
+        )
+        for record in view_records:
+            snapshot.views.append({'id': record.id, 'name': record.name, 'project_id': record.project_id})
+
+        return snapshot
+
+    def get(self) -> CatalogSnapshot:
+        """ snapshot of metadata of the current company """
+        config = self.get_config()
+        company_id = ctx.company_id
+        if config['enabled'] is not True:
+            return self._build_snapshot(company_id)
+
+        with self._lock:
+            if self._engine is not db.engine:
+                self._engine = db.engine
+                self._snapshots = {}
+            version = self._version
+            entry = self._snapshots.get(company_id)
+
+        now = time.monotonic()
+        if entry is not None and entry[0] == version and now - entry[2] < config['check_interval']:
+            return entry[3]
+
+        fingerprint = self._get_fingerprint(company_id)
+        if entry is not None and entry[0] == version and entry[1] == fingerprint:
+            entry[2] = now
+            return entry[3]
+
+        snapshot = self._build_snapshot(company_id)
+        with self._lock:
+            self._snapshots[company_id] = [version, fingerprint, now, snapshot]
+        return snapshot
+
+    def clear(self):
+        with self._lock:
+            self._version += 1
+            self._snapshots = {}
+
+
+metadata_catalog = MetadataCatalog()
+
+
+@event.listens_for(Session, 'after_flush')
+def _track_metadata_changes(session, flush_context):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, CATALOG_MODELS):
+            session.info.setdefault('changed_metadata_catalogs', set()).add(metadata_catalog)
+            return
+
+
+@event.listens_for(Session, 'after_commit')
+def _bump_metadata_version(session):
+    catalogs = session.info.get('changed_metadata_catalogs', set())
+    if metadata_catalog in catalogs:
+        catalogs.discard(metadata_catalog)
+        metadata_catalog.bump_version()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _reset_metadata_changes(session):
+    session.info.get('changed_metadata_catalogs', set()).discard(metadata_catalog)
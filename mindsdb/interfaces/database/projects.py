@@ -1,10 +1,8 @@
 import datetime
 from typing import List
-from copy import deepcopy
 from collections import OrderedDict
 
 import sqlalchemy as sa
-import numpy as np
 
 from mindsdb_sql.parser.ast.base import ASTNode
 from mindsdb_sql import parse_sql
@@ -13,6 +11,7 @@ from mindsdb.interfaces.storage import db
 from mindsdb.utilities.config import Config
 from mindsdb.interfaces.model.model_controller import ModelController
 from mindsdb.interfaces.database.views import ViewController
+from mindsdb.interfaces.database.metadata_catalog import metadata_catalog
 from mindsdb.utilities.context import context as ctx
 
 
@@ -87,82 +86,44 @@ class Project:
         else:
             raise Exception(f"Can't delete table '{table_name}' because of it type: {table_meta['type']}")
 
-    def create_view(self, name: str, query: str):
+    def create_view(self, name: str, query: str, materialized: dict = None):
         ViewController().add(
             name,
             query=query,
+            project_name=self.name,
+            materialized=materialized
+        )
+
+    def get_view(self, name: str) -> dict:
+        return ViewController().get(
+            name=name,
             project_name=self.name
         )
 
     def query_view(self, query: ASTNode) -> ASTNode:
         view_name = query.from_table.parts[-1]
-        view_meta = ViewController().get(
-            name=view_name,
-            project_name=self.name
-        )
+        view_meta = self.get_view(view_name)
         subquery_ast = parse_sql(view_meta['query'], dialect='mindsdb')
         return subquery_ast
 
     def get_models(self):
-        records = (
-            db.session.query(db.Predictor, db.Integration).filter_by(
-                project_id=self.id,
-                deleted_at=sa.null(),
-                company_id=ctx.company_id
-            )
-            .join(db.Integration, db.Integration.id == db.Predictor.integration_id)
-            .order_by(db.Predictor.name, db.Predictor.id)
-            .all()
-        )
-
-        data = []
-
-        for predictor_record, integraion_record in records:
-            predictor_data = deepcopy(predictor_record.data) or {}
-            predictor_meta = {
-                'type': 'model',
-                'id': predictor_record.id,
-                'engine': integraion_record.engine,
-                'engine_name': integraion_record.name,
-                'active': predictor_record.active,
-                'version': predictor_record.version,
-                'status': predictor_record.status,
-                'accuracy': None,
-                'predict': predictor_record.to_predict[0],
-                'update_status': predictor_record.update_status,
-                'mindsdb_version': predictor_record.mindsdb_version,
-                'error': predictor_data.get('error'),
-                'select_data_query': predictor_record.fetch_data_query,
-                'training_options': predictor_record.learn_args,
-                'deletable': True,
-                'label': predictor_record.label,
-            }
-            if predictor_data is not None and predictor_data.get('accuracies', None) is not None:
-                if len(predictor_data['accuracies']) > 0:
-                    predictor_meta['accuracy'] = float(np.mean(list(predictor_data['accuracies'].values())))
-            data.append({'name': predictor_record.name, 'metadata': predictor_meta})
-
-        return data
+        catalog = metadata_catalog.get()
+        return [
+            {'name': model['name'], 'metadata': dict(model['metadata'])}
+            for model in catalog.get_project_models(self.id)
+        ]
 
     def get_views(self):
-        records = (
-            db.session.query(db.View).filter_by(
-                project_id=self.id,
-                company_id=ctx.company_id
-            )
-            .order_by(db.View.name, db.View.id)
-            .all()
-        )
-        data = [{
-            'name': view_record.name,
+        catalog = metadata_catalog.get()
+        return [{
+            'name': view['name'],
             'metadata': {
                 'type': 'view',
-                'id': view_record.id,
+                'id': view['id'],
                 'deletable': True
             }}
-            for view_record in records
+            for view in catalog.get_project_views(self.id)
         ]
-        return data
 
     def get_tables(self):
         data = OrderedDict()
@@ -1,9 +1,75 @@
+import time
+import json
+from typing import Optional
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pyarrow.dataset as ds
+import sqlalchemy as sa
+
 from mindsdb.interfaces.storage import db
+from mindsdb.interfaces.storage.fs import FileStorage, RESOURCE_GROUP
 from mindsdb.utilities.context import context as ctx
+from mindsdb.utilities.arrow import df_to_storage_table
+
+# refresh which is not finished in this count of seconds is considered as interrupted
+MATERIALIZED_REFRESH_TIMEOUT = 3600
+
+
+class MaterializedViewStorage:
+    """ Data of materialized view: parquet files in folder 'data' of view's file storage.
+        Full refresh writes file 'full-<time>.parquet', incremental refresh adds 'part-<time>.parquet'.
+        Data is the last 'full' file and parts added after it. Files of the previous full refresh
+        are kept until the next one, to not break reads started before the refresh.
+    """
+
+    def __init__(self, view_id: int):
+        self.file_storage = FileStorage(
+            resource_group=RESOURCE_GROUP.VIEW,
+            resource_id=view_id,
+            sync=True
+        )
+
+    @staticmethod
+    def _get_generations(path) -> list:
+        """ files of the folder split by full refreshes, from the oldest to the latest """
+        files = sorted(path.glob('*.parquet'), key=lambda x: int(x.stem.split('-')[-1]))
+        generations = [[]]
+        for file in files:
+            if file.stem.startswith('full-'):
+                generations.append([])
+            generations[-1].append(file)
+        return [x for x in generations if len(x) > 0]
+
+    def write(self, df: pd.DataFrame, append: bool = False):
+        path = self.file_storage.get_path('data')
+        path.mkdir(parents=True, exist_ok=True)
+        table = df_to_storage_table(df)
+        if append:
+            if len(df) == 0:
+                return
+            schema = self.get_dataset().schema
+            table = table.cast(schema)
+            pq.write_table(table, str(path / f'part-{time.time_ns()}.parquet'))
+        else:
+            pq.write_table(table, str(path / f'full-{time.time_ns()}.parquet'))
+            for files in self._get_generations(path)[:-2]:
+                for file in files:
+                    file.unlink()
+        self.file_storage.push()
+
+    def get_dataset(self) -> ds.Dataset:
+        path = self.file_storage.get_path('data')
+        generations = self._get_generations(path)
+        files = generations[-1] if len(generations) > 0 else []
+        return ds.dataset([str(x) for x in files], format='parquet')
+
+    def delete(self):
+        self.file_storage.delete()
 
 
 class ViewController:
-    def add(self, name, query, project_name):
+    def add(self, name, query, project_name, materialized=None):
         from mindsdb.interfaces.database.database import DatabaseController
 
         database_controller = DatabaseController()
@@ -28,7 +94,8 @@ class ViewController:
             name=name,
             company_id=ctx.company_id,
             query=query,
-            project_id=project_id
+            project_id=project_id,
+            materialized=materialized
         )
         db.session.add(view_record)
         db.session.commit()
@@ -46,13 +113,77 @@ class ViewController:
         ).first()
         if rec is None:
             raise Exception(f'View not found: {name}')
+        if rec.materialized is not None:
+            MaterializedViewStorage(rec.id).delete()
         db.session.delete(rec)
         db.session.commit()
 
+    def update_materialized_state(self, view_id, **state):
+        """ update state of refresh of materialized view """
+        rec = db.session.query(db.View).filter_by(id=view_id, company_id=ctx.company_id).first()
+        if rec is None or rec.materialized is None:
+            raise Exception(f'Materialized view not found: {view_id}')
+        materialized = dict(rec.materialized)
+        materialized.update(state)
+        rec.materialized = materialized
+        db.session.commit()
+        return materialized
+
+    def start_materialized_refresh(self, view_id) -> Optional[dict]:
+        """ Mark materialized view as refreshing. Mark is set by conditional update of stored state,
+            so only one query (also from other processes) refreshes the view at the time
+
+            Returns:
+                dict: state of view before the refresh, None if view is refreshing by another query
+        """
+        raw_materialized = sa.type_coerce(db.View.materialized, sa.String)
+        view_filter = (db.View.id == view_id) & (db.View.company_id == ctx.company_id)
+
+        raw_state = db.session.execute(sa.select(raw_materialized).where(view_filter)).scalar()
+        if raw_state is None:
+            raise Exception(f'Materialized view not found: {view_id}')
+        state = json.loads(raw_state)
+
+        if state.get('status') == 'refreshing':
+            started_at = state.get('refresh_started_at')
+            if started_at is not None and time.time() - started_at < MATERIALIZED_REFRESH_TIMEOUT:
+                return None
+
+        new_state = dict(state, status='refreshing', error=None, refresh_started_at=time.time())
+        result = db.session.execute(
+            sa.update(db.View)
+            .where(view_filter & (raw_materialized == raw_state))
+            .values(materialized=new_state)
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        if result.rowcount != 1:
+            # state was changed by another query
+            return None
+        return state
+
+    def get_materialized_list(self):
+        records = (
+            db.session.query(db.View, db.Project)
+            .filter(
+                (db.View.company_id == ctx.company_id)
+                & (db.View.materialized != None)  # noqa
+            )
+            .join(db.Project, db.Project.id == db.View.project_id)
+            .order_by(db.Project.name, db.View.name)
+            .all()
+        )
+        return [
+            dict(project_name=project_record.name, **self._get_view_record_data(view_record))
+            for view_record, project_record in records
+        ]
+
     def _get_view_record_data(self, record):
         return {
+            'id': record.id,
             'name': record.name,
-            'query': record.query
+            'query': record.query,
+            'materialized': record.materialized
         }
 
     def get(self, id=None, name=None, project_name=None):
@@ -1,14 +1,40 @@
 import os
 import json
-from pathlib import Path
 import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from mindsdb.interfaces.storage import db
 from mindsdb.integrations.handlers.file_handler import Handler as FileHandler
 from mindsdb.utilities import log
+from mindsdb.utilities.arrow import df_to_storage_table
 from mindsdb.utilities.config import Config
 from mindsdb.interfaces.storage.fs import FsStore
 from mindsdb.utilities.context import context as ctx
+from mindsdb.api.mysql.mysql_proxy.utilities.query_cache import invalidate_query_cache
+
+# uploaded file is parsed once and stored near the source in columnar format, queries scan it
+DATA_FILE_NAME = 'data.parquet'
+
+# (company_id, name) -> progress of files which are being saved
+_uploads_progress = {}
+_uploads_lock = threading.Lock()
+
+
+def _get_data_meta(schema: pa.Schema) -> dict:
+    return {
+        'format': 'parquet',
+        'data_file': DATA_FILE_NAME,
+        'schema': [
+            {'name': field.name, 'type': str(field.type)}
+            for field in schema
+        ]
+    }
 
 
 class FileController():
@@ -35,7 +61,8 @@ class FileController():
         return {
             'name': file_record.name,
             'columns': columns,
-            'row_count': file_record.row_count
+            'row_count': file_record.row_count,
+            'metadata': file_record.metadata_
         }
 
     def get_files(self):
@@ -70,14 +97,33 @@ class FileController():
         if file_name is None:
             file_name = Path(file_path).name
 
+        upload_key = (ctx.company_id, name)
+        progress = {
+            'status': 'processing',
+            'bytes_read': 0,
+            'bytes_total': os.path.getsize(file_path),
+            'row_count': 0
+        }
+        with _uploads_lock:
+            _uploads_progress[upload_key] = progress
+
         file_dir = None
+        data_fd, data_path = tempfile.mkstemp(prefix='mindsdb_file_', suffix='.parquet')
+        os.close(data_fd)
+        data_path = Path(data_path)
         try:
-            df, _col_map = FileHandler._handle_source(file_path)
-
-            ds_meta = {
-                'row_count': len(df),
-                'column_names': list(df.columns)
-            }
+            try:
+                ds_meta = self._convert_file(file_path, data_path, progress)
+            except Exception as e:
+                # types of columns differ between chunks: parse the whole file at once
+                log.logger.warning(f"Can't convert file by chunks: {e}")
+                df, _col_map = FileHandler._handle_source(file_path)
+                ds_meta = {
+                    'row_count': len(df),
+                    'column_names': list(df.columns),
+                    'metadata': self._write_data(df, data_path)
+                }
+                del df
 
             file_record = db.File(
                 name=name,
@@ -85,30 +131,102 @@ class FileController():
                 source_file_path=file_name,
                 file_path='',
                 row_count=ds_meta['row_count'],
-                columns=ds_meta['column_names']
+                columns=ds_meta['column_names'],
+                metadata_=ds_meta['metadata']
             )
             db.session.add(file_record)
             db.session.commit()
             store_file_path = f'file_{ctx.company_id}_{file_record.id}'
-            file_record.file_path = store_file_path
-            db.session.commit()
 
             file_dir = Path(self.dir).joinpath(store_file_path)
             file_dir.mkdir(parents=True, exist_ok=True)
             source = file_dir.joinpath(file_name)
             # NOTE may be delay between db record exists and file is really in folder
             shutil.move(file_path, str(source))
+            if ds_meta['metadata'] is not None:
+                shutil.move(str(data_path), str(file_dir.joinpath(DATA_FILE_NAME)))
+
+            file_record.file_path = store_file_path
+            db.session.commit()
 
             self.fs_store.put(store_file_path, base_dir=self.dir)
+            invalidate_query_cache('files')
         except Exception as e:
             log.logger.error(e)
             raise
         finally:
+            with _uploads_lock:
+                _uploads_progress.pop(upload_key, None)
+            if data_path.exists():
+                data_path.unlink()
             if file_dir is not None:
                 shutil.rmtree(file_dir)
 
         return file_record.id
 
+    def get_upload_progress(self, name):
+        """ progress of the file which is being saved now, None if there is no such file """
+        with _uploads_lock:
+            progress = _uploads_progress.get((ctx.company_id, name))
+            if progress is None:
+                return None
+            return dict(progress)
+
+    @staticmethod
+    def _convert_file(file_path, data_path: Path, progress: dict) -> dict:
+        """ parse the file by chunks and append them to parquet, memory usage doesn't depend
+            on size of the file
+
+            Returns:
+                dict: count of rows, names of columns and metadata of stored data
+        """
+        def on_progress(bytes_read, bytes_total):
+            progress['bytes_read'] = bytes_read
+            progress['bytes_total'] = bytes_total
+
+        writer = None
+        column_names = None
+        row_count = 0
+        try:
+            for df in FileHandler._iter_source(file_path, progress_callback=on_progress):
+                table = df_to_storage_table(df)
+                if writer is None:
+                    column_names = list(df.columns)
+                    writer = pq.ParquetWriter(str(data_path), table.schema)
+                else:
+                    # types are defined by the first chunk
+                    table = table.cast(writer.schema)
+                writer.write_table(table)
+                row_count += len(df)
+                progress['row_count'] = row_count
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if writer is None:
+            raise ValueError('File has no data')
+
+        return {
+            'row_count': row_count,
+            'column_names': column_names,
+            'metadata': _get_data_meta(writer.schema)
+        }
+
+    @staticmethod
+    def _write_data(df: pd.DataFrame, path: Path):
+        """ store parsed file as parquet
+
+            Returns:
+                dict: metadata of stored data, None if data can't be stored
+        """
+        try:
+            table = df_to_storage_table(df)
+            pq.write_table(table, str(path))
+        except Exception as e:
+            log.logger.warning(f"Can't store file data in parquet, it will be parsed on every query: {e}")
+            return None
+        return _get_data_meta(table.schema)
+
     def delete_file(self, name):
         file_record = db.session.query(db.File).filter_by(company_id=ctx.company_id, name=name).first()
         if file_record is None:
@@ -117,6 +235,7 @@ class FileController():
         db.session.delete(file_record)
         db.session.commit()
         self.fs_store.delete(f'file_{ctx.company_id}_{file_id}')
+        invalidate_query_cache('files')
         return True
 
     def get_file_path(self, name):
@@ -126,3 +245,15 @@ class FileController():
         file_dir = f'file_{ctx.company_id}_{file_record.id}'
         self.fs_store.get(file_dir, base_dir=self.dir)
         return str(Path(self.dir).joinpath(file_dir).joinpath(Path(file_record.source_file_path).name))
+
+    def get_file_data_path(self, name):
+        """ path to parquet with parsed data of file, None if file was stored without it """
+        file_record = db.session.query(db.File).filter_by(company_id=ctx.company_id, name=name).first()
+        if file_record is None:
+            raise Exception(f"File '{name}' does not exists")
+        file_meta = file_record.metadata_
+        if file_meta is None or file_meta.get('format') != 'parquet':
+            return None
+        file_dir = f'file_{ctx.company_id}_{file_record.id}'
+        self.fs_store.get(file_dir, base_dir=self.dir)
+        return str(Path(self.dir).joinpath(file_dir).joinpath(file_meta['data_file']))
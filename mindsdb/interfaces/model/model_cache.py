@@ -0,0 +1,157 @@
+"""
+In-process cache of loaded model objects.
+
+Loading a predictor (pulling its files from storage and deserializing them) is
+much more expensive than running a prediction on a few rows, so ML handlers can
+keep the loaded object here between requests:
+
+    from mindsdb.interfaces.model.model_cache import get_model_cache
+
+    cache = get_model_cache()
+    predictor = cache.get(key)
+    if predictor is None:
+        predictor = load_predictor()
+        cache.set(key, predictor, size=size_in_bytes)
+
+Key is tuple (predictor_id, version, updated_at): any change of the predictor
+record produces a new key, and setting a new key for a predictor drops the
+entries of its older states.
+
+Cached object is shared by all threads of the process. If using of the object changes its
+state, it has to be used under the lock, which is stored together with the object:
+
+    predictor, lock = cache.get_with_lock(key)
+    if predictor is None:
+        predictor = load_predictor()
+        lock = cache.set(key, predictor, size=size_in_bytes)
+    with lock or nullcontext():
+        predictor.predict(df)
+
+Cache is bounded by approximate memory usage (size of the object is supplied by
+the caller, e.g. size of serialized model on disk). Least recently used models
+are evicted first.
+
+Configuration:
+    "model_cache": {
+        "enabled": true,
+        "max_size_mb": 1024
+    }
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from mindsdb.utilities.config import Config
+
+
+def get_path_size(path) -> int:
+    """ size of file or directory in bytes """
+    path = Path(path)
+    if path.is_file():
+        return os.path.getsize(path)
+    size = 0
+    for file in path.rglob('*'):
+        if file.is_file():
+            size += os.path.getsize(file)
+    return size
+
+
+class ModelCache:
+    def __init__(self, max_size=None, enabled=None):
+        config = Config().get('model_cache', {})
+        if max_size is None:
+            max_size = int(config.get('max_size_mb', 1024) * 1024 * 1024)
+        if enabled is None:
+            enabled = config.get('enabled', True)
+        self.max_size = max_size
+        self.enabled = enabled
+
+        # key -> (model, size, lock)
+        self._models = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._models:
+                self.misses += 1
+                return None
+            self._models.move_to_end(key)
+            self.hits += 1
+            return self._models[key][0]
+
+    def get_with_lock(self, key):
+        """ returns cached model and lock to use it, (None, None) if it is not cached """
+        with self._lock:
+            if key not in self._models:
+                self.misses += 1
+                return None, None
+            self._models.move_to_end(key)
+            self.hits += 1
+            model, _, lock = self._models[key]
+            return model, lock
+
+    def set(self, key, model, size=0):
+        """ adds model to cache, returns lock to use it or None if model is not cached """
+        if not self.enabled or size > self.max_size:
+            return None
+
+        with self._lock:
+            # previous states of the same predictor are not valid anymore
+            for cached_key in list(self._models.keys()):
+                if cached_key[0] == key[0]:
+                    self._pop(cached_key)
+
+            lock = threading.Lock()
+            self._models[key] = (model, size, lock)
+            self._size += size
+
+            while self._size > self.max_size and len(self._models) > 1:
+                self._pop(next(iter(self._models)))
+                self.evictions += 1
+            return lock
+
+    def invalidate(self, predictor_id):
+        """ remove all cached states of predictor """
+        with self._lock:
+            for cached_key in list(self._models.keys()):
+                if cached_key[0] == predictor_id:
+                    self._pop(cached_key)
+
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'models': len(self._models),
+                'size': self._size,
+                'max_size': self.max_size
+            }
+
+    def _pop(self, key):
+        _, size, _ = self._models.pop(key)
+        self._size -= size
+
+
+_model_cache = None
+_model_cache_lock = threading.Lock()
+
+
+def get_model_cache() -> ModelCache:
+    global _model_cache
+    with _model_cache_lock:
+        if _model_cache is None:
+            _model_cache = ModelCache()
+    return _model_cache
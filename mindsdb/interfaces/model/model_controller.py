@@ -20,6 +20,7 @@ from mindsdb.interfaces.model.functions import (
 )
 from mindsdb.interfaces.storage.json import get_json_storage
 from mindsdb.interfaces.storage.model_fs import ModelStorage
+from mindsdb.interfaces.model.model_cache import get_model_cache
 from mindsdb.utilities.context import context as ctx
 
 IS_PY36 = sys.version_info[1] <= 6
@@ -156,6 +157,7 @@ class ModelController():
                 db.session.delete(predictor_record)
             modelStorage = ModelStorage(predictor_record.id)
             modelStorage.delete()
+            get_model_cache().invalidate(predictor_record.id)
         db.session.commit()
 
     def rename_model(self, old_name, new_name):
@@ -474,6 +476,7 @@ class ModelController():
                 db.session.delete(model_record)
             modelStorage = ModelStorage(model_record.id)
             modelStorage.delete()
+            get_model_cache().invalidate(model_record.id)
 
         db.session.commit()
 
@@ -196,6 +196,8 @@ class File(Base):
     file_path = Column(String, nullable=False)
     row_count = Column(Integer, nullable=False)
     columns = Column(Json, nullable=False)
+    # format and schema of data stored for queries
+    metadata_ = Column('metadata', Json, nullable=True)
     created_at = Column(DateTime, default=datetime.datetime.now)
     updated_at = Column(DateTime, default=datetime.datetime.now, onupdate=datetime.datetime.now)
     __table_args__ = (
@@ -210,6 +212,7 @@ class View(Base):
     company_id = Column(Integer)
     query = Column(String, nullable=False)
     project_id = Column(Integer, ForeignKey('project.id', name='fk_project_id'), nullable=False)
+    materialized = Column(Json, nullable=True)  # settings and state of refresh of materialized view
     __table_args__ = (
         UniqueConstraint('name', 'company_id', name='unique_view_name_company_id'),
     )
@@ -1,4 +1,6 @@
 import os
+import json
+import uuid
 import shutil
 import hashlib
 from pathlib import Path
@@ -21,6 +23,7 @@ from mindsdb.utilities.context import context as ctx
 class RESOURCE_GROUP:
     PREDICTOR = 'predictor'
     INTEGRATION = 'integration'
+    VIEW = 'view'
 
 
 RESOURCE_GROUP = RESOURCE_GROUP()
@@ -44,6 +47,114 @@ def copy(src, dst):
         shutil.copy2(src, dst)
 
 
+# region manifests
+# Manifest of resource folder is json stored near the folder: {name}.manifest.json
+#   {"version": str, "files": {relative path: {"hash": str, "size": int, "mtime": int}}}
+# Version is changed on every put of changed content. Local copy of resource keeps manifest
+# of version it was synced with, so get/put can skip sync or copy only changed files.
+
+MANIFEST_SUFFIX = '.manifest.json'
+
+
+def is_resource_name(name: str) -> bool:
+    # top level folder of resource, not path inside it
+    return len(Path(name).parts) == 1
+
+
+def manifest_path(base_dir, name) -> str:
+    return os.path.join(base_dir, f'{name}{MANIFEST_SUFFIX}')
+
+
+def read_manifest(path) -> Optional[dict]:
+    try:
+        with open(path, 'r') as fd:
+            return json.load(fd)
+    except (OSError, ValueError):
+        return None
+
+
+def write_manifest(path, manifest: dict):
+    tmp_path = f'{path}.{uuid.uuid4().hex}.tmp'
+    with open(tmp_path, 'w') as fd:
+        json.dump(manifest, fd)
+    os.replace(tmp_path, path)
+
+
+def remove_manifest(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def file_hash(path) -> str:
+    md5 = hashlib.md5()
+    with open(path, 'rb') as fd:
+        for chunk in iter(lambda: fd.read(1024 * 1024), b''):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def scan_dir(path, previous: Optional[dict] = None, rehash: bool = True) -> dict:
+    """Get state of files in folder
+
+    Hash of file is taken from previous scan if size and mtime of the file are not changed.
+    Otherwise file is hashed, or gets hash None if rehash is False
+
+    Returns:
+        dict: {relative path: {"hash": str, "size": int, "mtime": int}}
+    """
+    previous = previous or {}
+    files = {}
+    for root, _, names in os.walk(path):
+        for name in names:
+            abs_path = os.path.join(root, name)
+            rel_path = os.path.relpath(abs_path, path)
+            stat = os.stat(abs_path)
+            prev = previous.get(rel_path)
+            if prev is not None and prev.get('size') == stat.st_size and prev.get('mtime') == stat.st_mtime_ns:
+                checksum = prev['hash']
+            elif rehash:
+                checksum = file_hash(abs_path)
+            else:
+                checksum = None
+            files[rel_path] = {'hash': checksum, 'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+    return files
+
+
+def sync_dir(src, dst, src_files: dict, dst_files: dict):
+    """Make content of dst folder the same as src, copy only changed files"""
+    os.makedirs(dst, exist_ok=True)
+    for rel_path, info in src_files.items():
+        dst_info = dst_files.get(rel_path)
+        if dst_info is not None and info['hash'] is not None and dst_info['hash'] == info['hash']:
+            continue
+        dst_path = os.path.join(dst, rel_path)
+        os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+        shutil.copy2(os.path.join(src, rel_path), dst_path)
+    for rel_path in dst_files:
+        if rel_path not in src_files:
+            try:
+                os.remove(os.path.join(dst, rel_path))
+            except FileNotFoundError:
+                pass
+
+
+def local_files_state(path, files: dict) -> dict:
+    """State of local copy of files with known hashes"""
+    state = {}
+    for rel_path, info in files.items():
+        stat = os.stat(os.path.join(path, rel_path))
+        state[rel_path] = {'hash': info['hash'], 'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+    return state
+
+
+def files_hashes(files: dict) -> dict:
+    return {rel_path: info['hash'] for rel_path, info in files.items()}
+
+# endregion
+
+
 class BaseFSStore(ABC):
     """Base class for file storage
     """
@@ -91,17 +202,72 @@ class LocalFSStore(BaseFSStore):
 
     def get(self, local_name, base_dir):
         remote_name = local_name
-        copy(
-            os.path.join(self.storage, remote_name),
-            os.path.join(base_dir, local_name)
-        )
+        src = os.path.join(self.storage, remote_name)
+        dst = os.path.join(base_dir, local_name)
+
+        if not is_resource_name(local_name) or not os.path.isdir(src):
+            copy(src, dst)
+            return
+
+        remote_manifest = self._get_manifest(remote_name)
+        local_manifest_path = manifest_path(base_dir, local_name)
+        local_manifest = read_manifest(local_manifest_path) or {'version': None, 'files': {}}
+        if local_manifest['version'] == remote_manifest['version'] and os.path.isdir(dst):
+            return
+
+        # changed local files are copied again, without hashing
+        local_files = scan_dir(dst, local_manifest['files'], rehash=False) if os.path.isdir(dst) else {}
+        sync_dir(src, dst, remote_manifest['files'], local_files)
+
+        write_manifest(local_manifest_path, {
+            'version': remote_manifest['version'],
+            'files': local_files_state(dst, remote_manifest['files'])
+        })
 
     def put(self, local_name, base_dir):
         remote_name = local_name
-        copy(
-            os.path.join(base_dir, local_name),
-            os.path.join(self.storage, remote_name)
-        )
+        src = os.path.join(base_dir, local_name)
+        dst = os.path.join(self.storage, remote_name)
+
+        if not is_resource_name(local_name) or not os.path.isdir(src):
+            copy(src, dst)
+            # manifest of resource is not actual anymore
+            remove_manifest(manifest_path(self.storage, Path(remote_name).parts[0]))
+            return
+
+        local_manifest_path = manifest_path(base_dir, local_name)
+        local_manifest = read_manifest(local_manifest_path) or {'version': None, 'files': {}}
+        local_files = scan_dir(src, local_manifest['files'])
+
+        remote_manifest = {'version': None, 'files': {}}
+        if os.path.isdir(dst):
+            remote_manifest = self._get_manifest(remote_name)
+
+        version = remote_manifest['version']
+        if version is None or files_hashes(local_files) != files_hashes(remote_manifest['files']):
+            sync_dir(src, dst, local_files, remote_manifest['files'])
+            version = uuid.uuid4().hex
+            write_manifest(manifest_path(self.storage, remote_name), {
+                'version': version,
+                'files': local_files_state(dst, local_files)
+            })
+
+        write_manifest(local_manifest_path, {
+            'version': version,
+            'files': local_files
+        })
+
+    def _get_manifest(self, remote_name):
+        path = manifest_path(self.storage, remote_name)
+        manifest = read_manifest(path)
+        if manifest is None:
+            # resource without manifest: build it once
+            manifest = {
+                'version': uuid.uuid4().hex,
+                'files': scan_dir(os.path.join(self.storage, remote_name))
+            }
+            write_manifest(path, manifest)
+        return manifest
 
     def delete(self, remote_name):
         pass
@@ -121,6 +287,19 @@ class S3FSStore(BaseFSStore):
 
     def get(self, local_name, base_dir):
         remote_name = local_name
+
+        local_manifest_path = manifest_path(base_dir, local_name)
+        remote_manifest = None
+        if is_resource_name(local_name):
+            remote_manifest = self._get_manifest(remote_name)
+            local_manifest = read_manifest(local_manifest_path) or {'version': None}
+            if (
+                remote_manifest is not None
+                and local_manifest['version'] == remote_manifest['version']
+                and os.path.isdir(os.path.join(base_dir, local_name))
+            ):
+                return
+
         remote_ziped_name = f'{remote_name}.tar.gz'
         local_ziped_name = f'{local_name}.tar.gz'
         local_ziped_path = os.path.join(base_dir, local_ziped_name)
@@ -130,10 +309,31 @@ class S3FSStore(BaseFSStore):
         os.system(f'chmod -R 777 {base_dir}')
         os.remove(local_ziped_path)
 
+        if remote_manifest is not None:
+            write_manifest(local_manifest_path, {
+                'version': remote_manifest['version'],
+                'files': local_files_state(os.path.join(base_dir, local_name), remote_manifest['files'])
+            })
+
     def put(self, local_name, base_dir):
+        remote_name = local_name
+
+        local_path = os.path.join(base_dir, local_name)
+        local_manifest_path = manifest_path(base_dir, local_name)
+        local_files = None
+        if is_resource_name(local_name) and os.path.isdir(local_path):
+            local_manifest = read_manifest(local_manifest_path) or {'files': {}}
+            local_files = scan_dir(local_path, local_manifest['files'])
+            remote_manifest = self._get_manifest(remote_name)
+            if (
+                remote_manifest is not None
+                and files_hashes(local_files) == files_hashes(remote_manifest['files'])
+            ):
+                # content is not changed
+                return
+
         # NOTE: This `make_archive` function is implemente poorly and will create an empty archive file even if
         # the file/dir to be archived doesn't exist or for some other reason can't be archived
-        remote_name = local_name
         shutil.make_archive(
             os.path.join(base_dir, remote_name),
             'gztar',
@@ -147,8 +347,28 @@ class S3FSStore(BaseFSStore):
         )
         os.remove(os.path.join(base_dir, remote_name + '.tar.gz'))
 
+        if local_files is not None:
+            manifest = {
+                'version': uuid.uuid4().hex,
+                'files': local_files
+            }
+            self.s3.put_object(
+                Bucket=self.bucket,
+                Key=f'{remote_name}{MANIFEST_SUFFIX}',
+                Body=json.dumps(manifest).encode()
+            )
+            write_manifest(local_manifest_path, manifest)
+
+    def _get_manifest(self, remote_name) -> Optional[dict]:
+        try:
+            obj = self.s3.get_object(Bucket=self.bucket, Key=f'{remote_name}{MANIFEST_SUFFIX}')
+            return json.loads(obj['Body'].read())
+        except Exception:
+            return None
+
     def delete(self, remote_name):
         self.s3.delete_object(Bucket=self.bucket, Key=remote_name)
+        self.s3.delete_object(Bucket=self.bucket, Key=f'{remote_name}{MANIFEST_SUFFIX}')
 
 
 def FsStore():
@@ -331,6 +551,7 @@ class FileStorage:
 
     def complete_removal(self):
         shutil.rmtree(str(self.folder_path))
+        remove_manifest(manifest_path(self.resource_group_path, self.folder_name))
         self.fs_store.delete(self.folder_name)
 
 
@@ -0,0 +1,28 @@
+"""materialized_view
+
+Revision ID: 6a8b1c2d3e4f
+Revises: 459218b0844c
+Create Date: 2023-01-20 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+import mindsdb.interfaces.storage.db as db
+
+
+# revision identifiers, used by Alembic.
+revision = '6a8b1c2d3e4f'
+down_revision = '459218b0844c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('view', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('materialized', db.Json(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('view', schema=None) as batch_op:
+        batch_op.drop_column('materialized')
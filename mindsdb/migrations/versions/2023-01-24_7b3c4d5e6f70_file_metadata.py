@@ -0,0 +1,28 @@
+"""file_metadata
+
+Revision ID: 7b3c4d5e6f70
+Revises: 6a8b1c2d3e4f
+Create Date: 2023-01-24 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+import mindsdb.interfaces.storage.db as db
+
+
+# revision identifiers, used by Alembic.
+revision = '7b3c4d5e6f70'
+down_revision = '6a8b1c2d3e4f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('file', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('metadata', db.Json(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('file', schema=None) as batch_op:
+        batch_op.drop_column('metadata')
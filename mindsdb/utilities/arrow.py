@@ -0,0 +1,41 @@
+import typing as t
+
+import pandas as pd
+import pyarrow as pa
+
+
+def df_to_arrow_table(df: pd.DataFrame) -> t.Optional[pa.Table]:
+    """ Converts dataframe to arrow table, if dataframe can be restored from it without changes.
+
+        Returns:
+            pa.Table or None: if columns names are not strings, or dataframe can't be converted,
+                or object column is not converted to string/null arrow type
+                (it would be restored with other dtype)
+    """
+    if not all(isinstance(col, str) for col in df.columns):
+        return None
+    try:
+        table = pa.Table.from_pandas(df)
+    except (pa.ArrowException, ValueError, TypeError):
+        return None
+    for col, dtype in df.dtypes.items():
+        if dtype == object:
+            arrow_type = table.schema.field(col).type
+            if not (pa.types.is_string(arrow_type) or pa.types.is_null(arrow_type)):
+                return None
+    return table
+
+
+def df_to_storage_table(df: pd.DataFrame) -> pa.Table:
+    """ Converts dataframe to arrow table to be stored in parquet. Unlike df_to_arrow_table
+        it always succeeds: column names are converted to strings, columns with mixed types
+        are stored as strings.
+    """
+    df = df.rename(columns=str)
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowException, ValueError, TypeError):
+        for col, dtype in df.dtypes.items():
+            if dtype == object:
+                df[col] = df[col].map(lambda x: x if x is None else str(x))
+        return pa.Table.from_pandas(df, preserve_index=False)
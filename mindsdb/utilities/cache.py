@@ -19,7 +19,10 @@ How to use it:
 Configuration:
 
 - max_size size of cache in count of records, default is 50
-- serializer, module for serialization, default is dill
+- serializer, module for serialization, default is dill.
+    Dataframes are stored in parquet if they can be restored from it without changes
+- memory_size_mb: size of in-process LRU tier in front of file/redis cache, per category.
+    Default is 64, 0 disables it
 
 It can be set via:
 - get_cache function:
@@ -54,16 +57,23 @@ How to test:
 
 import os
 import time
+import threading
 from abc import ABC
 from pathlib import Path
+from collections import OrderedDict
 import hashlib
 import typing as t
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import walrus
 
 from mindsdb.utilities.config import Config
 from mindsdb.utilities.json_encoder import CustomJSONEncoder
+from mindsdb.utilities.arrow import df_to_arrow_table
+
+PARQUET_MAGIC = b'PAR1'
 
 
 def dataframe_checksum(df: pd.DataFrame):
@@ -81,8 +91,71 @@ def str_checksum(obj: str):
     return checksum
 
 
+def _df_to_parquet(df: pd.DataFrame) -> t.Optional[bytes]:
+    # returns None if dataframe can't be restored from parquet without changes
+    table = df_to_arrow_table(df)
+    if table is None:
+        return None
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink)
+    return sink.getvalue().to_pybytes()
+
+
+class MemoryTier:
+    """
+        In-process LRU storage of serialized values, bounded by size in bytes and count of items.
+        Is placed in front of file/redis cache
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        with self._lock:
+            value = self._items.get(name)
+            if value is not None:
+                self._items.move_to_end(name)
+            return value
+
+    def set(self, name, value, max_count=None):
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if name in self._items:
+                self.size -= len(self._items.pop(name))
+            self._items[name] = value
+            self.size += len(value)
+            while self.size > self.max_bytes or (max_count is not None and len(self._items) > max_count):
+                _, old_value = self._items.popitem(last=False)
+                self.size -= len(old_value)
+
+    def delete(self, name):
+        with self._lock:
+            if name in self._items:
+                self.size -= len(self._items.pop(name))
+
+
+_memory_tiers = {}
+_memory_tiers_lock = threading.Lock()
+
+
+# categories of redis cache, which were checked for hash of access times of previous versions
+_redis_migrated_categories = set()
+_redis_migration_lock = threading.Lock()
+
+
+def get_memory_tier(name, max_bytes) -> MemoryTier:
+    with _memory_tiers_lock:
+        if name not in _memory_tiers:
+            _memory_tiers[name] = MemoryTier(max_bytes)
+        return _memory_tiers[name]
+
+
 class BaseCache(ABC):
-    def __init__(self, max_size=None, serializer=None):
+    def __init__(self, max_size=None, serializer=None, memory_size=None):
         self.config = Config()
         if max_size is None:
             max_size = self.config["cache"].get("max_size", 50)
@@ -93,10 +166,42 @@ class BaseCache(ABC):
                 import pickle as s_module
             else:
                 import dill as s_module
-            self.serializer = s_module
+            serializer = s_module
+        self.serializer = serializer
+        if memory_size is None:
+            memory_size = self.config["cache"].get("memory_size_mb", 64) * 1024 * 1024
+        self.memory_size = memory_size
+
+    def _get_memory_tier(self, category):
+        if self.memory_size <= 0:
+            return None
+        return get_memory_tier(f'{self.__class__.__name__}_{category}', self.memory_size)
 
     # default functions
 
+    def set(self, name, value):
+        value = self.serialize(value)
+        if self.memory is not None:
+            self.memory.set(name, value, max_count=self.max_size)
+        self._set(name, value)
+
+    def get(self, name):
+        value = None
+        if self.memory is not None:
+            value = self.memory.get(name)
+        if value is None:
+            value = self._get(name)
+            if value is None:
+                return None
+            if self.memory is not None:
+                self.memory.set(name, value, max_count=self.max_size)
+        return self.deserialize(value)
+
+    def delete(self, name):
+        if self.memory is not None:
+            self.memory.delete(name)
+        self._delete(name)
+
     def set_df(self, name, df):
         return self.set(name, df)
 
@@ -104,9 +209,16 @@ class BaseCache(ABC):
         return self.get(name)
 
     def serialize(self, value):
+        if isinstance(value, pd.DataFrame):
+            # dataframes are stored in parquet if it is possible
+            parquet = _df_to_parquet(value)
+            if parquet is not None:
+                return parquet
         return self.serializer.dumps(value)
 
     def deserialize(self, value):
+        if value[:len(PARQUET_MAGIC)] == PARQUET_MAGIC:
+            return pq.read_table(pa.BufferReader(value)).to_pandas()
         return self.serializer.loads(value)
 
 
@@ -123,6 +235,7 @@ class FileCache(BaseCache):
             os.makedirs(cache_path)
 
         self.path = cache_path
+        self.memory = self._get_memory_tier(str(cache_path))
 
     def clear_old_cache(self):
         # buffer to delete, to not run delete on every adding
@@ -131,54 +244,45 @@ class FileCache(BaseCache):
         if self.max_size is None:
             return
 
-        cur_count = len(os.listdir(self.path))
+        files = list(os.scandir(self.path))
+        cur_count = len(files)
 
-        # remove oldest
+        # remove least recently used: mtime is updated on reading
         if cur_count > self.max_size + buffer_size:
-
-            files = sorted(Path(self.path).iterdir(), key=os.path.getmtime)
+            files.sort(key=lambda x: x.stat().st_mtime)
             for file in files[:cur_count - self.max_size]:
-                self.delete_file(file)
+                self.delete_file(file.path)
 
     def file_path(self, name):
         return self.path / name
 
-    def set_df(self, name, df):
+    def _set(self, name, value):
         path = self.file_path(name)
-        df.to_pickle(path)
-        self.clear_old_cache()
-
-    def set(self, name, value):
-        path = self.file_path(name)
-        value = self.serialize(value)
 
         with open(path, 'wb') as fd:
             fd.write(value)
         self.clear_old_cache()
 
-    def get_df(self, name):
+    def _get(self, name):
         path = self.file_path(name)
 
-        if not os.path.exists(path):
+        try:
+            with open(path, 'rb') as fd:
+                value = fd.read()
+            os.utime(path)
+        except FileNotFoundError:
             return None
-        return pd.read_pickle(path)
-
-    def get(self, name):
-        path = self.file_path(name)
-
-        if not os.path.exists(path):
-            return None
-        with open(path, 'rb') as fd:
-            value = fd.read()
-        value = self.deserialize(value)
         return value
 
-    def delete(self, name):
+    def _delete(self, name):
         path = self.file_path(name)
         self.delete_file(path)
 
     def delete_file(self, path):
-        os.unlink(path)
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
 
 
 class RedisCache(BaseCache):
@@ -186,11 +290,14 @@ class RedisCache(BaseCache):
         super().__init__(**kwargs)
 
         self.category = category
+        # sorted set: key -> time of last access
+        self.access_key = f'{category}__access'
 
         if connection_info is None:
             # if no params will be used local redis
             connection_info = self.config["cache"].get("connection", {})
         self.client = walrus.Database(**connection_info)
+        self.memory = self._get_memory_tier(category)
 
     def clear_old_cache(self, key_added):
 
@@ -200,50 +307,62 @@ class RedisCache(BaseCache):
         # buffer to delete, to not run delete on every adding
         buffer_size = 5
 
-        cur_count = self.client.hlen(self.category)
+        cur_count = self.client.zcard(self.access_key)
 
-        # remove oldest
+        # remove least recently used
         if cur_count > self.max_size + buffer_size:
-            # 5 is buffer to delete, to not run delete on every adding
-
-            keys = self.client.hgetall(self.category)
-            # to list
-            keys = list(keys.items())
-            # sort by timestamp
-            keys.sort(key=lambda x: x[1])
-
-            for key, _ in keys[:cur_count - self.max_size]:
+            keys = self.client.zrange(self.access_key, 0, cur_count - self.max_size - 1)
+            for key in keys:
                 self.delete_key(key)
 
     def redis_key(self, name):
         return f'{self.category}_{name}'
 
-    def set(self, name, value):
+    def _migrate_access_hash(self):
+        # previous versions kept access times in hash '{category}': key -> time in ms.
+        #   Its keys are moved to sorted set, to be removed from cache by max_size
+        with _redis_migration_lock:
+            if self.category in _redis_migrated_categories:
+                return
+            if self.client.type(self.category) == b'hash':
+                access_times = self.client.hgetall(self.category)
+                if len(access_times) > 0:
+                    self.client.zadd(self.access_key, {
+                        key: int(value) / 1000
+                        for key, value in access_times.items()
+                    })
+                self.client.delete(self.category)
+            _redis_migrated_categories.add(self.category)
+
+    def _touch(self, key):
+        self._migrate_access_hash()
+        self.client.zadd(self.access_key, {key: time.time()})
+
+    def _set(self, name, value):
         key = self.redis_key(name)
-        value = self.serialize(value)
 
         self.client.set(key, value)
-        # using key with category name to store all keys with modify time
-        self.client.hset(self.category, key, int(time.time() * 1000))
+        self._touch(key)
 
         self.clear_old_cache(key)
 
-    def get(self, name):
+    def _get(self, name):
         key = self.redis_key(name)
         value = self.client.get(key)
         if value is None:
             # no value in cache
             return None
-        return self.deserialize(value)
+        self._touch(key)
+        return value
 
-    def delete(self, name):
+    def _delete(self, name):
         key = self.redis_key(name)
 
         self.delete_key(key)
 
     def delete_key(self, key):
         self.client.delete(key)
-        self.client.hdel(self.category, key)
+        self.client.zrem(self.access_key, key)
 
 
 class NoCache:
@@ -119,6 +119,44 @@ class Config():
             },
             "cache": {
                 "type": "local"
+            },
+            "map_reduce": {
+                "batch_size": 100,
+                "max_workers": 1
+            },
+            "model_cache": {
+                "enabled": True,
+                "max_size_mb": 1024
+            },
+            "ml_workers_pool": {
+                "size": 2,
+                "acquire_timeout": 300
+            },
+            "query_cache": {
+                "enabled": False,
+                "ttl": 60,
+                "max_entries": 1000,
+                "integrations": {}
+            },
+            "information_schema": {
+                "max_workers": 8,
+                "timeout": 10,
+                "ttl": 0,
+                "integrations": {}
+            },
+            "handlers_pool": {
+                "enabled": True,
+                "min_size": 0,
+                "max_size": 5,
+                "idle_timeout": 300,
+                "health_check_interval": 30
+            },
+            "metadata_catalog": {
+                "enabled": True,
+                "check_interval": 1
+            },
+            "bulk_insert": {
+                "batch_size": 10000
             }
         }
 
@@ -25,6 +25,35 @@ class FileHandlerTest(unittest.TestCase):
             assert list(df.columns) == ["hi", "bye"]
             assert df.shape == (2, 2)
 
+    def test_handle_csv_clean_rows(self):
+        with TemporaryDirectory() as tmpdir:
+            file = f"{tmpdir}/some.csv"
+            with open(f"{file}", "w") as file_obj:
+                file_obj.write("a,b,c\n1,x,NA\nNA,nan,2\n3, ,\n")
+            (df, _) = FileHandler._handle_source(file)
+            assert list(df.columns) == ["a", "b", "c"]
+            assert df.a.dtype == "float64"
+            assert list(df.b) == ["x", None, None]
+            assert df.c.isna().sum() == 2
+
+            (df, _) = FileHandler._handle_source(file, clean_rows=False)
+            assert df.b[2] == " "
+
+    def test_iter_csv_chunks(self):
+        with TemporaryDirectory() as tmpdir:
+            file = f"{tmpdir}/some.csv"
+            with open(f"{file}", "w") as file_obj:
+                file_obj.write("a;b\n" + "".join(f"{i};x{i}\n" for i in range(25)))
+            progress = []
+            chunks = list(FileHandler._iter_source(
+                file,
+                chunk_size=10,
+                progress_callback=lambda read, total: progress.append((read, total))
+            ))
+            assert [len(df) for df in chunks] == [10, 10, 5]
+            assert list(chunks[0].columns) == ["a", "b"]
+            assert progress[-1][0] == progress[-1][1]
+
 
 if __name__ == "__main__":
     unittest.main()
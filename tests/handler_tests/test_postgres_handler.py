@@ -111,6 +111,22 @@ class TestPostgresHandler:
         want_rows = limit
         assert got_rows == want_rows, f"expected to have {want_rows} rows in response but got: {got_rows}"
 
+    def test_native_query_stream(self, handler):
+        query = "SELECT * FROM rentals LIMIT 25"
+        batches = list(handler.native_query_stream(query, batch_size=10))
+        got_rows = [len(df) for df in batches]
+        assert got_rows == [10, 10, 5], f"expected to get batches of 10 rows but got: {got_rows}"
+        assert "rental_price" in batches[0].columns
+
+    def test_native_query_stream_stopped(self, handler):
+        from psycopg.pq import TransactionStatus
+        handler.connect()
+        stream = handler.native_query_stream("SELECT * FROM rentals LIMIT 25", batch_size=10)
+        next(stream)
+        stream.close()
+        status = handler.connection.info.transaction_status
+        assert status == TransactionStatus.IDLE, f"expected transaction to be closed but got: {status}"
+
     def check_valid_response(self, res):
         if res.resp_type == RESPONSE_TYPE.TABLE:
             assert res.data_frame is not None, "expected to have some data, but got None"
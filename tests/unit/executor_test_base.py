@@ -260,6 +260,14 @@ class BaseExecutorTest(BaseUnitTest):
 
         mock_handler().query.side_effect = query_f
 
+        # default implementation: batches are sent as INSERT queries
+        from mindsdb.integrations.libs.base import BaseHandler
+
+        def bulk_insert_f(table_name, df, batch_size):
+            return BaseHandler.bulk_insert(mock_handler(), table_name, df, batch_size)
+
+        mock_handler().bulk_insert.side_effect = bulk_insert_f
+
     def set_project(self, project):
         r = self.db.Project.query.filter_by(name=project['name']).first()
         if r is not None:
@@ -36,11 +36,51 @@ class TestCashe(unittest.TestCase):
             warnings.warn(f'redis is not available: {e}')
             print(traceback.format_exc())
 
+    def test_redis_access_hash(self):
+        cache = RedisCache('predict_migrate', max_size=2)
+        try:
+            # access times of previous version
+            cache.client.delete(cache.access_key)
+            cache.client.hset('predict_migrate', 'predict_migrate_old', int(time.time() * 1000))
+        except redis.ConnectionError as e:
+            warnings.warn(f'redis is not available: {e}')
+            return
+
+        cache.set('x', 1)
+        assert cache.client.exists('predict_migrate') == 0
+        assert cache.client.zscore(cache.access_key, 'predict_migrate_old') is not None
+
     def test_file(self):
         cache = FileCache('predict', max_size=2)
 
         self.cache_test(cache)
 
+    def test_memory_tier(self):
+        cache = FileCache('predict_memory', max_size=2)
+
+        df = pd.DataFrame([
+            [1, 1.2, 'string', dt.datetime.now()],
+            [2, 3.2, None, dt.datetime(2011, 12, 30)],
+        ], columns=['a', 'b', 'c', 'd'])
+
+        cache.set('df', df)
+
+        # simple dataframe is stored in parquet
+        with open(cache.file_path('df'), 'rb') as fd:
+            assert fd.read(4) == b'PAR1'
+
+        # value is kept in memory
+        cache.delete_file(cache.file_path('df'))
+        df2 = cache.get('df')
+        assert dataframe_checksum(df) == dataframe_checksum(df2)
+
+        # least recently used is removed
+        cache.set('x', 1)
+        cache.get('df')
+        cache.set('y', 2)
+        assert cache.memory.get('x') is None
+        assert cache.memory.get('df') is not None
+
     def cache_test(self, cache):
 
         # test save
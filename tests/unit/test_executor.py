@@ -33,6 +33,228 @@ class Test(BaseExecutorMockPredictor):
         # check sql in query method
         assert mock_handler().query.call_args[0][0].to_string() == 'SELECT * FROM tasks'
 
+    @patch('mindsdb.api.mysql.mysql_proxy.utilities.query_cache.get_query_cache_config')
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_query_cache(self, mock_handler, mock_cache_config):
+        from mindsdb.api.mysql.mysql_proxy.utilities.query_cache import plan_cache, step_cache
+        mock_cache_config.return_value = {'enabled': True, 'ttl': 60}
+        plan_cache.clear()
+        step_cache.clear()
+
+        data = [[1, 'x'], [2, 'y']]
+        df = pd.DataFrame(data, columns=['a', 'b'])
+        self.set_handler(mock_handler, name='pg', tables={'tasks': df})
+
+        sql = 'select * from pg.tasks where a = 1'
+        for _ in range(2):
+            ret = self.command_executor.execute_command(parse_sql(sql))
+            assert ret.error_code is None
+            assert ret.data == [[1, 'x']]
+        assert mock_handler().query.call_count == 1
+
+        # data in integration is changed: cache is invalidated
+        ret = self.command_executor.execute_command(parse_sql(
+            'insert into pg.table1 (select * from pg.tasks)', dialect='mindsdb'
+        ))
+        assert ret.error_code is None
+        call_count = mock_handler().query.call_count
+
+        ret = self.command_executor.execute_command(parse_sql(sql))
+        assert ret.data == [[1, 'x']]
+        assert mock_handler().query.call_count == call_count + 1
+
+        ret = self.command_executor.execute_command(parse_sql(
+            "select * from information_schema.query_cache where name = 'plan'"
+        ))
+        ret_df = self.ret_to_df(ret)
+        assert ret_df['HITS'][0] == 1
+        assert ret_df['INVALIDATIONS'][0] == 1
+
+    @patch('mindsdb.api.mysql.mysql_proxy.datahub.datanodes.information_schema_datanode.get_schema_config')
+    @patch('mindsdb.integrations.handlers.mysql_handler.Handler')
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_information_schema_tables(self, mock_handler, mock_mysql_handler, mock_schema_config):
+        from mindsdb.api.mysql.mysql_proxy.utilities.query_cache import schema_cache
+        mock_schema_config.return_value = {'max_workers': 4, 'timeout': 0.5, 'ttl': 60}
+        schema_cache.clear()
+
+        df = pd.DataFrame([[1, 'x']], columns=['a', 'b'])
+        self.set_handler(mock_handler, name='pg', tables={'tasks': df})
+        self.set_handler(mock_mysql_handler, name='my', tables={'tasks': df}, engine='mysql')
+        # integration is not responding
+        mock_mysql_handler().get_tables.side_effect = lambda: time.sleep(3)
+
+        sql = 'select table_schema, table_name from information_schema.tables'
+        for _ in range(2):
+            started_at = time.time()
+            ret = self.command_executor.execute_command(parse_sql(sql))
+            assert ret.error_code is None
+            assert time.time() - started_at < 3
+
+            # partial result: without tables of 'my'
+            schemas = set(row[0] for row in ret.data)
+            assert 'pg' in schemas
+            assert 'my' not in schemas
+        # list of tables of 'pg' is cached
+        assert mock_handler().get_tables.call_count == 1
+
+        # table is created through mindsdb: cache is invalidated
+        ret = self.command_executor.execute_command(parse_sql(
+            'create table pg.table2 (select * from pg.tasks)', dialect='mindsdb'
+        ))
+        assert ret.error_code is None
+
+        self.command_executor.execute_command(parse_sql(sql))
+        assert mock_handler().get_tables.call_count == 2
+
+    def test_handlers_pool_threads(self):
+        import sqlite3
+        import threading
+        from mindsdb.utilities.context import context as ctx
+        from mindsdb.interfaces.database.handlers_pool import handlers_pool
+
+        db_file = tempfile.mkstemp(prefix='mindsdb_sqlite_')[1]
+        con = sqlite3.connect(db_file)
+        con.execute('create table tasks (a integer)')
+        con.execute('insert into tasks values (1)')
+        con.commit()
+        con.close()
+
+        ret = self.command_executor.execute_command(parse_sql(
+            f"create database sq with engine='sqlite', parameters={{'db_file': '{db_file}'}}", dialect='mindsdb'
+        ))
+        assert ret.error_code is None
+
+        # handler is released to the pool when query is done, even if datanode is still referenced
+        from mindsdb.api.mysql.mysql_proxy.datahub.datanodes.information_schema_datanode import (
+            InformationSchemaDataNode
+        )
+        integration_controller = self.command_executor.session.integration_controller
+        datanodes = []
+        get_datanode = InformationSchemaDataNode.get
+
+        def get_datanode_f(datahub, name):
+            datanode = get_datanode(datahub, name)
+            datanodes.append(datanode)
+            return datanode
+
+        with patch.object(InformationSchemaDataNode, 'get', get_datanode_f), \
+                patch.object(integration_controller, 'release_handler', wraps=integration_controller.release_handler) as release:
+            ret = self.command_executor.execute_command(parse_sql('select * from sq.tasks'))
+            assert ret.data == [[1]]
+            assert len(datanodes) > 0
+            assert release.call_count == 1
+
+        # sqlite connection can't be used from other thread: it is not reused
+        ctx_dump = ctx.dump()
+        results = []
+
+        def worker():
+            ctx.load(ctx_dump)
+            handler = self.command_executor.session.integration_controller.get_handler('sq', reuse=True)
+            try:
+                results.append(handler.native_query('select * from tasks').data_frame['a'].tolist())
+            finally:
+                self.command_executor.session.integration_controller.release_handler(handler)
+                self.db.session.remove()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        assert results == [[1]]
+
+        # handlers which are not borrowed from the pool are not connected
+        handler = self.command_executor.session.integration_controller.get_handler('sq')
+        assert handler.is_connected is False
+        handlers_pool.clear()
+
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_integers_with_nulls(self, mock_handler):
+        from mindsdb.api.mysql.mysql_proxy.classes.sql_query import ResultSet, Column
+
+        big_value = 10 ** 17 + 1
+
+        result = ResultSet()
+        result.add_column(Column(name='a'))
+        result.add_records([{'a': 1}, {'a': None}])
+        result.add_record_raw([big_value])
+        assert result.get_records_raw() == [[1], [None], [big_value]]
+
+        result = ResultSet(length=2)
+        result.add_column(Column(name='a'), values=[big_value, None])
+        assert result.get_records_raw() == [[big_value], [None]]
+        assert isinstance(result.get_records_raw()[0][0], int)
+
+        df = pd.DataFrame([[1, 'x'], [None, 'y']], columns=['a', 'b'], dtype=object)
+        self.set_handler(mock_handler, name='pg', tables={'tasks': df})
+
+        ret = self.command_executor.execute_command(parse_sql(
+            'select a from pg.tasks union all select a from pg.tasks', dialect='mindsdb'
+        ))
+        assert ret.error_code is None
+        assert ret.data == [[1], [None], [1], [None]]
+        assert isinstance(ret.data[0][0], int)
+
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_union_unhashable(self, mock_handler):
+        from mindsdb.api.mysql.mysql_proxy.classes.sql_query import union_df
+
+        # unhashable cells and mixed types: 1 and '1' are different values
+        left_df = pd.DataFrame({0: [1, '1', None, [1, 2]], 1: [{'a': 1}, {'a': 1}, None, 'x']})
+        right_df = pd.DataFrame({'b': [1, [1, 2], 2.5], 'c': [{'a': 1}, 'x', None]})
+
+        assert union_df(left_df, right_df).values.tolist() == [
+            [1, {'a': 1}], ['1', {'a': 1}], [None, None], [[1, 2], 'x'], [2.5, None]
+        ]
+        df = union_df(left_df, right_df, unique=False)
+        assert list(df.columns) == [0, 1]
+        assert len(df) == 7
+
+        tables = {
+            'tasks': pd.DataFrame([[1, 'x'], [2, 'y']], columns=['a', 'b']),
+            'tasks2': pd.DataFrame([[2, 'y'], [3, 'y']], columns=['c', 'd']),
+        }
+        self.set_handler(mock_handler, name='pg', tables=tables)
+
+        ret = self.command_executor.execute_command(parse_sql(
+            'select a, b from pg.tasks union select c, d from pg.tasks2', dialect='mindsdb'
+        ))
+        assert [x.alias for x in ret.columns] == ['a', 'b']
+        assert ret.data == [[1, 'x'], [2, 'y'], [3, 'y']]
+
+        ret = self.command_executor.execute_command(parse_sql(
+            'select a, b from pg.tasks union all select c, d from pg.tasks2', dialect='mindsdb'
+        ))
+        assert ret.data == [[1, 'x'], [2, 'y'], [2, 'y'], [3, 'y']]
+
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_arrow_response(self, mock_handler):
+        import pyarrow as pa
+        from mindsdb.integrations.libs.response import HandlerResponse, RESPONSE_TYPE
+
+        self.set_handler(mock_handler, name='pg', tables={})
+
+        # handler returns data in arrow format
+        table = pa.table({
+            'a': pa.array([1, None], type=pa.int64()),
+            'b': pa.array(['x', None]),
+            'c': pa.array([dt.datetime(2020, 1, 2, 3, 4, 5), None], type=pa.timestamp('us'))
+        })
+        mock_handler().query.side_effect = lambda query: HandlerResponse(RESPONSE_TYPE.TABLE, table)
+
+        ret = self.command_executor.execute_command(parse_sql('select * from pg.tasks', dialect='mindsdb'))
+        assert ret.error_code is None
+        assert [x.name for x in ret.columns] == ['a', 'b', 'c']
+        assert ret.data[0][:2] == [1, 'x']
+        assert pd.Timestamp(ret.data[0][2]) == pd.Timestamp(2020, 1, 2, 3, 4, 5)
+        assert ret.data[1][:2] == [None, None]
+        assert pd.isna(ret.data[1][2])
+
+        # table is not changed by conversion
+        response = HandlerResponse(RESPONSE_TYPE.TABLE, table)
+        assert list(response.data_frame['b']) == ['x', None]
+        assert table.column('a').to_pylist() == [1, None]
+
     def test_predictor_1_row(self):
         predicted_value = 3.14
         predictor = {
@@ -489,6 +711,32 @@ class Test(BaseExecutorMockPredictor):
         assert ret_df.shape[0] == 3
         assert ret_df.t.min() == 2024.
 
+    def test_file_select(self):
+        df = pd.DataFrame([
+            {'a': 1, 'b': 'x'},
+            {'a': 2, 'b': 'NA'},
+            {'a': 3, 'b': 'z'},
+        ])
+        file_path = tempfile.mkstemp(prefix='file_')[1]
+        df.to_csv(file_path, index=False)
+
+        self.file_controller.save_file('ab', file_path, 'ab')
+
+        # file is stored in columnar format
+        file_meta = self.file_controller.get_file_meta('ab')
+        assert file_meta['metadata']['format'] == 'parquet'
+        assert [x['name'] for x in file_meta['metadata']['schema']] == ['a', 'b']
+
+        ret = self.command_executor.execute_command(parse_sql('''
+                select b from files.ab where a > 1
+            ''', dialect='mindsdb'))
+        assert ret.error_code is None
+
+        ret_df = self.ret_to_df(ret)
+        assert list(ret_df.columns) == ['b']
+        # null tokens were cleaned on upload
+        assert list(ret_df.b) == [None, 'z']
+
     @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
     def test_drop_database(self, mock_handler):
         self.set_handler(mock_handler, name='pg', tables={})
@@ -617,11 +865,76 @@ class TestComplexQueries(BaseExecutorMockPredictor):
             parse_sql(sql, dialect='mindsdb'))
         assert ret.error_code is None
 
-        # 1 select and 2 updates
-        assert mock_handler().query.call_count == 3
+        # 1 select and 1 update: rows with the same values are updated by one query
+        assert mock_handler().query.call_count == 2
 
         # second is update
-        assert mock_handler().query.call_args_list[1][0][0].to_string() == "update table2 set a1=1, c1='ccc' where (a1 = 1) AND (b1 = 'ccc')"
+        assert mock_handler().query.call_args_list[1][0][0].to_string() == (
+            "update table2 set a1=1, c1='ccc' where ((a1 = 1) AND (b1 = 'aaa')) OR ((a1 = 1) AND (b1 = 'ccc'))"
+        )
+
+    def test_update_batches_duplicate_key(self):
+        from mindsdb_sql.parser.ast import Update, Identifier, Constant, BinaryOperation
+        from mindsdb.api.mysql.mysql_proxy.classes.sql_query import make_update_batches
+
+        value, key = Constant(None), Constant(None)
+        update_query = Update(
+            table=Identifier('t'),
+            update_columns={'v': value},
+            where=BinaryOperation(op='=', args=[Identifier('k'), key])
+        )
+        records = [
+            {'v': 'A', 'k': 1},
+            {'v': 'B', 'k': 1},
+            {'v': 'A', 'k': 2},
+            {'v': 'A', 'k': 3},
+        ]
+        queries = make_update_batches(update_query, [['v', value], ['k', key]], records)
+
+        # the last row with the same key is applied, as in update row by row
+        assert [x.to_string() for x in queries] == [
+            "update t set v='B' where k = 1",
+            "update t set v='A' where k IN (2, 3)",
+        ]
+
+    def test_batch_query(self):
+        from mindsdb.api.mysql.mysql_proxy.classes.sql_query import (
+            get_batch_query, split_batch_result, ResultSet, Column
+        )
+
+        var_groups = [{'x': 1}, {'x': 2}, {'x': 1}]
+
+        query, var_name = get_batch_query(
+            parse_sql("select * from t where a = '$var[x]' and b > 1"), var_groups
+        )
+        assert var_name == 'x'
+        assert query.to_string() == 'SELECT *, a AS __mindsdb_batch_key FROM t WHERE (a IN (1, 2)) AND (b > 1)'
+
+        # results of these can't be combined
+        for sql in (
+            "select * from t where g > '$var[x]'",
+            "select * from t where a = '$var[x]' or b > 1",
+            "select distinct * from t where a = '$var[x]'",
+            "select * from t where a = '$var[x]' order by b",
+            "select * from t where a = '$var[x]' limit 1",
+        ):
+            assert get_batch_query(parse_sql(sql), var_groups) is None
+
+        # rows are grouped by values, repeated values get their rows again
+        data = ResultSet()
+        for name in ('a', 'c', '__mindsdb_batch_key'):
+            data.add_column(Column(name))
+        data.add_raw_values([[2, 'x', 2], [1, 'y', 1], [1, 'z', 1]])
+        data = split_batch_result(data, 'x', var_groups)
+        assert data.get_column_names() == ['a', 'c']
+        assert data.get_records_raw() == [[1, 'y'], [1, 'z'], [2, 'x'], [1, 'y'], [1, 'z']]
+
+        # row doesn't match any value
+        data = ResultSet()
+        for name in ('a', '__mindsdb_batch_key'):
+            data.add_column(Column(name))
+        data.add_raw_values([[3, 3]])
+        assert split_batch_result(data, 'x', var_groups) is None
 
     @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
     def test_create_table(self, mock_handler):
@@ -662,6 +975,26 @@ class TestComplexQueries(BaseExecutorMockPredictor):
 
         assert len(calls) == 3
 
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_create_table_insert_error(self, mock_handler):
+        from mindsdb_sql.parser.ast import CreateTable, DropTables
+        from mindsdb.integrations.libs.response import HandlerResponse, RESPONSE_TYPE
+        self.set_handler(mock_handler, name='pg', tables={'tasks': self.df})
+        mock_handler().bulk_insert.side_effect = lambda *args, **kwargs: HandlerResponse(
+            RESPONSE_TYPE.ERROR, error_message='insert error'
+        )
+
+        with pytest.raises(Exception):
+            self.command_executor.execute_command(parse_sql(
+                'create table pg.table1 (select a, b from pg.tasks)', dialect='mindsdb'
+            ))
+
+        # created table is dropped
+        calls = mock_handler().query.call_args_list
+        assert isinstance(calls[-2][0][0], CreateTable)
+        assert isinstance(calls[-1][0][0], DropTables)
+        assert calls[-1][0][0].tables[0].parts == ['table1']
+
     @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
     def test_create_insert(self, mock_handler):
         self.set_handler(mock_handler, name='pg', tables={'tasks': self.df})
@@ -905,6 +1238,96 @@ class TestWithNativeQuery(BaseExecutorMockPredictor):
             dialect='mindsdb'))
         assert ret.error_code is None
 
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_view_filter_pushdown(self, mock_handler):
+        data = [[3, 'y'], [1, 'y'], [5, 'x']]
+        df = pd.DataFrame(data, columns=['a', 'b'])
+        self.set_handler(mock_handler, name='pg', tables={'tasks': df})
+
+        ret = self.command_executor.execute_command(parse_sql(
+            "create view mindsdb.vtasks (select a, b from pg.tasks where b = 'y')",
+            dialect='mindsdb')
+        )
+        assert ret.error_code is None
+
+        mock_handler.reset_mock()
+        ret = self.command_executor.execute_command(parse_sql(
+            'select a from mindsdb.vtasks where a > 2 limit 10',
+            dialect='mindsdb')
+        )
+        assert ret.error_code is None
+        assert ret.data == [[3]]
+
+        # filter and limit are sent to integration
+        query = mock_handler().query.call_args[0][0]
+        assert query.where is not None and 'a > 2' in query.where.to_string()
+        assert query.limit.value == 10
+
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_materialized_view(self, mock_handler):
+        from mindsdb.api.mysql.mysql_proxy.utilities.materialized_views import parse_materialized_view_statement
+
+        tables = {'tasks': pd.DataFrame([[1, 'x'], [2, 'y']], columns=['a', 'b'])}
+        self.set_handler(mock_handler, name='pg', tables=tables)
+
+        ret = self.command_executor.execute_command(parse_materialized_view_statement(
+            "create materialized view mindsdb.mtasks (select * from pg.tasks) using key_column = 'a'"
+        ))
+        assert ret.error_code is None
+
+        # data is read from view's storage
+        tables['tasks'] = pd.DataFrame([[1, 'x'], [2, 'y'], [3, 'z']], columns=['a', 'b'])
+        ret = self.command_executor.execute_command(parse_sql(
+            'select * from mindsdb.mtasks order by a', dialect='mindsdb'
+        ))
+        assert ret.error_code is None
+        assert ret.data == [[1, 'x'], [2, 'y']]
+
+        # incremental refresh loads only new rows
+        mock_handler.reset_mock()
+        ret = self.command_executor.execute_command(parse_materialized_view_statement(
+            'refresh materialized view mindsdb.mtasks'
+        ))
+        assert ret.error_code is None
+        assert 'a > 2' in mock_handler().query.call_args[0][0].where.to_string()
+
+        ret = self.command_executor.execute_command(parse_sql(
+            'select * from mindsdb.mtasks order by a', dialect='mindsdb'
+        ))
+        assert ret.data == [[1, 'x'], [2, 'y'], [3, 'z']]
+
+        ret = self.command_executor.execute_command(parse_sql(
+            'select table_name, status, rows, key_value from information_schema.materialized_views',
+            dialect='mindsdb'
+        ))
+        assert ret.data == [['mtasks', 'complete', 3, 3]]
+
+        # view is refreshing by another query: concurrent refresh is not started
+        from mindsdb.interfaces.database.views import ViewController
+        view_controller = ViewController()
+        view_id = view_controller.get(name='mtasks', project_name='mindsdb')['id']
+        assert view_controller.start_materialized_refresh(view_id) is not None
+        assert view_controller.start_materialized_refresh(view_id) is None
+
+        mock_handler.reset_mock()
+        with pytest.raises(Exception):
+            self.command_executor.execute_command(parse_materialized_view_statement(
+                'refresh materialized view mindsdb.mtasks'
+            ))
+        assert mock_handler().query.call_count == 0
+
+        # full refresh writes new data before files of older refreshes are removed
+        from mindsdb.interfaces.database.views import MaterializedViewStorage
+        storage = MaterializedViewStorage(view_id)
+        for i in range(3):
+            storage.write(pd.DataFrame([[i, 'x']], columns=['a', 'b']))
+            assert storage.get_dataset().to_table().to_pydict() == {'a': [i], 'b': ['x']}
+        # files of the previous refresh are kept for reads in progress
+        assert len(list(storage.file_storage.get_path('data').glob('*.parquet'))) == 2
+
+        ret = self.command_executor.execute_command(parse_sql('drop view mtasks', dialect='mindsdb'))
+        assert ret.error_code is None
+
     @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
     def test_use_predictor_with_view(self, mock_handler):
         # set integration data
@@ -0,0 +1,56 @@
+import unittest
+
+from mindsdb.interfaces.model.model_cache import ModelCache
+
+
+class TestModelCache(unittest.TestCase):
+
+    def test_lru(self):
+        cache = ModelCache(max_size=100, enabled=True)
+
+        cache.set((1, 1, 'a'), 'model1', size=40)
+        cache.set((2, 1, 'a'), 'model2', size=40)
+        assert cache.get((1, 1, 'a')) == 'model1'
+
+        # model2 is least recently used
+        cache.set((3, 1, 'a'), 'model3', size=40)
+        assert cache.get((2, 1, 'a')) is None
+        assert cache.get((1, 1, 'a')) == 'model1'
+        assert cache.get((3, 1, 'a')) == 'model3'
+
+        stats = cache.stats()
+        assert stats['hits'] == 3
+        assert stats['misses'] == 1
+        assert stats['evictions'] == 1
+        assert stats['size'] == 80
+
+    def test_invalidate(self):
+        cache = ModelCache(max_size=100, enabled=True)
+
+        cache.set((1, 1, 'a'), 'model1', size=10)
+        # predictor record was updated
+        cache.set((1, 1, 'b'), 'model1b', size=10)
+        assert cache.get((1, 1, 'a')) is None
+        assert cache.get((1, 1, 'b')) == 'model1b'
+
+        cache.invalidate(1)
+        assert cache.get((1, 1, 'b')) is None
+        assert cache.stats()['size'] == 0
+
+        # too big to be cached
+        cache.set((2, 1, 'a'), 'model2', size=1000)
+        assert cache.get((2, 1, 'a')) is None
+
+    def test_lock(self):
+        cache = ModelCache(max_size=100, enabled=True)
+
+        lock = cache.set((1, 1, 'a'), 'model1', size=10)
+        model, lock2 = cache.get_with_lock((1, 1, 'a'))
+        assert model == 'model1'
+        # the same lock for the same cached object
+        assert lock2 is lock
+
+        assert cache.get_with_lock((2, 1, 'a')) == (None, None)
+
+        # not cached: no lock
+        assert cache.set((2, 1, 'a'), 'model2', size=1000) is None
@@ -0,0 +1,47 @@
+import unittest
+import datetime as dt
+from decimal import Decimal
+
+from mindsdb.api.mysql.mysql_proxy.data_types.mysql_datum import Datum
+from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import NULL_VALUE
+from mindsdb.api.mysql.mysql_proxy.data_types.mysql_packets.resultset_row_package import (
+    encode_text_rows,
+    lenenc_prefix
+)
+
+
+def encode_row_by_datum(row):
+    # per value encoding, as ResultsetRowPacket did it before encode_text_rows
+    return b''.join(
+        NULL_VALUE if value is None else Datum('string<lenenc>', str(value)).toStringPacket()
+        for value in row
+    )
+
+
+class TestResultsetRowPackage(unittest.TestCase):
+
+    def test_encode_text_rows(self):
+        rows = [
+            [
+                None, 1.5, 0.1 + 0.2, float('nan'), dt.datetime(2020, 1, 2, 3, 4, 5, 6), dt.date(2020, 1, 2),
+                'a' * 250, 'é' * 200, 'x' * 70000, 10 ** 20, Decimal('1.10'), ''
+            ],
+            [
+                1, None, -1e300, True, None, None,
+                'b' * 251, 'c', 'y' * 300, 0, None, 'z'
+            ],
+        ]
+        encoded = encode_text_rows(rows)
+        assert len(encoded) == len(rows)
+        for row, body in zip(rows, encoded):
+            assert body == encode_row_by_datum(row)
+
+        assert encode_text_rows([]) == []
+        assert encode_text_rows([[], []]) == [b'', b'']
+
+    def test_lenenc_prefix(self):
+        assert lenenc_prefix(250) == b'\xfa'
+        assert lenenc_prefix(251) == b'\xfc\xfb\x00'
+        assert lenenc_prefix(1 << 16) == b'\xfd\x00\x00\x01'
+        # 0xfe marker and 8 bytes for values of 16 MB and more
+        assert lenenc_prefix(1 << 24) == b'\xfe' + (1 << 24).to_bytes(8, 'little')